@@ -0,0 +1,126 @@
+""" Benchmark measuring the memory and time that validating large buffers takes.
+
+It validates buffers of 1 GiB (bytes, bytearray, memoryview and, if NumPy is
+installed, a NumPy array) with the built-in buffer check, which inspects them
+through a memoryview, and with equivalent hand-written validators that copy
+them (slicing, `bytes(...)`), as validators of buffers often do. It reports
+the peak memory allocated during a call, as measured by tracemalloc, and the
+duration of a call.
+
+Usage:
+    python -m benchmarks.buffers
+    python -m benchmarks.buffers --size 104857600
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+from validargs.validargs import validated, Validator
+
+
+MAGIC = b'\x89VAL'
+
+GIB = 1 << 30
+
+
+def copying_validator(argument: Any) -> None:
+    """ A hand-written validator of the same rules as the built-in check, which copies the buffer """
+    payload = bytes(argument)
+    if len(payload) < len(MAGIC):
+        raise ValueError("Buffer too small")
+    if payload[:len(MAGIC)] != MAGIC:
+        raise ValueError("Wrong magic header")
+
+
+def make_buffers(size: int) -> Iterator[Tuple[str, Callable[[], Any]]]:
+    """ Yields the name of each kind of buffer and a function that constructs
+    one of the given size, starting with the magic header.
+    """
+    def make_bytearray() -> bytearray:
+        buffer = bytearray(size)
+        buffer[:len(MAGIC)] = MAGIC
+        return buffer
+
+    yield 'bytes', lambda: bytes(make_bytearray())
+    yield 'bytearray', make_bytearray
+    yield 'memoryview', lambda: memoryview(make_bytearray())
+
+    try:
+        import numpy
+    except ImportError:
+        return
+
+    def make_array() -> Any:
+        array = numpy.zeros(size, dtype=numpy.uint8)
+        array[:len(MAGIC)] = numpy.frombuffer(MAGIC, dtype=numpy.uint8)
+        return array
+
+    yield 'numpy', make_array
+
+
+def measure(function: Callable, buffer: Any, repeat: int) -> Tuple[int, float]:
+    """ Measures the peak memory allocated by a call, and the best duration of `repeat` calls.
+
+    Returns:
+        (peak, duration): The peak bytes allocated and the seconds per call
+    """
+    gc.collect()
+    tracemalloc.start()
+    function(buffer)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(buffer)
+        durations.append(time.perf_counter() - start)
+
+    return peak, min(durations)
+
+
+def run(size: int, repeat: int) -> Dict[str, Tuple[int, float]]:
+    """ Runs the benchmarks and prints their results.
+
+    Returns:
+        results (dict): The peak bytes allocated and the seconds per call,
+                        keyed by the name of the benchmark
+    """
+    validators = {
+        'builtin': Validator.buffer(min_nbytes=len(MAGIC), itemsize=1, contiguous='C', magic=MAGIC),
+        'copying': Validator(copying_validator),
+    }
+
+    results = {}
+    for buffer_name, make_buffer in make_buffers(size):
+        buffer = make_buffer()
+
+        for validator_name, validator in validators.items():
+            @validated(engine='codegen')
+            def function(payload: Any = validator) -> None:
+                pass
+
+            name = f"{buffer_name}/{validator_name}"
+            peak, duration = measure(function, buffer, repeat)
+            results[name] = (peak, duration)
+
+            print(f"{name:<30} {peak:>16,} bytes peak {duration * 1_000_000:>14,.1f} us/call")
+
+        del buffer
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=int, default=GIB, help='The size of each buffer in bytes')
+    parser.add_argument('--repeat', type=int, default=3, help='Calls per benchmark')
+    args = parser.parse_args()
+
+    run(args.size, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+""" Benchmark measuring the memory held by decorated functions.
+
+It decorates 10,000 generated functions, which share a few dozen validators,
+and reports the memory allocated per function, as measured by tracemalloc,
+for the undecorated functions and for each way of decorating them, along
+with the overhead of the decoration.
+
+Two workloads are measured:
+    - functions: module level functions with distinct names and signatures
+                 made of a pool of parameters
+    - methods: methods of many classes that share a few signatures, e.g.
+               the handlers of a web framework
+
+Usage:
+    python -m benchmarks.memory
+    python -m benchmarks.memory --count 50000
+"""
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+from validargs.validargs import validated, Validator
+
+
+VALIDATOR_COUNT = 30
+
+PARAMETERS_PER_FUNCTION = 5
+
+METHOD_NAMES = ('get', 'post', 'put', 'delete')
+
+
+def make_validators() -> Dict[str, Callable]:
+    """ Constructs the validator functions shared by the generated functions """
+    def make_validator(index: int) -> Callable:
+        def validator(argument: int) -> bool:
+            return argument != index
+        validator.__name__ = f"validator_{index}"
+        return validator
+
+    return {f"validator_{index}": make_validator(index) for index in range(VALIDATOR_COUNT)}
+
+
+def parameters_source(offset: int) -> List[str]:
+    """ Constructs the parameters of a generated function. Each one constructs
+    its own Validator, as a hand-written signature would.
+    """
+    return [
+        f"argument_{(offset + index) % VALIDATOR_COUNT}: int = "
+        f"Validator(validator_{(offset + index) % VALIDATOR_COUNT}, default_value=-1)"
+        for index in range(PARAMETERS_PER_FUNCTION)
+    ]
+
+
+def functions_sources(count: int) -> List[str]:
+    """ Generates the sources of module level functions with distinct names """
+    return [
+        f"def function_{index}({', '.join(parameters_source(index))}):\n    pass\n"
+        for index in range(count)
+    ]
+
+
+def methods_sources(count: int) -> List[str]:
+    """ Generates the sources of methods of many classes, which share a few signatures """
+    return [
+        f"class Handler_{index}:\n" + ''.join(
+            f"    def {name}(self, {', '.join(parameters_source(offset))}):\n        pass\n"
+            for offset, name in enumerate(METHOD_NAMES)
+        )
+        for index in range(count // len(METHOD_NAMES))
+    ]
+
+
+def generated_functions(namespace: Dict[str, Any]) -> List[Callable]:
+    """ Collects the functions and methods defined by the generated source """
+    functions = []
+    for value in namespace.values():
+        if isinstance(value, type) and value.__name__.startswith('Handler_'):
+            functions.extend(getattr(value, name) for name in METHOD_NAMES)
+        elif getattr(value, '__name__', '').startswith('function_'):
+            functions.append(value)
+    return functions
+
+
+def measure(sources: List[str], decorate: Callable[[Callable], Callable]) -> float:
+    """ Measures the memory allocated per function by defining and decorating them.
+
+    The sources are compiled in advance and separately, since tracemalloc
+    looks up the line number of every allocation in the code object that
+    makes it, which would be very slow for a single large one.
+
+    Returns:
+        bytes (float): The bytes allocated per function
+    """
+    codes = [compile(source, '<generated>', 'exec') for source in sources]
+    validators = make_validators()
+
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+
+    namespace = {'Validator': Validator, **validators}
+    for code in codes:
+        exec(code, namespace)
+    functions = generated_functions(namespace)
+    decorated = [decorate(function) for function in functions]
+    gc.collect()
+
+    allocated = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+
+    del decorated
+    return allocated / len(functions)
+
+
+def run(count: int) -> Dict[str, float]:
+    """ Runs the benchmarks and prints their results.
+
+    Returns:
+        results (dict): The bytes allocated per function, keyed by the name of the benchmark
+    """
+    decorators = {
+        'undecorated': lambda function: function,
+        'interpreted': validated,
+        'codegen': validated(engine='codegen'),
+        'lazy': validated(lazy=True),
+    }
+    workloads = {
+        'functions': functions_sources(count),
+        'methods': methods_sources(count),
+    }
+
+    results = {}
+    for workload, sources in workloads.items():
+        for name, decorate in decorators.items():
+            bytes_per_function = measure(sources, decorate)
+            results[f"{workload}/{name}"] = bytes_per_function
+
+            overhead = bytes_per_function - results[f"{workload}/undecorated"]
+            print(f"{workload + '/' + name:<30} {bytes_per_function:>10,.0f} bytes/function {overhead:>+10,.0f}")
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=10_000, help='The number of decorated functions')
+    args = parser.parse_args()
+
+    run(args.count)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+""" Benchmark suite measuring the calls per second of validated functions.
+
+It covers the signature shapes of the test suite (positional only, keyword only,
+mixed, with and without defaults) and generated signatures with 1 to 50
+parameters, comparing each engine against the undecorated function and,
+for the generated signatures, against hand-written validation.
+
+It also measures the decorations per second of the generated signatures,
+eager and lazy, which dominate the import time of modules with many
+decorated functions.
+
+Usage:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --save baseline.json
+    python -m benchmarks.suite --compare baseline.json --threshold 0.2
+"""
+import argparse
+import json
+import sys
+import timeit
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from validargs.validargs import validated, Validator
+from tests import test_keyword_only_args
+from tests import test_mixed_args
+from tests import test_positional_only_and_keyword_only_args
+from tests import test_positional_only_args
+from tests import validators
+
+
+ENGINES = ('interpreted', 'codegen')
+
+PARAMETER_COUNTS = (1, 2, 5, 10, 20, 50)
+
+
+def scenario_benchmarks() -> Iterator[Tuple[str, Callable, Callable]]:
+    """ Yields benchmarks for the signature shapes of the test suite.
+
+    For every testing function, one scenario where all the arguments are
+    provided and one where some of them are assigned their default values
+    are selected, among the ones that do not raise.
+
+    Yields:
+        (name, function, call): The name of the benchmark, the undecorated
+                                function and a function that constructs a
+                                statement calling a given function with the
+                                arguments of the scenario
+    """
+    for test_module in (
+        test_positional_only_args,
+        test_keyword_only_args,
+        test_positional_only_and_keyword_only_args,
+        test_mixed_args,
+    ):
+        shape = test_module.__name__.split('.')[-1][len('test_'):]
+
+        for test_class in vars(test_module).values():
+            selected = {}
+            for scenario in getattr(test_class, 'test_arguments_scenarios', []):
+                if scenario['raised_exception']:
+                    continue
+
+                testing_function = scenario['testing_function']
+                provided_count = len(scenario['positional_arguments']) + len(scenario['keyword_arguments'])
+                uses_defaults = provided_count < len(testing_function.__validargs_plan__.parameters)
+
+                selected.setdefault((testing_function.__wrapped__, uses_defaults), scenario)
+
+            for (function, uses_defaults), scenario in selected.items():
+                name = f"{shape}/{function.__name__}/{'defaults' if uses_defaults else 'provided'}"
+                yield name, function, scenario_call(scenario['positional_arguments'], scenario['keyword_arguments'])
+
+
+def scenario_call(positional_arguments: list, keyword_arguments: dict) -> Callable:
+    return lambda function: lambda: function(*positional_arguments, **keyword_arguments)
+
+
+def generated_function(parameter_count: int, handwritten: bool, builtin: bool = False) -> Callable:
+    """ Generates a function with the given number of integer parameters, the
+    first half of them positional or keyword and the rest keyword only.
+
+    Args:
+        parameter_count (int): The number of parameters
+        handwritten (bool): Whether the parameters are validated by hand-written
+                            checks in the body of the function, instead of Validators
+        builtin (bool): Whether the parameters are validated by built-in checks,
+                        instead of validator functions
+
+    Returns:
+        function (Callable): The generated (undecorated) function
+    """
+    names = [f"number_{index}" for index in range(parameter_count)]
+    keyword_only_index = (parameter_count + 1) // 2
+
+    validator = 'Validator.range(min=1)' if builtin else 'Validator(validators.positive_number)'
+    parameters = [
+        name if handwritten else f"{name}={validator}"
+        for name in names
+    ]
+    if keyword_only_index < parameter_count:
+        parameters.insert(keyword_only_index, '*')
+
+    body = [
+        f"    if type({name}) is not int or {name} <= 0: raise ValueError('Invalid {name}')"
+        for name in names
+    ] if handwritten else []
+
+    source = '\n'.join([
+        f"def generated({', '.join(parameters)}):",
+        *body,
+        "    pass",
+    ])
+
+    namespace = {'Validator': Validator, 'validators': validators}
+    exec(source, namespace)
+
+    return namespace['generated']
+
+
+def generated_benchmarks() -> Iterator[Tuple[str, Callable, Callable, Callable, Callable]]:
+    """ Yields benchmarks for generated signatures of increasing size.
+
+    Yields:
+        (name, function, handwritten_function, builtin_function, call): The name of
+                        the benchmark, the undecorated function, its hand-written
+                        equivalent, its equivalent with built-in checks and a function
+                        that constructs a statement calling a given function
+    """
+    for parameter_count in PARAMETER_COUNTS:
+        keyword_only_index = (parameter_count + 1) // 2
+        positional_arguments = list(range(1, keyword_only_index + 1))
+        keyword_arguments = {
+            f"number_{index}": index + 1
+            for index in range(keyword_only_index, parameter_count)
+        }
+
+        yield (
+            f"generated/{parameter_count}_parameters",
+            generated_function(parameter_count, handwritten=False),
+            generated_function(parameter_count, handwritten=True),
+            generated_function(parameter_count, handwritten=False, builtin=True),
+            scenario_call(positional_arguments, keyword_arguments),
+        )
+
+
+def measure(statement: Callable, number: int, repeat: int) -> float:
+    """ Measures the calls per second of a statement, as the best of `repeat` runs """
+    return number / min(timeit.repeat(statement, number=number, repeat=repeat))
+
+
+def run(number: int, repeat: int, name_filter: str = '') -> Dict[str, float]:
+    """ Runs the benchmarks and prints their results, along with how many
+    times slower each one is than the undecorated function.
+
+    Returns:
+        results (dict): The calls per second of each benchmark, keyed by its name
+    """
+    benchmarks: List[Tuple[str, Callable]] = []
+
+    for name, function, call in scenario_benchmarks():
+        benchmarks.append((f"{name}/undecorated", call(function)))
+        for engine in ENGINES:
+            benchmarks.append((f"{name}/{engine}", call(validated(function, engine=engine))))
+
+    for name, function, handwritten_function, builtin_function, call in generated_benchmarks():
+        benchmarks.append((f"{name}/undecorated", call(function)))
+        benchmarks.append((f"{name}/handwritten", call(handwritten_function)))
+        for engine in ENGINES:
+            benchmarks.append((f"{name}/{engine}", call(validated(function, engine=engine))))
+            benchmarks.append((f"{name}/{engine}_builtin", call(validated(builtin_function, engine=engine))))
+
+    for name, function, _, _, _ in generated_benchmarks():
+        name = name.replace('generated/', 'decoration/')
+        benchmarks.append((f"{name}/eager", lambda function=function: validated(function)))
+        benchmarks.append((f"{name}/lazy", lambda function=function: validated(function, lazy=True)))
+
+    results = {}
+    undecorated_results = {}
+    for name, statement in benchmarks:
+        if name_filter not in name:
+            continue
+
+        calls_per_second = measure(statement, number, repeat)
+        results[name] = calls_per_second
+
+        group, variant = name.rsplit('/', 1)
+        if variant == 'undecorated':
+            undecorated_results[group] = calls_per_second
+        slowdown = f"{undecorated_results[group] / calls_per_second:>8.2f}x" if group in undecorated_results else ''
+
+        print(f"{name:<90} {calls_per_second:>14,.0f} calls/s {slowdown}")
+
+    return results
+
+
+def compare(results: Dict[str, float], baseline: Dict[str, float], threshold: float) -> List[str]:
+    """ Compares the results against a baseline.
+
+    Returns:
+        regressions (list): The names of the benchmarks whose calls per second
+                            dropped by more than the threshold
+    """
+    return [
+        name
+        for name, calls_per_second in results.items()
+        if name in baseline and calls_per_second < baseline[name] * (1 - threshold)
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--number', type=int, default=10_000, help="Calls per run")
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per benchmark")
+    parser.add_argument('--filter', default='', help="Run only the benchmarks whose name contains this")
+    parser.add_argument('--save', metavar='PATH', help="Save the results as a JSON baseline")
+    parser.add_argument('--compare', metavar='PATH', help="Compare the results against a JSON baseline")
+    parser.add_argument('--threshold', type=float, default=0.1, help="Relative drop flagged as a regression")
+    args = parser.parse_args(argv)
+
+    results = run(args.number, args.repeat, args.filter)
+
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(results, file, indent=4, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+
+        regressions = compare(results, baseline, args.threshold)
+        for name in regressions:
+            print(f"REGRESSION: {name}: {results[name]:,.0f} calls/s, baseline {baseline[name]:,.0f} calls/s")
+
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
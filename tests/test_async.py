@@ -0,0 +1,190 @@
+import asyncio
+import inspect
+import time
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.exceptions import ValidationError
+from tests import validators
+
+
+async def slow_positive_number(argument: int) -> None:
+    await asyncio.sleep(0.05)
+    validators.positive_number(argument)
+
+
+async def slow_short_str(argument: str) -> None:
+    await asyncio.sleep(0.05)
+    validators.short_str(argument)
+
+
+class TestAsyncArguments:
+    """ Tests coroutine functions with synchronous and async validators """
+
+    async def arguments_with_async_validators(
+        boolean: bool = Validator(validators.boolean),
+        number_1: int = Validator(slow_positive_number, default_value=1),
+        /,
+        *,
+        string_1: str = Validator(slow_short_str),
+    ) -> dict:
+        return dict(boolean=boolean, number_1=number_1, string_1=string_1)
+
+    async def arguments_with_sync_validators(
+        boolean: bool = Validator(validators.boolean),
+        number_1: int = Validator(validators.positive_number, default_value=1),
+        /,
+        *,
+        string_1: str = Validator(validators.short_str),
+    ) -> dict:
+        return dict(boolean=boolean, number_1=number_1, string_1=string_1)
+
+    async def arguments_without_validators(
+        boolean: bool,
+        number_1: int = 1,
+        /,
+        *,
+        string_1: str,
+    ) -> dict:
+        return dict(boolean=boolean, number_1=number_1, string_1=string_1)
+
+    test_arguments_scenarios = [
+        dict(
+            testing_function=validated(arguments_with_async_validators),
+            description='Async validators with valid values',
+            positional_arguments=[False, 2],
+            keyword_arguments={'string_1': 'string 1'},
+            expected_received_arguments=dict(boolean=False, number_1=2, string_1='string 1'),
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=validated(arguments_with_async_validators),
+            description='Async validators with a missing argument that has a default value',
+            positional_arguments=[False],
+            keyword_arguments={'string_1': 'string 1'},
+            expected_received_arguments=dict(boolean=False, number_1=1, string_1='string 1'),
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=validated(arguments_with_async_validators),
+            description='Async validator with invalid value',
+            positional_arguments=[False, -2],
+            keyword_arguments={'string_1': 'string 1'},
+            expected_received_arguments=None,
+            raised_exception=ValidationError,
+        ),
+        dict(
+            testing_function=validated(arguments_with_async_validators),
+            description='Sync validator with invalid value in a function with async validators',
+            positional_arguments=[0, 2],
+            keyword_arguments={'string_1': 'string 1'},
+            expected_received_arguments=None,
+            raised_exception=ValidationError,
+        ),
+        dict(
+            testing_function=validated(arguments_with_async_validators),
+            description='Async validators with a missing argument that has no default value',
+            positional_arguments=[False, 2],
+            keyword_arguments={},
+            expected_received_arguments=None,
+            raised_exception=TypeError,
+        ),
+        dict(
+            testing_function=validated(arguments_with_sync_validators),
+            description='Sync validators with valid values',
+            positional_arguments=[False],
+            keyword_arguments={'string_1': 'string 1'},
+            expected_received_arguments=dict(boolean=False, number_1=1, string_1='string 1'),
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=validated(arguments_with_sync_validators, engine='codegen'),
+            description='Sync validators with valid values (codegen)',
+            positional_arguments=[False],
+            keyword_arguments={'string_1': 'string 1'},
+            expected_received_arguments=dict(boolean=False, number_1=1, string_1='string 1'),
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=validated(arguments_with_sync_validators, engine='codegen'),
+            description='Sync validators with invalid value (codegen)',
+            positional_arguments=[False, -1],
+            keyword_arguments={'string_1': 'string 1'},
+            expected_received_arguments=None,
+            raised_exception=ValidationError,
+        ),
+        dict(
+            testing_function=validated(arguments_without_validators),
+            description='No validators',
+            positional_arguments=[False],
+            keyword_arguments={'string_1': 'string 1'},
+            expected_received_arguments=dict(boolean=False, number_1=1, string_1='string 1'),
+            raised_exception=None,
+        ),
+    ]
+    def test_arguments(
+        self,
+        description: str,
+        testing_function: Callable,
+        positional_arguments: list,
+        keyword_arguments: dict,
+        expected_received_arguments: dict,
+        raised_exception: Exception,
+    ) -> None:
+        assert inspect.iscoroutinefunction(testing_function)
+
+        if raised_exception:
+            with pytest.raises(raised_exception):
+                asyncio.run(testing_function(*positional_arguments, **keyword_arguments))
+        else:
+            received_arguments = asyncio.run(testing_function(*positional_arguments, **keyword_arguments))
+            assert received_arguments == expected_received_arguments
+
+    test_concurrency_scenarios = [
+        dict(
+            testing_function=validated(arguments_with_async_validators),
+            description='Async validators of a single call run concurrently',
+            positional_arguments=[False, 2],
+            keyword_arguments={'string_1': 'string 1'},
+            max_duration=0.09,
+        ),
+    ]
+    def test_concurrency(
+        self,
+        description: str,
+        testing_function: Callable,
+        positional_arguments: list,
+        keyword_arguments: dict,
+        max_duration: float,
+    ) -> None:
+        start = time.perf_counter()
+        asyncio.run(testing_function(*positional_arguments, **keyword_arguments))
+
+        assert time.perf_counter() - start < max_duration
+
+
+class TestAsyncValidatorsInSyncFunction:
+    """ Tests that async validators are rejected for regular functions """
+
+    def arguments_with_async_validators(
+        number_1: int = Validator(slow_positive_number),
+    ) -> None:
+        pass
+
+    test_decoration_scenarios = [
+        dict(
+            testing_function=arguments_with_async_validators,
+            description='Async validators in a regular function fail at decoration time',
+            raised_exception=TypeError,
+        ),
+    ]
+    def test_decoration(
+        self,
+        description: str,
+        testing_function: Callable,
+        raised_exception: Exception,
+    ) -> None:
+        with pytest.raises(raised_exception):
+            validated(testing_function)
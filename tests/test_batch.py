@@ -0,0 +1,187 @@
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from tests import validators
+
+
+class TestValidateMany:
+    """ Tests the batch validation of many sets of arguments """
+
+    @validated
+    def arguments_with_validators(
+        boolean: bool = Validator(validators.boolean),
+        number_1: int = Validator(validators.positive_number, default_value=1),
+        /,
+        *,
+        string_1: str = Validator(validators.short_str, default_value='default string'),
+        string_2: str = 'not validated',
+    ) -> None:
+        pass
+
+    @validated(variadic={'args': Validator(validators.positive_number), 'kwargs': Validator(validators.positive_number)})
+    def variadic_arguments(
+        number_1: int = Validator(validators.positive_number),
+        *args: int,
+        **kwargs: int,
+    ) -> None:
+        pass
+
+    @validated
+    def unvalidated_arguments(
+        number_1: int,
+        number_2: int = Validator(validators.positive_number),
+        /,
+    ) -> None:
+        pass
+
+    test_validate_many_scenarios = [
+        dict(
+            testing_function=arguments_with_validators,
+            description='Rows of positional arguments',
+            rows=[(False, 1), (True, -1), (0, 1), (True,)],
+            columns=None,
+            max_errors=100,
+            expected_mask=[1, 0, 0, 1],
+            expected_errors=[(1, 'number_1'), (2, 'boolean')],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Rows of keyword arguments',
+            rows=[{'string_1': 'string 1'}, {'string_1': 'This is a very long string and will fail validation'}],
+            columns=None,
+            max_errors=100,
+            expected_mask=[0, 0],
+            expected_errors=[(0, 'boolean'), (1, 'boolean')],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Columns of arguments',
+            rows=None,
+            columns={'boolean': [False, True, False], 'string_1': ['string 1', 'string 2', 'This is a very long string and will fail validation']},
+            max_errors=100,
+            expected_mask=[1, 1, 0],
+            expected_errors=[(2, 'string_1')],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Missing column without a default value',
+            rows=None,
+            columns={'number_1': [1, 2]},
+            max_errors=100,
+            expected_mask=[0, 0],
+            expected_errors=[(0, 'boolean'), (1, 'boolean')],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Errors are capped',
+            rows=None,
+            columns={'boolean': [0, 1, 2, 3]},
+            max_errors=2,
+            expected_mask=[0, 0, 0, 0],
+            expected_errors=[(0, 'boolean'), (1, 'boolean')],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=variadic_arguments,
+            description='Rows of variadic arguments',
+            rows=[(1, 2, -3), {'number_1': 1, 'other': -1}, {'number_1': 1, 'other': 2}, (3,), {'other': 4}],
+            columns=None,
+            max_errors=100,
+            expected_mask=[0, 0, 1, 1, 0],
+            expected_errors=[(0, 'args'), (1, 'kwargs'), (4, 'number_1')],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Errors of the first failed rows are kept',
+            rows=[(True, -1), (0, 1), (True, -2), (1, 1)],
+            columns=None,
+            max_errors=2,
+            expected_mask=[0, 0, 0, 0],
+            expected_errors=[(0, 'number_1'), (1, 'boolean')],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=unvalidated_arguments,
+            description='Rows that cannot be bound to the signature',
+            rows=[(1, 2, 3, 4), {'unknown': 1}, {'number_2': 2}, (), (1, 2), (1, -2)],
+            columns=None,
+            max_errors=100,
+            expected_mask=[0, 0, 0, 0, 1, 0],
+            expected_errors=[(0, None), (1, None), (2, None), (3, 'number_1'), (5, 'number_2')],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=unvalidated_arguments,
+            description='Missing column of an argument without a validator',
+            rows=None,
+            columns={'number_2': [1, -1]},
+            max_errors=100,
+            expected_mask=[0, 0],
+            expected_errors=[(0, 'number_1'), (1, 'number_1')],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Columns of unequal length',
+            rows=None,
+            columns={'boolean': [True, False], 'number_1': [1]},
+            max_errors=100,
+            expected_mask=None,
+            expected_errors=None,
+            raised_exception=ValueError,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Columns of unknown arguments',
+            rows=None,
+            columns={'unknown': [True]},
+            max_errors=100,
+            expected_mask=None,
+            expected_errors=None,
+            raised_exception=TypeError,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Both rows and columns',
+            rows=[(True,)],
+            columns={'boolean': [True]},
+            max_errors=100,
+            expected_mask=None,
+            expected_errors=None,
+            raised_exception=TypeError,
+        ),
+    ]
+    def test_validate_many(
+        self,
+        description: str,
+        testing_function: Callable,
+        rows: list,
+        columns: dict,
+        max_errors: int,
+        expected_mask: list,
+        expected_errors: list,
+        raised_exception: Exception,
+    ) -> None:
+
+        if raised_exception:
+            with pytest.raises(raised_exception):
+                testing_function.validate_many(rows, columns=columns, max_errors=max_errors)
+        else:
+            result = testing_function.validate_many(rows, columns=columns, max_errors=max_errors)
+            assert list(result.mask) == expected_mask
+            assert [(error.index, error.argument) for error in result.errors] == expected_errors
+            assert result.failed_count == expected_mask.count(0)
+
+            # The rows pass and fail like the checks of the calls with the same arguments
+            for row, passed in zip(rows or [], expected_mask):
+                if isinstance(row, dict):
+                    assert testing_function.check(**row).passed is bool(passed)
+                else:
+                    assert testing_function.check(*row).passed is bool(passed)
@@ -0,0 +1,83 @@
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from tests import validators
+
+
+class TestValidateBulk:
+    """ Tests the bulk validation of many sets of arguments on worker processes """
+
+    @validated
+    def arguments_with_validators(
+        boolean: bool = Validator(validators.boolean),
+        number_1: int = Validator(validators.positive_number, default_value=1),
+        /,
+        *,
+        string_1: str = Validator(validators.short_str, default_value='default string'),
+    ) -> None:
+        pass
+
+    test_validate_bulk_scenarios = [
+        dict(
+            testing_function=arguments_with_validators,
+            description='Rows are sharded and merged in input order',
+            rows=[(False, 1), (True, -1), (0, 1), (True,), (True, 0), (False, 2), (1,)],
+            columns=None,
+            max_errors=100,
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Columns are sharded and merged in input order',
+            rows=None,
+            columns={'boolean': [False, True, 0, True, 1], 'number_1': [1, -1, 1, 2, 3]},
+            max_errors=100,
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='The first errors in input order are kept',
+            rows=[(0,), (True,), (1,), (2,), (3,), (True,), (4,)],
+            columns=None,
+            max_errors=3,
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='The errors of the first failed rows are kept across arguments',
+            rows=[(True, -1), (0, 1), (True, -2), (1, 1), (True, 2), (True, -3)],
+            columns=None,
+            max_errors=3,
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Columns of unequal length',
+            rows=None,
+            columns={'boolean': [True, False], 'number_1': [1]},
+            max_errors=100,
+            raised_exception=ValueError,
+        ),
+    ]
+    def test_validate_bulk(
+        self,
+        description: str,
+        testing_function: Callable,
+        rows: list,
+        columns: dict,
+        max_errors: int,
+        raised_exception: Exception,
+    ) -> None:
+
+        if raised_exception:
+            with pytest.raises(raised_exception):
+                testing_function.validate_bulk(rows, columns=columns, max_errors=max_errors, processes=2, chunksize=2)
+        else:
+            result = testing_function.validate_bulk(rows, columns=columns, max_errors=max_errors, processes=2, chunksize=2)
+            expected_result = testing_function.validate_many(rows, columns=columns, max_errors=max_errors)
+
+            assert result.mask == expected_result.mask
+            assert [(error.index, error.argument) for error in result.errors] == \
+                [(error.index, error.argument) for error in expected_result.errors]
@@ -0,0 +1,185 @@
+import time
+import traceback
+from typing import Callable, List
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.cache import ValidationCache
+from validargs.exceptions import ValidationError
+from tests import validators
+
+
+def cached_function(maxsize: int = 1024, ttl: float = None) -> Callable:
+    """ Creates a decorated function with a cached validator that records
+    every value it actually validates.
+    """
+    validated_values = []
+
+    def counting_validator(argument: int) -> None:
+        validated_values.append(argument)
+        validators.positive_number(argument)
+
+    @validated
+    def testing_function(
+        number_1: int = Validator(counting_validator, cache=ValidationCache(maxsize=maxsize, ttl=ttl)),
+    ) -> List[int]:
+        return validated_values
+
+    return testing_function
+
+
+class TestValidationCache:
+    """ Tests the memoization of validation outcomes """
+
+    test_cache_scenarios = [
+        dict(
+            testing_function=cached_function(),
+            description='Repeated valid values are validated once',
+            arguments=[1, 2, 1, 2, 1],
+            delay=0,
+            expected_validated_values=[1, 2],
+            expected_failures=0,
+            expected_cache_info=(3, 2, 0),
+        ),
+        dict(
+            testing_function=cached_function(),
+            description='Repeated invalid values are validated once and keep failing',
+            arguments=[-1, -1, -1],
+            delay=0,
+            expected_validated_values=[-1],
+            expected_failures=3,
+            expected_cache_info=(2, 1, 0),
+        ),
+        dict(
+            testing_function=cached_function(),
+            description='Equal values of different types are cached separately',
+            arguments=[1, True, 1, True],
+            delay=0,
+            expected_validated_values=[1, True],
+            expected_failures=2,
+            expected_cache_info=(2, 2, 0),
+        ),
+        dict(
+            testing_function=cached_function(),
+            description='Equal tuples of values of different types are cached separately',
+            arguments=[(1,), (True,), (1,), (True,)],
+            delay=0,
+            expected_validated_values=[(1,), (True,)],
+            expected_failures=4,
+            expected_cache_info=(2, 2, 0),
+        ),
+        dict(
+            testing_function=cached_function(),
+            description='Unhashable values are not cached',
+            arguments=[[1], [1]],
+            delay=0,
+            expected_validated_values=[[1], [1]],
+            expected_failures=2,
+            expected_cache_info=(0, 0, 0),
+        ),
+        dict(
+            testing_function=cached_function(maxsize=2),
+            description='Least recently used outcomes are evicted',
+            arguments=[1, 2, 1, 3, 2, 1],
+            delay=0,
+            expected_validated_values=[1, 2, 3, 2, 1],
+            expected_failures=0,
+            expected_cache_info=(1, 5, 3),
+        ),
+        dict(
+            testing_function=cached_function(ttl=0.01),
+            description='Expired outcomes are validated again',
+            arguments=[1, 1],
+            delay=0.02,
+            expected_validated_values=[1, 1],
+            expected_failures=0,
+            expected_cache_info=(0, 2, 0),
+        ),
+    ]
+    def test_cache(
+        self,
+        description: str,
+        testing_function: Callable,
+        arguments: list,
+        delay: float,
+        expected_validated_values: list,
+        expected_failures: int,
+        expected_cache_info: tuple,
+    ) -> None:
+        failures = 0
+        for argument in arguments:
+            try:
+                testing_function(argument)
+            except ValidationError:
+                failures += 1
+            time.sleep(delay)
+
+        cache = testing_function.__validargs_plan__.parameters[0].validator.cache
+        cache_info = cache.cache_info()
+
+        assert testing_function.__wrapped__() == expected_validated_values
+        assert failures == expected_failures
+        assert (cache_info.hits, cache_info.misses, cache_info.evictions) == expected_cache_info
+        assert cache_info.currsize <= cache_info.maxsize
+
+    test_cached_failures_scenarios = [
+        dict(
+            testing_function=cached_function(),
+            description='Cached failures raise a new exception on every call',
+            arguments=[-2, -2, -2],
+        ),
+    ]
+    def test_cached_failures(
+        self,
+        description: str,
+        testing_function: Callable,
+        arguments: list,
+    ) -> None:
+        exceptions = []
+        for argument in arguments:
+            with pytest.raises(ValidationError) as exc_info:
+                testing_function(argument)
+            exceptions.append(exc_info.value.__cause__)
+
+        assert testing_function.__wrapped__() == arguments[:1]
+        assert len({id(exception) for exception in exceptions}) == len(arguments)
+        assert all(
+            (type(exception), exception.args) == (type(exceptions[0]), exceptions[0].args)
+            for exception in exceptions
+        )
+
+        # Only the exception of the actual validation carries the frame of the validator
+        validator_frames = [
+            [frame.f_code.co_name for frame, _ in traceback.walk_tb(exception.__traceback__)].count('counting_validator')
+            for exception in exceptions
+        ]
+        assert validator_frames == [1] + [0] * (len(arguments) - 1)
+
+
+class TestValidationCacheConfiguration:
+    """ Tests invalid cache configurations """
+
+    async def async_validator(argument: int) -> None:
+        pass
+
+    test_configuration_scenarios = [
+        dict(
+            description='Async validators cannot be cached',
+            create_validator=lambda: Validator(TestValidationCacheConfiguration.async_validator, cache=ValidationCache()),
+            raised_exception=TypeError,
+        ),
+        dict(
+            description='The size of the cache must be positive',
+            create_validator=lambda: Validator(validators.positive_number, cache=ValidationCache(maxsize=0)),
+            raised_exception=ValueError,
+        ),
+    ]
+    def test_configuration(
+        self,
+        description: str,
+        create_validator: Callable,
+        raised_exception: Exception,
+    ) -> None:
+        with pytest.raises(raised_exception):
+            create_validator()
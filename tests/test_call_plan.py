@@ -0,0 +1,70 @@
+from inspect import Parameter
+from typing import Callable
+from unittest import mock
+
+from validargs.validargs import validated, Validator
+from tests import validators
+
+
+class TestCallPlan:
+    """ Tests the call plan that is computed at decoration time """
+
+    @validated
+    def mixed_arguments(
+        boolean: bool = Validator(validators.boolean),
+        number_1: int = 1,
+        /,
+        number_2: int = Validator(validators.positive_number, default_value=2),
+        *,
+        string_1: str,
+    ) -> dict:
+        return dict(boolean=boolean, number_1=number_1, number_2=number_2, string_1=string_1)
+
+    test_plan_scenarios = [
+        dict(
+            testing_function=mixed_arguments,
+            description='The plan resolves kinds, positions, validators and defaults',
+            expected_plan=[
+                ('boolean', Parameter.POSITIONAL_ONLY, 0, True, Parameter.empty),
+                ('number_1', Parameter.POSITIONAL_ONLY, 1, False, 1),
+                ('number_2', Parameter.POSITIONAL_OR_KEYWORD, 2, True, 2),
+                ('string_1', Parameter.KEYWORD_ONLY, None, False, Parameter.empty),
+            ],
+        ),
+    ]
+    def test_plan(
+        self,
+        description: str,
+        testing_function: Callable,
+        expected_plan: list,
+    ) -> None:
+        plan = testing_function.__validargs_plan__
+
+        assert plan.func_name == testing_function.__name__
+        assert [
+            (param.name, param.kind, param.position, param.validator is not None, param.default)
+            for param in plan.parameters
+        ] == expected_plan
+
+    test_signature_is_not_inspected_per_call_scenarios = [
+        dict(
+            testing_function=mixed_arguments,
+            description='Calling the decorated function does not inspect its signature',
+            positional_arguments=[False, 1],
+            keyword_arguments={'string_1': 'string 1'},
+            expected_received_arguments=dict(boolean=False, number_1=1, number_2=2, string_1='string 1'),
+        ),
+    ]
+    def test_signature_is_not_inspected_per_call(
+        self,
+        description: str,
+        testing_function: Callable,
+        positional_arguments: list,
+        keyword_arguments: dict,
+        expected_received_arguments: dict,
+    ) -> None:
+        with mock.patch('validargs.validargs.signature') as mocked_signature:
+            received_arguments = testing_function(*positional_arguments, **keyword_arguments)
+
+        assert received_arguments == expected_received_arguments
+        mocked_signature.assert_not_called()
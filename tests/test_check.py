@@ -0,0 +1,238 @@
+import asyncio
+import inspect
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.cache import ValidationCache
+from validargs.exceptions import RejectedValueError, ValidationError
+from validargs.hooks import Hooks
+from tests import validators
+
+
+def is_short(argument: str) -> bool:
+    return len(argument) <= 5
+
+
+def checked_function(engine: str, lazy: bool = False) -> Callable:
+    @validated(engine=engine, lazy=lazy)
+    def testing_function(
+        number_1: int = Validator(validators.positive_number),
+        string_1: str = Validator(is_short, default_value='short'),
+        /,
+        *,
+        number_2: int = Validator.range(min=0, default_value=0),
+    ) -> tuple:
+        return number_1, string_1, number_2
+
+    return testing_function
+
+
+class TestCheck:
+    """ Tests checking the arguments of a call without raising """
+
+    test_check_scenarios = [
+        dict(
+            description='Valid arguments',
+            positional_arguments=[1, 'abc'],
+            keyword_arguments={'number_2': 5},
+            expected_argument=None,
+            expected_reason=None,
+        ),
+        dict(
+            description='Valid arguments and defaults',
+            positional_arguments=[1],
+            keyword_arguments={},
+            expected_argument=None,
+            expected_reason=None,
+        ),
+        dict(
+            description='Validator raising an exception',
+            positional_arguments=[-1, 'abc'],
+            keyword_arguments={},
+            expected_argument='number_1',
+            expected_reason=Exception,
+        ),
+        dict(
+            description='Validator returning False',
+            positional_arguments=[1, 'too long'],
+            keyword_arguments={},
+            expected_argument='string_1',
+            expected_reason=RejectedValueError,
+        ),
+        dict(
+            description='Built-in check',
+            positional_arguments=[1],
+            keyword_arguments={'number_2': -1},
+            expected_argument='number_2',
+            expected_reason=ValueError,
+        ),
+        dict(
+            description='The first of multiple invalid arguments is reported',
+            positional_arguments=[-1, 'too long'],
+            keyword_arguments={'number_2': -1},
+            expected_argument='number_1',
+            expected_reason=Exception,
+        ),
+        dict(
+            description='Missing argument',
+            positional_arguments=[],
+            keyword_arguments={},
+            expected_argument=None,
+            expected_reason=TypeError,
+        ),
+        dict(
+            description='Too many positional arguments',
+            positional_arguments=[2, 'abcd', 3],
+            keyword_arguments={},
+            expected_argument=None,
+            expected_reason=TypeError,
+        ),
+        dict(
+            description='Unexpected keyword argument',
+            positional_arguments=[3],
+            keyword_arguments={'string_2': 'ab'},
+            expected_argument=None,
+            expected_reason=TypeError,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    @pytest.mark.parametrize('lazy', [False, True])
+    def test_check(self, description, positional_arguments, keyword_arguments, expected_argument, expected_reason, engine, lazy):
+        testing_function = checked_function(engine, lazy)
+
+        result = testing_function.check(*positional_arguments, **keyword_arguments)
+
+        assert bool(result) is result.passed is (expected_reason is None)
+        assert result.argument == expected_argument
+        if expected_reason is None:
+            assert result.reason is None
+            assert testing_function(*positional_arguments, **keyword_arguments)
+        else:
+            assert type(result.reason) is expected_reason
+            if expected_reason is TypeError:
+                # Arguments that cannot be bound are reported like a direct call
+                assert str(result.reason).startswith('testing_function() ')
+            with pytest.raises((ValidationError, TypeError)):
+                testing_function(*positional_arguments, **keyword_arguments)
+
+
+class TestReturnValues:
+    """ Tests validators that signal failures by returning False """
+
+    test_return_values_scenarios = [
+        dict(
+            validator=Validator(is_short),
+            description='Validator returning True',
+            argument='abc',
+            expected_rejected=False,
+        ),
+        dict(
+            validator=Validator(is_short),
+            description='Validator returning False',
+            argument='too long',
+            expected_rejected=True,
+        ),
+        dict(
+            validator=Validator(is_short, cache=ValidationCache()),
+            description='Cached validator returning False',
+            argument='too long',
+            expected_rejected=True,
+        ),
+        dict(
+            validator=Validator(lambda argument: 0),
+            description='Validator returning a falsy value other than False',
+            argument='abc',
+            expected_rejected=False,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_return_values(self, validator, description, argument, expected_rejected, engine):
+        @validated(engine=engine)
+        def testing_function(string_1: str = validator) -> str:
+            return string_1
+
+        if expected_rejected:
+            for _ in range(2):
+                with pytest.raises(ValidationError) as exc_info:
+                    testing_function(argument)
+                assert type(exc_info.value.__cause__) is RejectedValueError
+        else:
+            assert testing_function(argument) == argument
+
+
+class TestAsyncCheck:
+    """ Tests checking the arguments of calls with async validators """
+
+    test_async_check_scenarios = [
+        dict(
+            description='Valid arguments',
+            arguments=[1, 'abc'],
+            expected_argument=None,
+        ),
+        dict(
+            description='Async validator returning False',
+            arguments=[-1, 'abc'],
+            expected_argument='number_1',
+        ),
+        dict(
+            description='Synchronous validator failing before an async one, in signature order',
+            arguments=[-1, 'too long'],
+            expected_argument='number_1',
+        ),
+    ]
+
+    def test_async_check(self, description, arguments, expected_argument):
+        async def is_positive(argument: int) -> bool:
+            await asyncio.sleep(0)
+            return argument > 0
+
+        @validated
+        async def testing_function(
+            number_1: int = Validator(is_positive),
+            string_1: str = Validator(is_short),
+        ) -> tuple:
+            return number_1, string_1
+
+        awaitable = testing_function.check(*arguments)
+        assert inspect.isawaitable(awaitable)
+
+        result = asyncio.run(awaitable)
+        assert result.argument == expected_argument
+        assert result.passed is (expected_argument is None)
+
+
+class TestCheckHooks:
+    """ Tests that checking fires the hooks of the decorated function """
+
+    test_check_hooks_scenarios = [
+        dict(
+            description='Failure by return value',
+            argument='too long',
+            expected_events=['before_validation', 'on_failure'],
+        ),
+        dict(
+            description='Pass',
+            argument='abc',
+            expected_events=['before_validation', 'after_validation'],
+        ),
+    ]
+
+    def test_check_hooks(self, description, argument, expected_events):
+        events = []
+        hooks = Hooks(
+            before_validation=lambda function, name, value: events.append('before_validation'),
+            after_validation=lambda function, name, value: events.append('after_validation'),
+            on_failure=lambda function, name, value, exc: events.append('on_failure'),
+        )
+
+        @validated(hooks=hooks)
+        def testing_function(string_1: str = Validator(is_short)) -> str:
+            return string_1
+
+        testing_function.check(argument)
+
+        assert events == expected_events
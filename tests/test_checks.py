@@ -0,0 +1,339 @@
+import array
+import re
+from decimal import Decimal
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import compile_wrapper, validated, Validator
+from validargs.cache import ValidationCache
+from validargs.checks import Check
+from validargs.exceptions import ValidationError
+from validargs.hooks import Hooks
+
+
+def checked_function(validator: Validator, engine: str) -> Callable:
+    @validated(engine=engine)
+    def testing_function(argument_1: object = validator) -> object:
+        return argument_1
+
+    return testing_function
+
+
+class TestChecks:
+    """ Tests the built-in checks with every engine """
+
+    test_checks_scenarios = [
+        dict(
+            validator=Validator.range(1, 10),
+            description='Value within range',
+            argument=10,
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.range(1, 10),
+            description='Value below range',
+            argument=0,
+            expected_cause=ValueError,
+        ),
+        dict(
+            validator=Validator.range(max=10),
+            description='Value above range without a lower bound',
+            argument=11,
+            expected_cause=ValueError,
+        ),
+        dict(
+            validator=Validator.range(min=0),
+            description='Value of an incomparable type',
+            argument='1',
+            expected_cause=TypeError,
+        ),
+        dict(
+            validator=Validator.length(max=3),
+            description='Length within range',
+            argument='abc',
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.length(1, 3),
+            description='Length out of range',
+            argument=[],
+            expected_cause=ValueError,
+        ),
+        dict(
+            validator=Validator.length(max=Decimal(3)),
+            description='Length within a bound whose repr is not a literal',
+            argument='xyz',
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.length(min=Decimal(2), max=Decimal(3)),
+            description='Length out of bounds whose repr is not a literal',
+            argument='wxyz',
+            expected_cause=ValueError,
+        ),
+        dict(
+            validator=Validator.instance_of(int, float),
+            description='Instance of any of the types',
+            argument=1.5,
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.instance_of(int, float),
+            description='Instance of none of the types',
+            argument='1',
+            expected_cause=TypeError,
+        ),
+        dict(
+            validator=Validator.matches(r'[a-z]+'),
+            description='String matching the whole pattern',
+            argument='abc',
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.matches(r'[a-z]+'),
+            description='String matching part of the pattern',
+            argument='abc1',
+            expected_cause=ValueError,
+        ),
+        dict(
+            validator=Validator.matches(r'[a-z]+', full=False),
+            description='String containing the pattern',
+            argument='123abc',
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.matches(r'[a-z]+', flags=re.IGNORECASE),
+            description='String matching the pattern with flags',
+            argument='ABC',
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.one_of(['red', 'green']),
+            description='One of the values',
+            argument='red',
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.one_of(['red', 'green']),
+            description='None of the values',
+            argument='blue',
+            expected_cause=ValueError,
+        ),
+        dict(
+            validator=Validator.one_of([[1], [2]]),
+            description='One of unhashable values',
+            argument=[2],
+            expected_cause=None,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_checks(self, validator, description, argument, expected_cause, engine):
+        testing_function = checked_function(validator, engine)
+
+        if expected_cause:
+            with pytest.raises(ValidationError, match="Validation failed for argument: 'argument_1'") as exc_info:
+                testing_function(argument)
+            assert type(exc_info.value.__cause__) is expected_cause
+        else:
+            assert testing_function(argument) == argument
+
+
+class TestBufferChecks:
+    """ Tests the buffer check, which inspects buffers without copying them """
+
+    test_buffer_checks_scenarios = [
+        dict(
+            validator=Validator.buffer(min_nbytes=4, max_nbytes=8),
+            description='Size within range',
+            argument=b'abcd',
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.buffer(min_nbytes=4),
+            description='Size below range',
+            argument=bytearray(b'abc'),
+            expected_cause=ValueError,
+        ),
+        dict(
+            validator=Validator.buffer(magic=b'\x89PNG'),
+            description='Magic header',
+            argument=memoryview(b'\x89PNG\r\n'),
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.buffer(magic=b'\x89PNG'),
+            description='Wrong magic header',
+            argument=b'GIF89a',
+            expected_cause=ValueError,
+        ),
+        dict(
+            validator=Validator.buffer(magic=b'\x00\x00'),
+            description='Magic header of a buffer with multi-byte items',
+            argument=array.array('i', [0, 1]),
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.buffer(itemsize=8, format=('d', 'q')),
+            description='Item size and format',
+            argument=array.array('d', [1.0]),
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.buffer(format='d'),
+            description='Wrong format',
+            argument=array.array('f', [0.5, 2.0]),
+            expected_cause=ValueError,
+        ),
+        dict(
+            validator=Validator.buffer(shape=(None, 4)),
+            description='Shape with a wildcard dimension',
+            argument=memoryview(bytes(12)).cast('B', (3, 4)),
+            expected_cause=None,
+        ),
+        dict(
+            validator=Validator.buffer(shape=(3,)),
+            description='Wrong number of dimensions',
+            argument=memoryview(bytes(12)).cast('B', (3, 4)),
+            expected_cause=ValueError,
+        ),
+        dict(
+            validator=Validator.buffer(contiguous='C'),
+            description='Non contiguous buffer',
+            argument=memoryview(bytes(12))[::2],
+            expected_cause=ValueError,
+        ),
+        dict(
+            validator=Validator.buffer(max_nbytes=8),
+            description='Object that does not support the buffer protocol',
+            argument='abcd',
+            expected_cause=TypeError,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_buffer_checks(self, validator, description, argument, expected_cause, engine):
+        testing_function = checked_function(validator, engine)
+
+        if expected_cause:
+            with pytest.raises(ValidationError) as exc_info:
+                testing_function(argument)
+            assert type(exc_info.value.__cause__) is expected_cause
+        else:
+            assert testing_function(argument) is argument
+
+    test_released_views_scenarios = [
+        dict(
+            validator=Validator.buffer(min_nbytes=1, magic=b'a'),
+            description='Valid bytearray',
+            argument=bytearray(b'abc'),
+        ),
+        dict(
+            validator=Validator.buffer(magic=b'b'),
+            description='Invalid bytearray',
+            argument=bytearray(b'abc'),
+        ),
+    ]
+
+    def test_released_views(self, validator, description, argument):
+        testing_function = checked_function(validator, 'codegen')
+
+        testing_function.check(argument)
+        # A bytearray cannot be resized while any memoryview of it is not released
+        argument.extend(b'def')
+        assert argument == bytearray(b'abcdef')
+
+
+class TestInlining:
+    """ Tests which checks the codegen engine evaluates inline """
+
+    test_inlining_scenarios = [
+        dict(
+            validator=Validator.range(1, 10),
+            hooks=None,
+            description='Built-in check',
+            invalid_argument=0,
+            expected_inlined=True,
+        ),
+        dict(
+            validator=Validator(lambda argument: int(argument)),
+            hooks=None,
+            description='Validator function',
+            invalid_argument='invalid',
+            expected_inlined=False,
+        ),
+        dict(
+            validator=Validator.range(1, 10, cache=ValidationCache()),
+            hooks=None,
+            description='Built-in check with a cache',
+            invalid_argument=0,
+            expected_inlined=False,
+        ),
+        dict(
+            validator=Validator.range(1, 10),
+            hooks=Hooks(before_validation=lambda function, argument, value: None),
+            description='Built-in check with hooks',
+            invalid_argument=0,
+            expected_inlined=False,
+        ),
+    ]
+
+    def test_inlining(self, validator, hooks, description, invalid_argument, expected_inlined):
+        def testing_function(argument_1: int = validator) -> int:
+            return argument_1
+
+        wrapped, plan = compile_wrapper(
+            testing_function, engine='codegen', threaded=False, sampler=None, metrics=False, hooks=hooks,
+        )
+
+        assert isinstance(plan.parameters[0].validator.plain_func, Check) == expected_inlined
+        assert ('__validargs_check_0' in wrapped.__code__.co_freevars) == expected_inlined
+        assert wrapped(5) == 5
+        with pytest.raises(ValidationError):
+            wrapped(invalid_argument)
+
+
+class TestShadowedBuiltins:
+    """ Tests that inlined checks work when the parameters shadow the builtins they use """
+
+    test_shadowed_builtins_scenarios = [
+        dict(
+            description='Valid arguments',
+            arguments=(3, 'abc', 1, 2),
+            raised_exception=None,
+        ),
+        dict(
+            description='Invalid length',
+            arguments=(3, 'abcdef', 1, 2),
+            raised_exception=ValidationError,
+        ),
+        dict(
+            description='Invalid instance',
+            arguments=(3, 'abc', 'x', 2),
+            raised_exception=ValidationError,
+        ),
+        dict(
+            description='Missing argument',
+            arguments=(3, 'abc', 1),
+            raised_exception=TypeError,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_shadowed_builtins(self, description, arguments, raised_exception, engine):
+        @validated(engine=engine)
+        def testing_function(
+            len: int = Validator.range(0, 10),
+            name: str = Validator.length(max=5),
+            isinstance: int = Validator.instance_of(int),
+            TypeError: int = Validator.range(min=0),
+        ) -> tuple:
+            return len, name, isinstance, TypeError
+
+        if raised_exception:
+            with pytest.raises(raised_exception):
+                testing_function(*arguments)
+        else:
+            assert testing_function(*arguments) == arguments
+        assert testing_function.check(*arguments).passed is (raised_exception is None)
@@ -0,0 +1,181 @@
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator, interpreted_wrapper
+from tests import test_keyword_only_args
+from tests import test_mixed_args
+from tests import test_positional_only_and_keyword_only_args
+from tests import test_positional_only_args
+from tests import validators
+
+
+def reserved_arguments(
+    __validargs_number: int = Validator(validators.positive_number),
+) -> None:
+    pass
+
+
+def codegen_scenarios(*test_modules) -> list:
+    """ Collects the scenarios of the given test modules and re-decorates
+    their testing functions using the 'codegen' engine.
+    """
+    scenarios = []
+    for test_module in test_modules:
+        for test_class in vars(test_module).values():
+            for scenario in getattr(test_class, 'test_arguments_scenarios', []):
+                testing_function = validated(scenario['testing_function'].__wrapped__, engine='codegen')
+                description = f"{test_class.__name__}: {scenario['description']}"
+                scenarios.append(dict(scenario, testing_function=testing_function, description=description))
+
+    return scenarios
+
+
+class TestCodegenEngine:
+    """ Tests that the 'codegen' engine behaves like the 'interpreted' one """
+
+    test_arguments_scenarios = codegen_scenarios(
+        test_keyword_only_args,
+        test_mixed_args,
+        test_positional_only_and_keyword_only_args,
+        test_positional_only_args,
+    )
+    def test_arguments(
+        self,
+        description: str,
+        testing_function: Callable,
+        positional_arguments: list,
+        keyword_arguments: dict,
+        expected_received_arguments: dict,
+        raised_exception: Exception,
+    ) -> None:
+
+        if raised_exception:
+            with pytest.raises(raised_exception):
+                testing_function(*positional_arguments, **keyword_arguments)
+        else:
+            received_arguments = testing_function(*positional_arguments, **keyword_arguments)
+            assert received_arguments == expected_received_arguments
+
+
+class TestCodegenFallback:
+    """ Tests the selection of the engine """
+
+    def variadic_arguments(
+        number_1: int = Validator(validators.positive_number),
+        *args,
+    ) -> None:
+        pass
+
+    def regular_arguments(
+        number_1: int = Validator(validators.positive_number),
+    ) -> None:
+        pass
+
+    test_engine_scenarios = [
+        dict(
+            testing_function=regular_arguments,
+            description='A wrapper is generated for supported signatures',
+            engine='codegen',
+            expect_generated=True,
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=variadic_arguments,
+            description='A wrapper is generated for variadic signatures',
+            engine='codegen',
+            expect_generated=True,
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=reserved_arguments,
+            description='Falls back to the interpreted wrapper for unsupported signatures',
+            engine='codegen',
+            expect_generated=False,
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=regular_arguments,
+            description='Unknown engines are rejected',
+            engine='compiled',
+            expect_generated=None,
+            raised_exception=ValueError,
+        ),
+    ]
+    def test_engine(
+        self,
+        description: str,
+        testing_function: Callable,
+        engine: str,
+        expect_generated: bool,
+        raised_exception: Exception,
+    ) -> None:
+
+        if raised_exception:
+            with pytest.raises(raised_exception):
+                validated(engine=engine)(testing_function)
+        else:
+            wrapped = validated(engine=engine)(testing_function)
+            interpreted_code = interpreted_wrapper(testing_function, wrapped.__validargs_plan__).__code__
+            assert (wrapped.__code__ is not interpreted_code) == expect_generated
+
+
+class TestUnboundArguments:
+    """ Tests that every engine rejects the arguments that cannot be bound to the signature """
+
+    test_unbound_arguments_scenarios = [
+        dict(
+            description='Arguments that can be bound',
+            positional_arguments=[1, 2],
+            keyword_arguments={},
+            expected_message=None,
+            raised_exception=None,
+        ),
+        dict(
+            description='Too many positional arguments',
+            positional_arguments=[1, 2, 3],
+            keyword_arguments={},
+            expected_message='positional arguments? but 3 were given',
+            raised_exception=TypeError,
+        ),
+        dict(
+            description='Unexpected keyword argument',
+            positional_arguments=[1],
+            keyword_arguments={'number_3': 3},
+            expected_message="unexpected keyword argument 'number_3'",
+            raised_exception=TypeError,
+        ),
+        dict(
+            description='Argument provided both positionally and as a keyword',
+            positional_arguments=[1, 2],
+            keyword_arguments={'number_2': 2},
+            expected_message="multiple values for argument 'number_2'",
+            raised_exception=TypeError,
+        ),
+        dict(
+            description='Positional-only argument provided as a keyword',
+            positional_arguments=[],
+            keyword_arguments={'number_1': 1, 'number_2': 2},
+            expected_message="positional-only arguments passed as keyword arguments: 'number_1'",
+            raised_exception=TypeError,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    @pytest.mark.parametrize('validator', [Validator(validators.positive_number), None])
+    def test_unbound_arguments(
+        self, description, positional_arguments, keyword_arguments, expected_message, raised_exception,
+        engine, validator,
+    ):
+        # Functions without validators are wrapped in a pass-through wrapper
+        @validated(engine=engine)
+        def testing_function(number_1: int = validator, /, number_2: int = validator) -> tuple:
+            return number_1, number_2
+
+        if raised_exception:
+            with pytest.raises(raised_exception, match=expected_message):
+                testing_function(*positional_arguments, **keyword_arguments)
+            if validator is not None:
+                assert testing_function.check(*positional_arguments, **keyword_arguments).passed is False
+        else:
+            assert testing_function(*positional_arguments, **keyword_arguments) == tuple(positional_arguments)
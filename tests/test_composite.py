@@ -0,0 +1,255 @@
+import time
+from typing import Callable, List
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.composite import AllOf, AnyOf
+from validargs.exceptions import ValidationError
+from tests import validators
+
+
+def slow_check(argument: int) -> None:
+    time.sleep(0.001)
+
+
+def never_zero(argument: int) -> None:
+    if argument == 0:
+        raise ValueError("Argument must not be zero")
+
+
+async def async_check(argument: int) -> None:
+    validators.positive_number(argument)
+
+
+def is_positive(argument: int) -> bool:
+    return argument > 0
+
+
+def is_small(argument: int) -> bool:
+    return argument < 10
+
+
+def is_negative(argument: int) -> bool:
+    return argument < 0
+
+
+def is_large(argument: int) -> bool:
+    return argument > 10
+
+
+def recording(calls: List[str], name: str, check: Callable) -> Callable:
+    def recording_check(argument):
+        calls.append(name)
+        check(argument)
+    return recording_check
+
+
+def all_of_function() -> Callable:
+    @validated
+    def testing_function(
+        number_1: int = Validator.all_of(validators.positive_number, never_zero),
+    ) -> int:
+        return number_1
+
+    return testing_function
+
+
+def any_of_function() -> Callable:
+    @validated
+    def testing_function(
+        value_1: object = Validator.any_of(validators.positive_number, validators.boolean),
+    ) -> object:
+        return value_1
+
+    return testing_function
+
+
+class TestComposite:
+    """ Tests validators that chain multiple validator functions """
+
+    test_composite_scenarios = [
+        dict(
+            testing_function=all_of_function(),
+            description='All of the checks pass',
+            argument=5,
+            expected_result=5,
+            expected_error=None,
+        ),
+        dict(
+            testing_function=all_of_function(),
+            description='One of all the checks fails',
+            argument=-5,
+            expected_result=None,
+            expected_error="Validation failed for argument: 'number_1'",
+        ),
+        dict(
+            testing_function=any_of_function(),
+            description='The first of any of the checks passes',
+            argument=5,
+            expected_result=5,
+            expected_error=None,
+        ),
+        dict(
+            testing_function=any_of_function(),
+            description='The last of any of the checks passes',
+            argument=False,
+            expected_result=False,
+            expected_error=None,
+        ),
+        dict(
+            testing_function=any_of_function(),
+            description='None of any of the checks passes',
+            argument=-5,
+            expected_result=None,
+            expected_error="Validation failed for argument: 'value_1'",
+        ),
+    ]
+
+    def test_composite(self, testing_function, description, argument, expected_result, expected_error):
+        if expected_error:
+            with pytest.raises(ValidationError, match=expected_error):
+                testing_function(argument)
+        else:
+            assert testing_function(argument) == expected_result
+
+
+class TestPredicateChecks:
+    """ Tests composite validators of checks that fail by returning False """
+
+    test_predicate_checks_scenarios = [
+        dict(
+            composite=AllOf,
+            checks=[is_positive, is_small],
+            description='All of the predicates pass',
+            argument=5,
+            expected_passed=True,
+            expected_failures=0,
+        ),
+        dict(
+            composite=AllOf,
+            checks=[is_positive, is_small],
+            description='One of all the predicates returns False',
+            argument=-5,
+            expected_passed=False,
+            expected_failures=1,
+        ),
+        dict(
+            composite=AnyOf,
+            checks=[is_negative, is_large],
+            description='One of any of the predicates passes',
+            argument=15,
+            expected_passed=True,
+            expected_failures=1,
+        ),
+        dict(
+            composite=AnyOf,
+            checks=[is_negative, is_large],
+            description='All of any of the predicates return False',
+            argument=7,
+            expected_passed=False,
+            expected_failures=2,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    @pytest.mark.parametrize('profile_every', [1, 16])
+    def test_predicate_checks(
+        self, composite, checks, description, argument, expected_passed, expected_failures, engine, profile_every,
+    ):
+        chain = composite(checks, profile_every=profile_every)
+
+        @validated(engine=engine)
+        def testing_function(number_1: int = Validator(chain)) -> int:
+            return number_1
+
+        if expected_passed:
+            assert testing_function(argument) == argument
+        else:
+            with pytest.raises(ValidationError) as exc_info:
+                testing_function(argument)
+            assert isinstance(exc_info.value.__cause__, ValueError)
+        assert testing_function.check(argument).passed is expected_passed
+
+        if profile_every == 1:
+            # The profiled calls count the checks that returned False as failures
+            assert sum(stats.failures for stats in chain.stats.values()) == expected_failures * 2
+
+
+class TestAdaptiveOrdering:
+    """ Tests the reordering of the checks based on their profile """
+
+    test_adaptive_ordering_scenarios = [
+        dict(
+            composite=AllOf,
+            description='All of the checks: cheap checks that fail often move first',
+            checks=[slow_check, never_zero],
+            arguments=[0, 1] * 10,
+            expected_order=[never_zero, slow_check],
+        ),
+        dict(
+            composite=AnyOf,
+            description='Any of the checks: cheap checks that pass often move first',
+            checks=[slow_check, never_zero],
+            arguments=[1] * 20,
+            expected_order=[never_zero, slow_check],
+        ),
+    ]
+
+    def test_adaptive_ordering(self, composite, description, checks, arguments, expected_order):
+        chain = composite(checks, profile_every=1, reorder_every=10)
+
+        for argument in arguments:
+            try:
+                chain(argument)
+            except ValueError:
+                pass
+
+        assert list(chain.ordered_checks) == expected_order
+        assert [profile['check'] for profile in chain.profile()] == expected_order
+
+    test_short_circuit_scenarios = [
+        dict(
+            composite=AllOf,
+            description='All of the checks stop at the first failure',
+            argument=-1,
+            expected_calls=['positive_number'],
+        ),
+        dict(
+            composite=AnyOf,
+            description='Any of the checks stop at the first pass',
+            argument=1,
+            expected_calls=['positive_number'],
+        ),
+    ]
+
+    def test_short_circuit(self, composite, description, argument, expected_calls):
+        calls = []
+        chain = composite(
+            [recording(calls, 'positive_number', validators.positive_number), recording(calls, 'never_zero', never_zero)],
+            adaptive=False,
+        )
+
+        try:
+            chain(argument)
+        except Exception:
+            pass
+
+        assert calls == expected_calls
+
+    test_invalid_checks_scenarios = [
+        dict(
+            description='No checks',
+            checks=[],
+            expected_exception=ValueError,
+        ),
+        dict(
+            description='Async checks',
+            checks=[validators.positive_number, async_check],
+            expected_exception=TypeError,
+        ),
+    ]
+
+    def test_invalid_checks(self, description, checks, expected_exception):
+        with pytest.raises(expected_exception):
+            AllOf(checks)
@@ -0,0 +1,92 @@
+from typing import Any, Callable, List
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.exceptions import ValidationError
+from tests import validators
+
+
+def counting_function(engine: str, default_value: Any, mutable_default: bool = False) -> Callable:
+    """ Creates a decorated function whose validator records every value it validates """
+    validated_values = []
+
+    def counting_validator(argument: int) -> None:
+        validated_values.append(argument)
+        validators.positive_number(argument)
+
+    @validated(engine=engine)
+    def testing_function(
+        number_1: int = Validator(counting_validator, default_value=default_value, mutable_default=mutable_default),
+    ) -> List[int]:
+        return validated_values
+
+    return testing_function
+
+
+class TestDefaultValueValidation:
+    """ Tests that the default values of validators are validated only once """
+
+    test_default_value_scenarios = [
+        dict(
+            testing_function=counting_function('interpreted', default_value=1),
+            description='Default value is validated only once (interpreted)',
+            calls=3,
+            expected_validated_values=[1],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=counting_function('codegen', default_value=1),
+            description='Default value is validated only once (codegen)',
+            calls=3,
+            expected_validated_values=[1],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=counting_function('interpreted', default_value=1, mutable_default=True),
+            description='Mutable default value is validated on every call (interpreted)',
+            calls=3,
+            expected_validated_values=[1, 1, 1],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=counting_function('codegen', default_value=1, mutable_default=True),
+            description='Mutable default value is validated on every call (codegen)',
+            calls=3,
+            expected_validated_values=[1, 1, 1],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=counting_function('interpreted', default_value=-1),
+            description='Invalid default value fails on every call (interpreted)',
+            calls=3,
+            expected_validated_values=[-1, -1, -1],
+            raised_exception=ValidationError,
+        ),
+        dict(
+            testing_function=counting_function('codegen', default_value=-1),
+            description='Invalid default value fails on every call (codegen)',
+            calls=3,
+            expected_validated_values=[-1, -1, -1],
+            raised_exception=ValidationError,
+        ),
+    ]
+    def test_default_value(
+        self,
+        description: str,
+        testing_function: Callable,
+        calls: int,
+        expected_validated_values: list,
+        raised_exception: Exception,
+    ) -> None:
+
+        for _ in range(calls):
+            if raised_exception:
+                with pytest.raises(raised_exception):
+                    testing_function()
+            else:
+                testing_function()
+
+        # Explicitly provided arguments are always validated
+        validated_values = testing_function(2)
+        assert validated_values == expected_validated_values + [2]
@@ -0,0 +1,199 @@
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.exceptions import ValidationError
+from validargs.hooks import Hooks, global_hooks
+from tests import validators
+
+
+def recording_hooks(events: list) -> Hooks:
+    """ Creates hooks that record every event in the given list """
+    return Hooks(
+        before_validation=lambda function, argument, value: events.append(('before_validation', argument, value)),
+        after_validation=lambda function, argument, value: events.append(('after_validation', argument, value)),
+        on_failure=lambda function, argument, value, exc: events.append(('on_failure', argument, value)),
+        on_default=lambda function, argument, value: events.append(('on_default', argument, value)),
+    )
+
+
+def make_function_with_default() -> Callable:
+    """ Creates a new function with the same name and signature on every call """
+    def function_with_default(
+        number_1: int = Validator(validators.positive_number),
+        number_2: int = Validator(validators.positive_number, default_value=4),
+    ) -> None:
+        pass
+
+    return function_with_default
+
+
+class TestHooks:
+    """ Tests the callbacks fired around the validation of arguments """
+
+    def arguments_with_validators(
+        number_1: int = Validator(validators.positive_number),
+        number_2: int = Validator(validators.positive_number, default_value=2),
+        boolean: bool = False,
+    ) -> None:
+        pass
+
+    test_hooks_scenarios = [
+        dict(
+            testing_function=arguments_with_validators,
+            description='Validation and default events are fired',
+            engine='interpreted',
+            positional_arguments=[1],
+            expected_events=[
+                ('on_default', 'number_2', 2),
+                ('before_validation', 'number_1', 1),
+                ('after_validation', 'number_1', 1),
+                ('before_validation', 'number_2', 2),
+                ('after_validation', 'number_2', 2),
+            ],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Validation and default events are fired (codegen)',
+            engine='codegen',
+            positional_arguments=[1],
+            expected_events=[
+                ('before_validation', 'number_1', 1),
+                ('after_validation', 'number_1', 1),
+                ('on_default', 'number_2', 2),
+                ('before_validation', 'number_2', 2),
+                ('after_validation', 'number_2', 2),
+            ],
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Failure events are fired',
+            engine='interpreted',
+            positional_arguments=[-1, 2],
+            expected_events=[
+                ('before_validation', 'number_1', -1),
+                ('on_failure', 'number_1', -1),
+            ],
+            raised_exception=ValidationError,
+        ),
+    ]
+    def test_hooks(
+        self,
+        description: str,
+        testing_function: Callable,
+        engine: str,
+        positional_arguments: list,
+        expected_events: list,
+        raised_exception: Exception,
+    ) -> None:
+        events = []
+        wrapped = validated(testing_function, engine=engine, hooks=recording_hooks(events))
+
+        if raised_exception:
+            with pytest.raises(raised_exception):
+                wrapped(*positional_arguments)
+        else:
+            wrapped(*positional_arguments)
+
+        assert events == expected_events
+
+    test_global_hooks_scenarios = [
+        dict(
+            testing_function=arguments_with_validators,
+            description='Global hooks apply to the functions decorated after their registration',
+            positional_arguments=[1, 3],
+            expected_events=[('before_validation', 'number_1', 1), ('before_validation', 'number_2', 3)],
+        ),
+    ]
+    def test_global_hooks(
+        self,
+        description: str,
+        testing_function: Callable,
+        positional_arguments: list,
+        expected_events: list,
+    ) -> None:
+        events = []
+        callback = lambda function, argument, value: events.append(('before_validation', argument, value))
+
+        decorated_before = validated(testing_function)
+        global_hooks.register('before_validation', callback)
+        try:
+            decorated_after = validated(testing_function)
+        finally:
+            global_hooks.unregister('before_validation', callback)
+
+        decorated_before(*positional_arguments)
+        assert events == []
+
+        decorated_after(*positional_arguments)
+        assert events == expected_events
+
+    test_shared_plan_scenarios = [
+        dict(
+            function_factory=make_function_with_default,
+            description='Default values are validated by the hooks of functions sharing a plan',
+            positional_arguments=[5],
+            expected_events=[
+                ('on_default', 'number_2', 4),
+                ('before_validation', 'number_1', 5),
+                ('after_validation', 'number_1', 5),
+                ('before_validation', 'number_2', 4),
+                ('after_validation', 'number_2', 4),
+            ],
+        ),
+    ]
+    def test_shared_plan(
+        self,
+        description: str,
+        function_factory: Callable,
+        positional_arguments: list,
+        expected_events: list,
+    ) -> None:
+        # The default value is validated through the plan of the function without hooks first
+        validated(function_factory())(*positional_arguments)
+
+        events = []
+        wrapped = validated(function_factory(), hooks=recording_hooks(events))
+        wrapped(*positional_arguments)
+
+        assert events == expected_events
+
+    test_no_hooks_scenarios = [
+        dict(
+            testing_function=arguments_with_validators,
+            description='Functions without hooks are not instrumented',
+        ),
+    ]
+    def test_no_hooks(
+        self,
+        description: str,
+        testing_function: Callable,
+    ) -> None:
+        wrapped = validated(testing_function, hooks=Hooks())
+
+        for param in wrapped.__validargs_plan__.parameters:
+            assert param.validator is None or isinstance(param.validator, Validator)
+            assert param.on_default is None
+
+
+class TestHooksConfiguration:
+    """ Tests invalid hook configurations """
+
+    test_configuration_scenarios = [
+        dict(
+            description='Unknown events are rejected',
+            event='on_success',
+            raised_exception=ValueError,
+        ),
+    ]
+    def test_configuration(
+        self,
+        description: str,
+        event: str,
+        raised_exception: Exception,
+    ) -> None:
+        with pytest.raises(raised_exception):
+            Hooks(**{event: print})
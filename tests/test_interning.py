@@ -0,0 +1,149 @@
+from dataclasses import FrozenInstanceError
+import gc
+import pickle
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.interning import interned_count
+from tests import validators
+
+
+def same_signature_functions() -> Callable:
+    def testing_function(number_1: int = Validator(validators.positive_number)) -> int:
+        return number_1
+
+    return testing_function
+
+
+class TestSlottedValidator:
+    """ Tests that validators are compact and immutable """
+
+    test_slotted_validator_scenarios = [
+        dict(
+            validator=Validator(validators.positive_number),
+            description='Validator',
+        ),
+        dict(
+            validator=Validator.range(1, 10, default_value=5),
+            description='Validator of a built-in check',
+        ),
+    ]
+
+    def test_slotted_validator(self, validator, description):
+        assert not hasattr(validator, '__dict__')
+
+        with pytest.raises(FrozenInstanceError):
+            validator.default_value = 1
+
+        assert pickle.loads(pickle.dumps(validator)) == validator
+
+
+class TestInterning:
+    """ Tests the interning of identical validators and call plans """
+
+    test_interning_scenarios = [
+        dict(
+            first=Validator(validators.positive_number, default_value=1),
+            second=Validator(validators.positive_number, default_value=1),
+            description='Equal validators',
+            expected_shared=True,
+        ),
+        dict(
+            first=Validator.matches(r'[a-z]+'),
+            second=Validator.matches(r'[a-z]+'),
+            description='Equal built-in checks',
+            expected_shared=True,
+        ),
+        dict(
+            first=Validator(validators.positive_number, default_value=1),
+            second=Validator(validators.positive_number, default_value=True),
+            description='Equal default values of different types',
+            expected_shared=False,
+        ),
+        dict(
+            first=Validator.length(max=5),
+            second=Validator.length(max=5.0),
+            description='Built-in checks with equal bounds of different types',
+            expected_shared=False,
+        ),
+        dict(
+            first=Validator.one_of([1, 2]),
+            second=Validator.one_of([True, 2]),
+            description='Built-in checks with equal values of different types',
+            expected_shared=False,
+        ),
+        dict(
+            first=Validator(validators.positive_number, default_value=[1]),
+            second=Validator(validators.positive_number, default_value=[1]),
+            description='Unhashable default values',
+            expected_shared=False,
+        ),
+        dict(
+            first=Validator(validators.positive_number),
+            second=Validator(validators.short_str),
+            description='Different validators',
+            expected_shared=False,
+        ),
+    ]
+
+    def test_interning(self, first, second, description, expected_shared):
+        def first_function(argument_1: object = first) -> object:
+            return argument_1
+
+        def second_function(argument_1: object = second) -> object:
+            return argument_1
+
+        first_function = validated(first_function)
+        second_function = validated(second_function)
+
+        first_validator = first_function.__validargs_plan__.parameters[0].validator
+        second_validator = second_function.__validargs_plan__.parameters[0].validator
+
+        assert (first_validator is second_validator) == expected_shared
+        assert first_validator.default_value is first.default_value
+        assert second_validator.default_value is second.default_value
+
+        # The decorated functions do not keep their own copies of the validators
+        assert first_function.__wrapped__.__defaults__[0] is first_validator
+        assert second_function.__wrapped__.__defaults__[0] is second_validator
+
+    test_shared_plans_scenarios = [
+        dict(
+            engine='interpreted',
+            description='Functions with the same name and signature share a call plan',
+        ),
+        dict(
+            engine='codegen',
+            description='Functions with the same name and signature share a call plan and compiled code',
+        ),
+    ]
+
+    def test_shared_plans(self, engine, description):
+        first_function = validated(same_signature_functions(), engine=engine)
+        second_function = validated(same_signature_functions(), engine=engine)
+
+        assert first_function.__validargs_plan__ is second_function.__validargs_plan__
+        assert first_function.__code__ is second_function.__code__
+        assert first_function(1) == second_function(1) == 1
+
+    test_released_scenarios = [
+        dict(
+            description='Interned objects are released with the decorated functions',
+        ),
+    ]
+
+    def test_released(self, description):
+        def testing_function(number_released: int = Validator(validators.positive_number, default_value=12345)) -> int:
+            return number_released
+
+        gc.collect()
+        count = interned_count()
+
+        testing_function = validated(testing_function)
+        assert interned_count() > count
+
+        del testing_function
+        gc.collect()
+        assert interned_count() == count
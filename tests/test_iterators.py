@@ -0,0 +1,154 @@
+import itertools
+from typing import Callable, Iterable, Optional
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.exceptions import ElementValidationError, ValidationError
+from validargs.sampling import Sampler
+from tests import validators
+
+
+def iterator_function(engine: str) -> Callable:
+    @validated(engine=engine)
+    def testing_function(
+        numbers: Iterable[int] = Validator.each(validators.positive_number, default_value=()),
+        /,
+        count: Optional[int] = None,
+    ) -> list:
+        return list(itertools.islice(numbers, count))
+
+    return testing_function
+
+
+class TestEach:
+    """ Tests the lazy validation of the elements of iterator arguments """
+
+    test_each_scenarios = [
+        dict(
+            description='Valid generator',
+            numbers=lambda: (number for number in [1, 2, 3]),
+            count=None,
+            expected_received_elements=[1, 2, 3],
+            expected_invalid_index=None,
+            raised_exception=None,
+        ),
+        dict(
+            description='Valid list',
+            numbers=lambda: [1, 2, 3],
+            count=None,
+            expected_received_elements=[1, 2, 3],
+            expected_invalid_index=None,
+            raised_exception=None,
+        ),
+        dict(
+            description='Infinite iterator that is partially consumed',
+            numbers=lambda: itertools.count(1),
+            count=3,
+            expected_received_elements=[1, 2, 3],
+            expected_invalid_index=None,
+            raised_exception=None,
+        ),
+        dict(
+            description='Invalid element that is not consumed',
+            numbers=lambda: iter([1, 2, -3]),
+            count=2,
+            expected_received_elements=[1, 2],
+            expected_invalid_index=None,
+            raised_exception=None,
+        ),
+        dict(
+            description='Invalid element that is consumed',
+            numbers=lambda: iter([1, 2, -3, 4]),
+            count=None,
+            expected_received_elements=None,
+            expected_invalid_index=2,
+            raised_exception=ValidationError,
+        ),
+        dict(
+            description='Argument that is not iterable',
+            numbers=lambda: 1,
+            count=None,
+            expected_received_elements=None,
+            expected_invalid_index=None,
+            raised_exception=ValidationError,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_each(
+        self, description, numbers, count, expected_received_elements, expected_invalid_index, raised_exception, engine,
+    ):
+        testing_function = iterator_function(engine)
+        # The iterators are constructed per test, since they are consumed
+        numbers = numbers()
+
+        if raised_exception:
+            with pytest.raises(raised_exception) as exc_info:
+                testing_function(numbers, count)
+            if expected_invalid_index is not None:
+                assert type(exc_info.value.__cause__) is ElementValidationError
+                assert exc_info.value.__cause__.indices == [expected_invalid_index]
+        else:
+            assert testing_function(numbers, count) == expected_received_elements
+
+
+class TestEachDefaults:
+    """ Tests the default values of iterator arguments """
+
+    test_defaults_scenarios = [
+        dict(
+            description='Valid default value',
+            default_value=(1, 2),
+            expected_received_elements=[1, 2],
+            raised_exception=None,
+        ),
+        dict(
+            description='Invalid element of the default value',
+            default_value=(1, -2),
+            expected_received_elements=None,
+            raised_exception=ValidationError,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_defaults(self, description, default_value, expected_received_elements, raised_exception, engine):
+        @validated(engine=engine)
+        def testing_function(numbers: Iterable[int] = Validator.each(Validator.range(min=1), default_value=default_value)) -> list:
+            return list(numbers)
+
+        for _ in range(2):
+            if raised_exception:
+                with pytest.raises(raised_exception):
+                    testing_function()
+            else:
+                assert testing_function() == expected_received_elements
+
+
+class TestEachSampling:
+    """ Tests that the elements of iterator arguments are only validated in the sampled calls """
+
+    test_sampling_scenarios = [
+        dict(
+            description='Only the first of the calls is sampled',
+            every=1000,
+            expected_validated_elements=[1],
+        ),
+        dict(
+            description='Every call is sampled',
+            every=1,
+            expected_validated_elements=[1, 2, 3],
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_sampling(self, description, every, expected_validated_elements, engine):
+        validated_elements = []
+
+        @validated(engine=engine, sampler=Sampler(every=every))
+        def testing_function(numbers: Iterable[int] = Validator.each(validated_elements.append)) -> list:
+            return list(numbers)
+
+        for number in (1, 2, 3):
+            assert testing_function(iter([number])) == [number]
+        assert validated_elements == expected_validated_elements
@@ -0,0 +1,206 @@
+import asyncio
+from types import ModuleType
+from typing import Callable
+from unittest import mock
+
+import pytest
+
+import validargs
+from validargs.validargs import validated, Validator
+from validargs.exceptions import ValidationError
+from tests import validators
+
+
+def lazy_function() -> Callable:
+    @validated(lazy=True)
+    def arguments_with_validators(
+        number_1: int = Validator(validators.positive_number),
+        number_2: int = Validator(validators.positive_number, default_value=2),
+    ) -> dict:
+        return dict(number_1=number_1, number_2=number_2)
+
+    return arguments_with_validators
+
+
+def lazy_module() -> ModuleType:
+    module = ModuleType('lazy_module')
+    module.function = lazy_function()
+
+    class LazyClass:
+        method = lazy_function()
+        static_method = staticmethod(lazy_function())
+
+    LazyClass.__module__ = module.__name__
+    module.LazyClass = LazyClass
+
+    return module
+
+
+def cyclic_module() -> ModuleType:
+    module = ModuleType('cyclic_module')
+
+    class First:
+        method = lazy_function()
+
+        class Nested:
+            method = lazy_function()
+
+    class Second:
+        method = lazy_function()
+
+    First.other = Second
+    Second.other = First
+    for cls in (First, Second):
+        cls.__module__ = module.__name__
+        module.__dict__[cls.__name__] = cls
+
+    return module
+
+
+class TestLazyDecoration:
+    """ Tests deferring the analysis of the signature to the first call """
+
+    test_arguments_scenarios = [
+        dict(
+            testing_function=lazy_function,
+            description='Valid arguments',
+            positional_arguments=[1],
+            expected_received_arguments=dict(number_1=1, number_2=2),
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=lazy_function,
+            description='Invalid arguments',
+            positional_arguments=[-1],
+            expected_received_arguments=None,
+            raised_exception=ValidationError,
+        ),
+    ]
+    def test_arguments(
+        self,
+        description: str,
+        testing_function: Callable,
+        positional_arguments: list,
+        expected_received_arguments: dict,
+        raised_exception: Exception,
+    ) -> None:
+        with mock.patch('validargs.validargs.signature') as mocked_signature:
+            wrapped = testing_function()
+        mocked_signature.assert_not_called()
+        assert not hasattr(wrapped, '__validargs_plan__')
+
+        if raised_exception:
+            with pytest.raises(raised_exception):
+                wrapped(*positional_arguments)
+        else:
+            assert wrapped(*positional_arguments) == expected_received_arguments
+
+        assert hasattr(wrapped, '__validargs_plan__')
+
+    test_validate_many_scenarios = [
+        dict(
+            testing_function=lazy_function,
+            description='Batch validation of a lazily decorated function',
+            rows=[(1,), (-1,)],
+            expected_mask=[1, 0],
+        ),
+    ]
+    def test_validate_many(
+        self,
+        description: str,
+        testing_function: Callable,
+        rows: list,
+        expected_mask: list,
+    ) -> None:
+        result = testing_function().validate_many(rows)
+
+        assert list(result.mask) == expected_mask
+
+    test_async_scenarios = [
+        dict(
+            description='Coroutine functions are decorated lazily',
+            positional_arguments=[1],
+            expected_received_arguments=dict(number_1=1),
+        ),
+    ]
+    def test_async(
+        self,
+        description: str,
+        positional_arguments: list,
+        expected_received_arguments: dict,
+    ) -> None:
+        @validated(lazy=True)
+        async def arguments_with_validators(number_1: int = Validator(validators.positive_number)) -> dict:
+            return dict(number_1=number_1)
+
+        assert asyncio.iscoroutinefunction(arguments_with_validators)
+        assert asyncio.run(arguments_with_validators(*positional_arguments)) == expected_received_arguments
+
+
+class TestWarmup:
+    """ Tests warming up lazily decorated functions """
+
+    test_warmup_scenarios = [
+        dict(
+            description='Functions',
+            create_targets=lambda: (lazy_function(), lazy_function()),
+            expected_count=2,
+            background=False,
+        ),
+        dict(
+            description='Iterables of functions',
+            create_targets=lambda: ([lazy_function(), lazy_function()], lazy_function()),
+            expected_count=3,
+            background=False,
+        ),
+        dict(
+            description='Modules, including the methods of their classes',
+            create_targets=lambda: (lazy_module(),),
+            expected_count=3,
+            background=False,
+        ),
+        dict(
+            description='Modules of classes that reference each other, including nested classes',
+            create_targets=lambda: (cyclic_module(),),
+            expected_count=3,
+            background=False,
+        ),
+        dict(
+            description='In a background thread',
+            create_targets=lambda: (lazy_module(),),
+            expected_count=3,
+            background=True,
+        ),
+    ]
+    def test_warmup(
+        self,
+        description: str,
+        create_targets: Callable,
+        expected_count: int,
+        background: bool,
+    ) -> None:
+        targets = create_targets()
+
+        if background:
+            thread = validargs.warmup(*targets, background=True)
+            thread.join()
+            warmed_up = list(validargs.validargs.lazy_functions(targets))
+        else:
+            warmed_up = validargs.warmup(*targets)
+
+        assert len(warmed_up) == expected_count
+        assert all(hasattr(function, '__validargs_plan__') for function in warmed_up)
+
+    test_warmup_attributes_scenarios = [
+        dict(
+            description='Iterable class attributes are not consumed',
+        ),
+    ]
+
+    def test_warmup_attributes(self, description: str) -> None:
+        class Counter:
+            method = lazy_function()
+            counter = iter(range(3))
+
+        assert validargs.warmup(Counter) == [Counter.method]
+        assert list(Counter.counter) == [0, 1, 2]
@@ -0,0 +1,143 @@
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.exceptions import ValidationError
+from tests import validators
+
+
+def decorated_class(engine: str) -> type:
+    @validated(engine=engine)
+    class TestingClass:
+        def instance_method(self, number_1: int = Validator(validators.positive_number)) -> tuple:
+            return self, number_1
+
+        @classmethod
+        def class_method(cls, number_1: int = Validator(validators.positive_number)) -> tuple:
+            return cls, number_1
+
+        @staticmethod
+        def static_method(number_1: int = Validator(validators.positive_number)) -> tuple:
+            return None, number_1
+
+        def _private_method(self, number_1: int = Validator(validators.positive_number)) -> tuple:
+            return self, number_1
+
+    return TestingClass
+
+
+def decorated_methods(engine: str) -> type:
+    class TestingClass:
+        @validated(engine=engine)
+        def instance_method(self, number_1: int = Validator(validators.positive_number)) -> tuple:
+            return self, number_1
+
+        @validated(engine=engine)
+        @classmethod
+        def class_method(cls, number_1: int = Validator(validators.positive_number)) -> tuple:
+            return cls, number_1
+
+        @validated(engine=engine)
+        @staticmethod
+        def static_method(number_1: int = Validator(validators.positive_number)) -> tuple:
+            return None, number_1
+
+    return TestingClass
+
+
+class TestMethods:
+    """ Tests decorating instance methods, classmethods and staticmethods """
+
+    test_methods_scenarios = [
+        dict(
+            description='Decorated class',
+            create_class=decorated_class,
+        ),
+        dict(
+            description='Decorated methods',
+            create_class=decorated_methods,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_methods(self, description: str, create_class: Callable, engine: str) -> None:
+        testing_class = create_class(engine)
+        instance = testing_class()
+
+        assert instance.instance_method(1) == (instance, 1)
+        assert instance.class_method(1) == (testing_class, 1)
+        assert testing_class.class_method(1) == (testing_class, 1)
+        assert instance.static_method(1) == (None, 1)
+        assert testing_class.static_method(1) == (None, 1)
+
+        for method in (instance.instance_method, instance.class_method, instance.static_method):
+            with pytest.raises(ValidationError):
+                method(-1)
+
+        # The call plan is built once per function and shared by all the instances
+        assert instance.instance_method.__func__ is testing_class().instance_method.__func__
+        assert testing_class.instance_method.check(instance, -1).argument == 'number_1'
+
+    test_private_methods_scenarios = [
+        dict(
+            description='Private methods of a decorated class are not decorated',
+        ),
+    ]
+
+    def test_private_methods(self, description: str) -> None:
+        testing_class = decorated_class('interpreted')
+
+        assert testing_class()._private_method(-1)[1] == -1
+        assert not hasattr(testing_class._private_method, '__validargs_plan__')
+
+
+class TestDecoratedClass:
+    """ Tests the methods that are decorated when a class is decorated """
+
+    test_decorated_class_scenarios = [
+        dict(
+            description='Methods that are already decorated are not decorated again',
+            options={},
+            raised_exception=None,
+        ),
+        dict(
+            description='Lazily decorated methods',
+            options={'lazy': True},
+            raised_exception=None,
+        ),
+        dict(
+            description='Output validators cannot be assigned to a class',
+            options={'returns': Validator(validators.positive_number)},
+            raised_exception=TypeError,
+        ),
+    ]
+
+    def test_decorated_class(self, description: str, options: dict, raised_exception: Exception) -> None:
+        def create_class() -> type:
+            @validated(**options)
+            class TestingClass:
+                @validated(engine='codegen')
+                def decorated_method(self, number_1: int = Validator(validators.positive_number)) -> int:
+                    return number_1
+
+                def undecorated_method(self, number_1: int = Validator(validators.positive_number)) -> int:
+                    return number_1
+
+                def method_without_validators(self, number_1: int) -> int:
+                    return number_1
+
+            return TestingClass
+
+        if raised_exception:
+            with pytest.raises(raised_exception):
+                create_class()
+            return
+
+        testing_class = create_class()
+
+        assert testing_class.decorated_method.__wrapped__.__name__ == 'decorated_method'
+        assert not hasattr(testing_class.decorated_method.__wrapped__, '__wrapped__')
+        assert not hasattr(testing_class.method_without_validators, '__wrapped__')
+        with pytest.raises(ValidationError):
+            testing_class().undecorated_method(-1)
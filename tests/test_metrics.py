@@ -0,0 +1,167 @@
+import asyncio
+from typing import Callable
+
+from validargs.validargs import validated, Validator
+from validargs.exceptions import ValidationError
+from validargs.metrics import MetricsRegistry
+from tests import validators
+
+
+async def async_positive_number(argument: int) -> None:
+    validators.positive_number(argument)
+
+
+def make_function_with_default() -> Callable:
+    """ Creates a new function with the same name and signature on every call """
+    def function_with_default(
+        number_1: int = Validator(validators.positive_number),
+        string_1: str = Validator(validators.short_str, default_value='string 2'),
+    ) -> None:
+        pass
+
+    return function_with_default
+
+
+class TestMetrics:
+    """ Tests the instrumentation of decorated functions """
+
+    def arguments_with_validators(
+        number_1: int = Validator(validators.positive_number),
+        string_1: str = Validator(validators.short_str, default_value='string 1'),
+        boolean: bool = False,
+    ) -> None:
+        pass
+
+    async def async_arguments_with_validators(
+        number_1: int = Validator(async_positive_number),
+        string_1: str = Validator(validators.short_str, default_value='string 1'),
+        boolean: bool = False,
+    ) -> None:
+        pass
+
+    test_metrics_scenarios = [
+        dict(
+            testing_function=arguments_with_validators,
+            description='Calls, validations and failures are recorded',
+            engine='interpreted',
+            arguments=[1, 2, -3, 4],
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Calls, validations and failures are recorded (codegen)',
+            engine='codegen',
+            arguments=[1, 2, -3, 4],
+        ),
+        dict(
+            testing_function=async_arguments_with_validators,
+            description='Calls, validations and failures are recorded (async)',
+            engine='interpreted',
+            arguments=[1, 2, -3, 4],
+        ),
+    ]
+    def test_metrics(
+        self,
+        description: str,
+        testing_function: Callable,
+        engine: str,
+        arguments: list,
+    ) -> None:
+        registry = MetricsRegistry()
+        wrapped = validated(testing_function, engine=engine, metrics=registry)
+
+        for argument in arguments:
+            try:
+                result = wrapped(argument)
+                if asyncio.iscoroutine(result):
+                    asyncio.run(result)
+            except ValidationError:
+                pass
+
+        snapshot = registry.snapshot()
+        function_snapshot = snapshot[f"{testing_function.__module__}.{testing_function.__qualname__}"]
+
+        assert function_snapshot['calls'] == len(arguments)
+        assert sorted(function_snapshot['arguments']) == ['number_1', 'string_1']
+
+        number_snapshot = function_snapshot['arguments']['number_1']
+        assert number_snapshot['validations'] == len(arguments)
+        assert number_snapshot['failures'] == 1
+        assert sum(number_snapshot['duration_buckets'].values()) == len(arguments)
+
+        # The default value is validated only once
+        string_snapshot = function_snapshot['arguments']['string_1']
+        assert (string_snapshot['validations'], string_snapshot['failures']) == (1, 0)
+
+    test_shared_plan_scenarios = [
+        dict(
+            function_factory=make_function_with_default,
+            description='Default values are instrumented in functions sharing a plan',
+            arguments=[5, 6],
+        ),
+    ]
+    def test_shared_plan(
+        self,
+        description: str,
+        function_factory: Callable,
+        arguments: list,
+    ) -> None:
+        # The default value is validated through the plan of the function without metrics first
+        validated(function_factory())(arguments[0])
+
+        registry = MetricsRegistry()
+        wrapped = validated(function_factory(), metrics=registry)
+        for argument in arguments:
+            wrapped(argument)
+
+        function_snapshot = next(iter(registry.snapshot().values()))
+        string_snapshot = function_snapshot['arguments']['string_1']
+        assert (string_snapshot['validations'], string_snapshot['failures']) == (1, 0)
+
+
+class TestPrometheusExport:
+    """ Tests the export of the metrics in the Prometheus text format """
+
+    def arguments_with_validators(
+        number_1: int = Validator(validators.positive_number),
+    ) -> None:
+        pass
+
+    test_prometheus_scenarios = [
+        dict(
+            testing_function=arguments_with_validators,
+            description='Counters and histograms are exported',
+            arguments=[1, -1],
+            expected_lines=[
+                '# TYPE validargs_calls_total counter',
+                'validargs_calls_total{function="tests.test_metrics.TestPrometheusExport.arguments_with_validators"} 2',
+                'validargs_validation_failures_total{function="tests.test_metrics.TestPrometheusExport.arguments_with_validators",argument="number_1"} 1',
+                '# TYPE validargs_validation_duration_seconds histogram',
+                'validargs_validation_duration_seconds_bucket{function="tests.test_metrics.TestPrometheusExport.arguments_with_validators",argument="number_1",le="+Inf"} 2',
+                'validargs_validation_duration_seconds_count{function="tests.test_metrics.TestPrometheusExport.arguments_with_validators",argument="number_1"} 2',
+            ],
+        ),
+    ]
+    def test_prometheus(
+        self,
+        description: str,
+        testing_function: Callable,
+        arguments: list,
+        expected_lines: list,
+        tmp_path,
+    ) -> None:
+        registry = MetricsRegistry()
+        wrapped = validated(testing_function, metrics=registry)
+
+        for argument in arguments:
+            try:
+                wrapped(argument)
+            except ValidationError:
+                pass
+
+        text = registry.to_prometheus()
+        for line in expected_lines:
+            assert line in text.splitlines()
+
+        path = tmp_path / 'validargs.prom'
+        registry.write_prometheus(str(path))
+        assert path.read_text() == text
@@ -0,0 +1,181 @@
+import asyncio
+from typing import AsyncIterator, Iterator
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.exceptions import ElementValidationError, ValidationError
+
+
+class TestReturns:
+    """ Tests the validation of return values """
+
+    test_returns_scenarios = [
+        dict(
+            description='Valid return value',
+            number_1=10,
+            raised_exception=None,
+        ),
+        dict(
+            description='Invalid return value',
+            number_1=1,
+            raised_exception=ValidationError,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_returns(self, description, number_1, raised_exception, engine):
+        @validated(engine=engine, returns=Validator.range(min=0))
+        def testing_function(number_1: int = Validator.range(min=0)) -> int:
+            return number_1 - 5
+
+        @validated(engine=engine, returns=Validator.range(min=0))
+        async def async_testing_function(number_1: int) -> int:
+            return number_1 - 5
+
+        if raised_exception:
+            with pytest.raises(raised_exception) as exc_info:
+                testing_function(number_1)
+            assert type(exc_info.value.__cause__) is ValueError
+
+            with pytest.raises(raised_exception):
+                asyncio.run(async_testing_function(number_1))
+        else:
+            assert testing_function(number_1) == number_1 - 5
+            assert asyncio.run(async_testing_function(number_1)) == number_1 - 5
+
+
+class TestYields:
+    """ Tests the validation of yielded values """
+
+    test_yields_scenarios = [
+        dict(
+            description='Valid yielded values',
+            numbers=[2, 1, 0],
+            expected_invalid_index=None,
+        ),
+        dict(
+            description='Invalid yielded value',
+            numbers=[2, 1, -1, 0],
+            expected_invalid_index=2,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_yields(self, description, numbers, expected_invalid_index, engine):
+        @validated(engine=engine, yields=Validator.range(min=0), returns=Validator.instance_of(int))
+        def testing_function(numbers: list = Validator.length(min=1)) -> Iterator[int]:
+            yield from numbers
+            return len(numbers)
+
+        @validated(engine=engine, yields=Validator.range(min=0))
+        async def async_testing_function(numbers: list) -> AsyncIterator[int]:
+            for number in numbers:
+                yield number
+
+        async def consume() -> list:
+            return [number async for number in async_testing_function(numbers)]
+
+        if expected_invalid_index is not None:
+            for consume_function in (lambda: list(testing_function(numbers)), lambda: asyncio.run(consume())):
+                with pytest.raises(ValidationError) as exc_info:
+                    consume_function()
+                assert type(exc_info.value.__cause__) is ElementValidationError
+                assert exc_info.value.__cause__.indices == [expected_invalid_index]
+        else:
+            assert list(testing_function(numbers)) == numbers
+            assert asyncio.run(consume()) == numbers
+
+        # The arguments are validated when the generator function is called
+        with pytest.raises(ValidationError):
+            testing_function([])
+
+
+class TestGeneratorProtocol:
+    """ Tests that validating generators forward sent values and thrown exceptions """
+
+    test_generator_protocol_scenarios = [
+        dict(
+            description='Sent value is yielded back',
+            sent_value=5,
+            expected_value=5,
+            raised_exception=None,
+        ),
+        dict(
+            description='Sent value is yielded back and is invalid',
+            sent_value=-5,
+            expected_value=None,
+            raised_exception=ValidationError,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_generator_protocol(self, description, sent_value, expected_value, raised_exception, engine):
+        @validated(engine=engine, yields=Validator.range(min=0), returns=Validator.range(min=0))
+        def testing_function() -> Iterator[int]:
+            value = 0
+            while True:
+                try:
+                    value = yield value
+                except KeyError:
+                    return 1
+
+        generator = testing_function()
+        assert next(generator) == 0
+
+        if raised_exception:
+            with pytest.raises(raised_exception):
+                generator.send(sent_value)
+        else:
+            assert generator.send(sent_value) == expected_value
+
+            with pytest.raises(StopIteration) as exc_info:
+                generator.throw(KeyError())
+            assert exc_info.value.value == 1
+
+
+class TestOutputValidatorErrors:
+    """ Tests output validators that do not match the kind of the decorated function """
+
+    def regular_function() -> None:
+        pass
+
+    def generator_function() -> Iterator[int]:
+        yield 1
+
+    async def async_generator_function() -> AsyncIterator[int]:
+        yield 1
+
+    async def async_validator(value: int) -> None:
+        pass
+
+    test_errors_scenarios = [
+        dict(
+            description='Yields validator of a regular function',
+            testing_function=regular_function,
+            returns=None,
+            yields=Validator.range(min=0),
+        ),
+        dict(
+            description='Returns validator of an async generator function',
+            testing_function=async_generator_function,
+            returns=Validator.range(min=0),
+            yields=None,
+        ),
+        dict(
+            description='Async yields validator of a generator function',
+            testing_function=generator_function,
+            returns=None,
+            yields=Validator(async_validator),
+        ),
+        dict(
+            description='Async returns validator of a regular function',
+            testing_function=regular_function,
+            returns=Validator(async_validator),
+            yields=None,
+        ),
+    ]
+
+    def test_errors(self, description, testing_function, returns, yields):
+        with pytest.raises(TypeError):
+            validated(testing_function, returns=returns, yields=yields)
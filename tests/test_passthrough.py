@@ -0,0 +1,97 @@
+from typing import Callable
+
+from validargs.validargs import validated, Validator, passthrough_wrapper
+from tests import validators
+
+
+def returning_arguments(
+    number_1: list,
+    /,
+    number_2: list,
+    *,
+    string_1: list,
+) -> tuple:
+    return number_1, number_2, string_1
+
+
+class TestPassthrough:
+    """ Tests that functions without validators get a pass-through wrapper """
+
+    def arguments_without_validators(
+        number_1: int,
+        /,
+        number_2: int = 2,
+        *,
+        string_1: str,
+    ) -> None:
+        pass
+
+    def arguments_with_validators(
+        number_1: int = Validator(validators.positive_number),
+    ) -> None:
+        pass
+
+    test_wrapper_scenarios = [
+        dict(
+            testing_function=arguments_without_validators,
+            description='Functions without validators get a pass-through wrapper (interpreted)',
+            engine='interpreted',
+            expect_passthrough=True,
+        ),
+        dict(
+            testing_function=arguments_without_validators,
+            description='Functions without validators get a pass-through wrapper (codegen)',
+            engine='codegen',
+            expect_passthrough=True,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Functions with validators do not get a pass-through wrapper',
+            engine='interpreted',
+            expect_passthrough=False,
+        ),
+    ]
+    def test_wrapper(
+        self,
+        description: str,
+        testing_function: Callable,
+        engine: str,
+        expect_passthrough: bool,
+    ) -> None:
+        wrapped = validated(engine=engine)(testing_function)
+
+        assert (wrapped.__code__ is passthrough_wrapper(testing_function, wrapped.__validargs_plan__).__code__) == expect_passthrough
+
+    test_forwarding_scenarios = [
+        dict(
+            testing_function=returning_arguments,
+            description='Pass-through wrapper forwards the arguments unchanged (interpreted)',
+            engine='interpreted',
+            positional_arguments=[[1], [2]],
+            keyword_arguments=dict(string_1=['string 1']),
+        ),
+        dict(
+            testing_function=returning_arguments,
+            description='Pass-through wrapper forwards the arguments unchanged (codegen)',
+            engine='codegen',
+            positional_arguments=[[3], [4]],
+            keyword_arguments=dict(string_1=['string 2']),
+        ),
+    ]
+    def test_forwarding(
+        self,
+        description: str,
+        testing_function: Callable,
+        engine: str,
+        positional_arguments: list,
+        keyword_arguments: dict,
+    ) -> None:
+        wrapped = validated(engine=engine)(testing_function)
+
+        assert wrapped.__code__ is passthrough_wrapper(testing_function, wrapped.__validargs_plan__).__code__
+
+        result = wrapped(*positional_arguments, **keyword_arguments)
+
+        # The very same objects reach the decorated function, with no copies in between
+        assert all(forwarded is provided for forwarded, provided in zip(result[:-1], positional_arguments))
+        assert result[-1] is keyword_arguments['string_1']
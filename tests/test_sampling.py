@@ -0,0 +1,146 @@
+import asyncio
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.exceptions import ValidationError
+from validargs.sampling import Sampler, global_sampler
+from tests import validators
+
+
+class TestSampling:
+    """ Tests validating only a sample of the calls """
+
+    def arguments_with_validators(
+        number_1: int = Validator(validators.positive_number),
+        number_2: int = Validator(validators.positive_number, default_value=2),
+    ) -> dict:
+        return dict(number_1=number_1, number_2=number_2)
+
+    async def async_arguments_with_validators(
+        number_1: int = Validator(validators.positive_number),
+        number_2: int = Validator(validators.positive_number, default_value=2),
+    ) -> dict:
+        return dict(number_1=number_1, number_2=number_2)
+
+    test_sampling_scenarios = [
+        dict(
+            testing_function=arguments_with_validators,
+            description='Validate 1 in every 3 calls',
+            sampler=Sampler(every=3),
+            engine='interpreted',
+            calls=7,
+            expected_failures=3,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Validate 1 in every 3 calls (codegen)',
+            sampler=Sampler(every=3),
+            engine='codegen',
+            calls=7,
+            expected_failures=3,
+        ),
+        dict(
+            testing_function=async_arguments_with_validators,
+            description='Validate 1 in every 3 calls (async)',
+            sampler=Sampler(every=3),
+            engine='interpreted',
+            calls=7,
+            expected_failures=3,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Validate none of the calls',
+            sampler=Sampler(rate=0),
+            engine='interpreted',
+            calls=5,
+            expected_failures=0,
+        ),
+        dict(
+            testing_function=arguments_with_validators,
+            description='Validate all the calls',
+            sampler=Sampler(rate=1),
+            engine='interpreted',
+            calls=5,
+            expected_failures=5,
+        ),
+    ]
+    def test_sampling(
+        self,
+        description: str,
+        testing_function: Callable,
+        sampler: Sampler,
+        engine: str,
+        calls: int,
+        expected_failures: int,
+    ) -> None:
+        wrapped = validated(testing_function, engine=engine, sampler=sampler)
+
+        failures = 0
+        for _ in range(calls):
+            try:
+                received_arguments = wrapped(-1)
+                if asyncio.iscoroutine(received_arguments):
+                    received_arguments = asyncio.run(received_arguments)
+            except ValidationError:
+                failures += 1
+            else:
+                # Calls that are not validated are still assigned the default values
+                assert received_arguments == dict(number_1=-1, number_2=2)
+
+        assert failures == expected_failures
+        assert (sampler.sampled, sampler.skipped) == (expected_failures, calls - expected_failures)
+
+    test_global_sampler_scenarios = [
+        dict(
+            testing_function=arguments_with_validators,
+            description='Functions share the global sampler',
+            every=2,
+            calls=4,
+            expected_failures=2,
+        ),
+    ]
+    def test_global_sampler(
+        self,
+        description: str,
+        testing_function: Callable,
+        every: int,
+        calls: int,
+        expected_failures: int,
+    ) -> None:
+        wrapped = validated(testing_function, sampler=global_sampler)
+
+        global_sampler.configure(every=every)
+        global_sampler.reset()
+        try:
+            failures = 0
+            for _ in range(calls):
+                try:
+                    wrapped(-1)
+                except ValidationError:
+                    failures += 1
+
+            assert failures == expected_failures
+            assert (global_sampler.sampled, global_sampler.skipped) == (expected_failures, calls - expected_failures)
+        finally:
+            global_sampler.configure()
+            global_sampler.reset()
+
+
+class TestSamplerConfiguration:
+    """ Tests invalid sampler configurations """
+
+    test_configuration_scenarios = [
+        dict(description='Both every and rate', every=2, rate=0.5),
+        dict(description='Every is not positive', every=0, rate=None),
+        dict(description='Rate is greater than 1', every=None, rate=1.5),
+    ]
+    def test_configuration(
+        self,
+        description: str,
+        every: int,
+        rate: float,
+    ) -> None:
+        with pytest.raises(ValueError):
+            Sampler(every=every, rate=rate)
@@ -0,0 +1,149 @@
+import threading
+import time
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.exceptions import MultipleValidationError, ValidationError
+from tests import validators
+
+
+def slow_positive_number(argument: int) -> None:
+    time.sleep(0.05)
+    validators.positive_number(argument)
+
+
+class TestThreadedValidation:
+    """ Tests running the validators of a call on a thread pool """
+
+    @validated(threaded=True)
+    def arguments_with_blocking_validators(
+        number_1: int = Validator(slow_positive_number, blocking=True),
+        number_2: int = Validator(slow_positive_number, blocking=True),
+        number_3: int = Validator(slow_positive_number, blocking=True, default_value=3),
+        *,
+        boolean: bool = Validator(validators.boolean, default_value=False),
+    ) -> dict:
+        return dict(number_1=number_1, number_2=number_2, number_3=number_3, boolean=boolean)
+
+    test_arguments_scenarios = [
+        dict(
+            testing_function=arguments_with_blocking_validators,
+            description='All arguments are valid',
+            positional_arguments=[1, 2, 3],
+            keyword_arguments={'boolean': True},
+            expected_received_arguments=dict(number_1=1, number_2=2, number_3=3, boolean=True),
+            expected_failed_arguments=None,
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_blocking_validators,
+            description='Missing arguments are assigned the default values',
+            positional_arguments=[1, 2],
+            keyword_arguments={},
+            expected_received_arguments=dict(number_1=1, number_2=2, number_3=3, boolean=False),
+            expected_failed_arguments=None,
+            raised_exception=None,
+        ),
+        dict(
+            testing_function=arguments_with_blocking_validators,
+            description='One blocking argument is invalid',
+            positional_arguments=[1, -2, 3],
+            keyword_arguments={},
+            expected_received_arguments=None,
+            expected_failed_arguments=['number_2'],
+            raised_exception=ValidationError,
+        ),
+        dict(
+            testing_function=arguments_with_blocking_validators,
+            description='Failures of blocking and inline arguments are aggregated',
+            positional_arguments=[-1, 2, -3],
+            keyword_arguments={'boolean': 1},
+            expected_received_arguments=None,
+            expected_failed_arguments=['number_1', 'number_3', 'boolean'],
+            raised_exception=MultipleValidationError,
+        ),
+        dict(
+            testing_function=arguments_with_blocking_validators,
+            description='Missing argument without a default value',
+            positional_arguments=[1],
+            keyword_arguments={},
+            expected_received_arguments=None,
+            expected_failed_arguments=None,
+            raised_exception=TypeError,
+        ),
+    ]
+    def test_arguments(
+        self,
+        description: str,
+        testing_function: Callable,
+        positional_arguments: list,
+        keyword_arguments: dict,
+        expected_received_arguments: dict,
+        expected_failed_arguments: list,
+        raised_exception: Exception,
+    ) -> None:
+
+        if raised_exception:
+            with pytest.raises(raised_exception) as exc_info:
+                testing_function(*positional_arguments, **keyword_arguments)
+            if raised_exception is MultipleValidationError:
+                assert list(exc_info.value.errors) == expected_failed_arguments
+        else:
+            received_arguments = testing_function(*positional_arguments, **keyword_arguments)
+            assert received_arguments == expected_received_arguments
+
+    test_concurrency_scenarios = [
+        dict(
+            testing_function=arguments_with_blocking_validators,
+            description='Blocking validators of a single call run concurrently',
+            positional_arguments=[1, 2, 3],
+            max_duration=0.14,
+        ),
+    ]
+    def test_concurrency(
+        self,
+        description: str,
+        testing_function: Callable,
+        positional_arguments: list,
+        max_duration: float,
+    ) -> None:
+        start = time.perf_counter()
+        testing_function(*positional_arguments)
+
+        assert time.perf_counter() - start < max_duration
+
+
+class TestThreadedInlineFallback:
+    """ Tests that cheap validators run inline """
+
+    def record_thread(argument: int) -> None:
+        TestThreadedInlineFallback.threads.append(threading.current_thread())
+
+    threads = []
+
+    @validated(threaded=True)
+    def arguments_with_one_blocking_validator(
+        number_1: int = Validator(record_thread, blocking=True),
+        number_2: int = Validator(record_thread),
+    ) -> None:
+        pass
+
+    test_inline_scenarios = [
+        dict(
+            testing_function=arguments_with_one_blocking_validator,
+            description='A single blocking validator runs inline',
+            positional_arguments=[1, 2],
+        ),
+    ]
+    def test_inline(
+        self,
+        description: str,
+        testing_function: Callable,
+        positional_arguments: list,
+    ) -> None:
+        self.threads.clear()
+        testing_function(*positional_arguments)
+
+        assert self.threads == [threading.current_thread()] * 2
@@ -0,0 +1,248 @@
+import asyncio
+import json
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.cache import ValidationCache
+from validargs.exceptions import ValidationError
+from validargs.sampling import Sampler
+from tests import validators
+
+
+class Parser:
+    """ A transforming validator that counts how many times it parses """
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, argument: str) -> Any:
+        self.calls += 1
+        return json.loads(argument)
+
+
+def transformed_function(parser: Parser, engine: str, **kwargs: Any) -> Callable:
+    @validated(engine=engine, **kwargs)
+    def testing_function(
+        document: dict = Validator(parser, transform=True),
+        /,
+        options: dict = Validator(parser, transform=True, default_value={}),
+        *,
+        flag: bool = Validator(lambda argument: argument == 'yes', transform=True, default_value=False),
+    ) -> tuple:
+        return document, options, flag
+
+    return testing_function
+
+
+class TestTransform:
+    """ Tests transforming validators, whose value is passed in the decorated function """
+
+    test_transform_scenarios = [
+        dict(
+            description='Transformed arguments',
+            positional_arguments=['{"a": 1}', '[1, 2]'],
+            keyword_arguments={'flag': 'no'},
+            expected_received_arguments=({'a': 1}, [1, 2], False),
+            expected_parse_count=2,
+            raised_exception=None,
+        ),
+        dict(
+            description='Default values are passed as they are',
+            positional_arguments=['{"a": 1}'],
+            keyword_arguments={},
+            expected_received_arguments=({'a': 1}, {}, False),
+            expected_parse_count=1,
+            raised_exception=None,
+        ),
+        dict(
+            description='Transformed value that is False',
+            positional_arguments=['{"a": 1}'],
+            keyword_arguments={'flag': 'maybe'},
+            expected_received_arguments=({'a': 1}, {}, False),
+            expected_parse_count=1,
+            raised_exception=None,
+        ),
+        dict(
+            description='Argument that cannot be transformed',
+            positional_arguments=['{"a": '],
+            keyword_arguments={},
+            expected_received_arguments=None,
+            expected_parse_count=1,
+            raised_exception=ValidationError,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    @pytest.mark.parametrize('options', [{}, {'threaded': True}, {'sampler': Sampler(every=2)}])
+    def test_transform(
+        self, description, positional_arguments, keyword_arguments, expected_received_arguments,
+        expected_parse_count, raised_exception, engine, options,
+    ):
+        parser = Parser()
+        testing_function = transformed_function(parser, engine, **options)
+
+        # Sampled functions transform the arguments of the calls that are not sampled too
+        for call in range(2):
+            if raised_exception:
+                with pytest.raises(raised_exception):
+                    testing_function(*positional_arguments, **keyword_arguments)
+            else:
+                assert testing_function(*positional_arguments, **keyword_arguments) == expected_received_arguments
+            assert parser.calls == expected_parse_count * (call + 1)
+
+        result = testing_function.check(*positional_arguments, **keyword_arguments)
+        assert result.passed is (raised_exception is None)
+
+    test_async_transform_scenarios = test_transform_scenarios
+
+    def test_async_transform(
+        self, description, positional_arguments, keyword_arguments, expected_received_arguments,
+        expected_parse_count, raised_exception,
+    ):
+        parser = Parser()
+
+        @validated
+        async def testing_function(document: dict = Validator(parser, transform=True)) -> dict:
+            return document
+
+        if raised_exception:
+            with pytest.raises(raised_exception):
+                asyncio.run(testing_function(positional_arguments[0]))
+        else:
+            assert asyncio.run(testing_function(positional_arguments[0])) == expected_received_arguments[0]
+        assert parser.calls == 1
+
+
+class TestTransformOrder:
+    """ Tests that transforming validators run in signature order with the rest of the validators """
+
+    test_transform_order_scenarios = [
+        dict(
+            description='Invalid argument before a transformed argument',
+            positional_arguments=[-1, '{"a": 1}'],
+            expected_argument='number_1',
+            expected_parse_count=0,
+        ),
+        dict(
+            description='Invalid argument after a transformed argument',
+            positional_arguments=[1, '{"a": 1}', -2],
+            expected_argument='number_2',
+            expected_parse_count=1,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    @pytest.mark.parametrize('options', [{}, {'threaded': True}])
+    def test_transform_order(
+        self, description, positional_arguments, expected_argument, expected_parse_count, engine, options,
+    ):
+        parser = Parser()
+
+        @validated(engine=engine, **options)
+        def testing_function(
+            number_1: int = Validator(validators.positive_number),
+            document: dict = Validator(parser, transform=True),
+            number_2: int = Validator(validators.positive_number, default_value=1),
+        ) -> tuple:
+            return number_1, document, number_2
+
+        with pytest.raises(ValidationError, match=f"'{expected_argument}'"):
+            testing_function(*positional_arguments)
+        assert parser.calls == expected_parse_count
+        assert testing_function.check(*positional_arguments).argument == expected_argument
+
+
+class TestTransformOutputs:
+    """ Tests transforming validators of return values, yielded values and the elements of iterators """
+
+    test_transform_outputs_scenarios = [
+        dict(
+            description='Outputs that are transformed',
+            values=['1', '2'],
+            expected_values=[1, 2],
+            raised_exception=None,
+        ),
+        dict(
+            description='Output that cannot be transformed',
+            values=['1', 'x'],
+            expected_values=None,
+            raised_exception=ValidationError,
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_transform_outputs(self, description, values, expected_values, raised_exception, engine):
+        @validated(engine=engine, returns=Validator(int, transform=True))
+        def return_function(values: list) -> str:
+            return values[-1]
+
+        @validated(engine=engine, returns=Validator(int, transform=True))
+        async def async_return_function(values: list) -> str:
+            return values[-1]
+
+        @validated(engine=engine, yields=Validator(int, transform=True), returns=Validator(int, transform=True))
+        def generator_function(values: list) -> Iterator[str]:
+            yield from values
+            return values[-1]
+
+        @validated(engine=engine, yields=Validator(int, transform=True))
+        async def async_generator_function(values: list) -> AsyncIterator[str]:
+            for value in values:
+                yield value
+
+        @validated(engine=engine)
+        def iterator_function(values: Iterable[int] = Validator.each(Validator(int, transform=True))) -> list:
+            return list(values)
+
+        def consume_generator() -> tuple:
+            generator = generator_function(values)
+            consumed = []
+            while True:
+                try:
+                    consumed.append(next(generator))
+                except StopIteration as stop:
+                    return consumed, stop.value
+
+        async def consume_async_generator() -> list:
+            return [value async for value in async_generator_function(values)]
+
+        calls = [
+            (lambda: return_function(values), expected_values and expected_values[-1]),
+            (lambda: asyncio.run(async_return_function(values)), expected_values and expected_values[-1]),
+            (consume_generator, expected_values and (expected_values, expected_values[-1])),
+            (lambda: asyncio.run(consume_async_generator()), expected_values),
+            (lambda: iterator_function(values), expected_values),
+        ]
+
+        for call, expected_result in calls:
+            if raised_exception:
+                with pytest.raises(raised_exception):
+                    call()
+            else:
+                assert call() == expected_result
+
+
+class TestTransformErrors:
+    """ Tests the validators that cannot be transforming """
+
+    async def async_parser(argument: str) -> dict:
+        return json.loads(argument)
+
+    test_errors_scenarios = [
+        dict(
+            description='Cached transforming validator',
+            validator_func=json.loads,
+            options={'cache': ValidationCache()},
+        ),
+        dict(
+            description='Async transforming validator',
+            validator_func=async_parser,
+            options={},
+        ),
+    ]
+
+    def test_errors(self, description, validator_func, options):
+        with pytest.raises(TypeError):
+            Validator(validator_func, transform=True, **options)
@@ -0,0 +1,161 @@
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.exceptions import ElementValidationError, ValidationError
+from tests import validators
+
+
+def variadic_function(engine: str) -> Callable:
+    @validated(
+        engine=engine,
+        variadic={
+            'numbers': Validator(validators.positive_number),
+            'strings': Validator(validators.short_str),
+        },
+    )
+    def testing_function(
+        boolean: bool,
+        /,
+        number_1: int = Validator(validators.positive_number, default_value=1),
+        *numbers: int,
+        string_1: str = 'abc',
+        **strings: str,
+    ) -> dict:
+        received_arguments = dict(
+            boolean=boolean, number_1=number_1, numbers=numbers, string_1=string_1, strings=strings,
+        )
+
+        return received_arguments
+
+    return testing_function
+
+
+class TestVariadicArguments:
+    """ Tests *args and **kwargs, with validators of their elements """
+
+    test_arguments_scenarios = [
+        dict(
+            description='No variadic arguments are provided',
+            positional_arguments=[False],
+            keyword_arguments={},
+            expected_received_arguments=dict(boolean=False, number_1=1, numbers=(), string_1='abc', strings={}),
+            expected_invalid_index=None,
+        ),
+        dict(
+            description='Valid variadic arguments are provided',
+            positional_arguments=[False, 2, 3, 4],
+            keyword_arguments={'string_1': 'def', 'string_2': 'ghi', 'string_3': 'jkl'},
+            expected_received_arguments=dict(
+                boolean=False, number_1=2, numbers=(3, 4), string_1='def',
+                strings={'string_2': 'ghi', 'string_3': 'jkl'},
+            ),
+            expected_invalid_index=None,
+        ),
+        dict(
+            description='Keyword argument with the name of a POSITIONAL_ONLY parameter',
+            positional_arguments=[False],
+            keyword_arguments={'boolean': 'abc'},
+            expected_received_arguments=dict(
+                boolean=False, number_1=1, numbers=(), string_1='abc', strings={'boolean': 'abc'},
+            ),
+            expected_invalid_index=None,
+        ),
+        dict(
+            description='Invalid positional element',
+            positional_arguments=[False, 2, 3, -4, 5],
+            keyword_arguments={},
+            expected_received_arguments=None,
+            expected_invalid_index=1,
+        ),
+        dict(
+            description='Invalid keyword element',
+            positional_arguments=[False],
+            keyword_arguments={'string_2': 'abc', 'string_3': 'abcdefghijklmnopqrstuvwxyz'},
+            expected_received_arguments=None,
+            expected_invalid_index='string_3',
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_arguments(
+        self, description, positional_arguments, keyword_arguments, expected_received_arguments,
+        expected_invalid_index, engine,
+    ):
+        testing_function = variadic_function(engine)
+
+        if expected_invalid_index is not None:
+            with pytest.raises(ValidationError) as exc_info:
+                testing_function(*positional_arguments, **keyword_arguments)
+            assert type(exc_info.value.__cause__) is ElementValidationError
+            assert exc_info.value.__cause__.indices == [expected_invalid_index]
+
+            result = testing_function.check(*positional_arguments, **keyword_arguments)
+            assert not result
+            assert result.reason.indices == [expected_invalid_index]
+        else:
+            received_arguments = testing_function(*positional_arguments, **keyword_arguments)
+            assert received_arguments == expected_received_arguments
+            assert testing_function.check(*positional_arguments, **keyword_arguments)
+
+
+class TestVariadicWithoutValidators:
+    """ Tests decorating functions with variadic parameters without validators """
+
+    test_without_validators_scenarios = [
+        dict(
+            description='Variadic arguments are provided',
+            positional_arguments=['def', 1, 2],
+            keyword_arguments={'string_1': 'abc'},
+        ),
+        dict(
+            description='No arguments',
+            positional_arguments=[],
+            keyword_arguments={},
+        ),
+    ]
+
+    @pytest.mark.parametrize('engine', ['interpreted', 'codegen'])
+    def test_without_validators(self, description, positional_arguments, keyword_arguments, engine):
+        @validated(engine=engine)
+        def testing_function(
+            string_2: str = Validator(validators.short_str, default_value='abc'),
+            *args,
+            **kwargs,
+        ) -> tuple:
+            return string_2, args, kwargs
+
+        expected_string_2 = positional_arguments[0] if positional_arguments else 'abc'
+
+        assert testing_function(*positional_arguments, **keyword_arguments) == (
+            expected_string_2, tuple(positional_arguments[1:]), keyword_arguments,
+        )
+
+
+class TestVariadicErrors:
+    """ Tests invalid validators of variadic parameters """
+
+    test_errors_scenarios = [
+        dict(
+            description='Unknown variadic parameter',
+            variadic={'numbers': Validator(validators.positive_number)},
+            raised_exception=ValueError,
+        ),
+        dict(
+            description='Named parameter instead of a variadic one',
+            variadic={'number_1': Validator(validators.positive_number)},
+            raised_exception=ValueError,
+        ),
+        dict(
+            description='Transforming validator of the elements',
+            variadic={'args': Validator(int, transform=True)},
+            raised_exception=TypeError,
+        ),
+    ]
+
+    def test_errors(self, description, variadic, raised_exception):
+        with pytest.raises(raised_exception):
+            @validated(variadic=variadic)
+            def testing_function(number_1: int, *args) -> None:
+                pass
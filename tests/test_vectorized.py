@@ -0,0 +1,133 @@
+from typing import Callable
+
+import pytest
+
+from validargs.validargs import validated, Validator
+from validargs.exceptions import ElementValidationError, ValidationError
+from validargs.vectorized import VectorizedValidator
+from tests import validators
+
+numpy = pytest.importorskip('numpy')
+
+
+def positive_numbers(array):
+    return array > 0
+
+
+def finite_numbers(array):
+    return numpy.isfinite(array)
+
+
+def float_numbers(array):
+    return array.dtype.kind == 'f'
+
+
+class TestVectorizedValidators:
+    """ Tests validators that check whole arrays in one pass """
+
+    @validated
+    def array_argument(
+        numbers: list = VectorizedValidator(positive_numbers),
+        /,
+        *,
+        floats: list = VectorizedValidator(float_numbers, default_value=numpy.zeros(1)),
+        matrix: list = VectorizedValidator(finite_numbers, default_value=numpy.ones((2, 2))),
+    ) -> None:
+        pass
+
+    test_arguments_scenarios = [
+        dict(
+            testing_function=array_argument,
+            description='Valid arrays',
+            positional_arguments=[numpy.arange(1, 10)],
+            keyword_arguments={'floats': numpy.ones(3)},
+            expected_indices=None,
+        ),
+        dict(
+            testing_function=array_argument,
+            description='Valid list converted to array',
+            positional_arguments=[[1, 2, 3]],
+            keyword_arguments={},
+            expected_indices=None,
+        ),
+        dict(
+            testing_function=array_argument,
+            description='Invalid elements of a one-dimensional array',
+            positional_arguments=[numpy.array([1, -2, 3, 0])],
+            keyword_arguments={},
+            expected_indices=[1, 3],
+        ),
+        dict(
+            testing_function=array_argument,
+            description='Invalid elements of a two-dimensional array',
+            positional_arguments=[[1]],
+            keyword_arguments={'matrix': numpy.array([[1.0, numpy.nan], [numpy.inf, 1.0]])},
+            expected_indices=[(0, 1), (1, 0)],
+        ),
+        dict(
+            testing_function=array_argument,
+            description='A single boolean applies to all the elements',
+            positional_arguments=[[1]],
+            keyword_arguments={'floats': numpy.arange(2)},
+            expected_indices=[0, 1],
+        ),
+    ]
+    def test_arguments(
+        self,
+        description: str,
+        testing_function: Callable,
+        positional_arguments: list,
+        keyword_arguments: dict,
+        expected_indices: list,
+    ) -> None:
+
+        if expected_indices:
+            with pytest.raises(ValidationError) as exc_info:
+                testing_function(*positional_arguments, **keyword_arguments)
+            assert isinstance(exc_info.value.__cause__, ElementValidationError)
+            assert exc_info.value.__cause__.indices == expected_indices
+        else:
+            testing_function(*positional_arguments, **keyword_arguments)
+
+
+class TestVectorizedBatchValidation:
+    """ Tests vectorized validators in batch validation """
+
+    @validated
+    def scalar_arguments(
+        number_1: int = VectorizedValidator(positive_numbers),
+        number_2: int = Validator(validators.positive_number, default_value=1),
+    ) -> None:
+        pass
+
+    test_validate_many_scenarios = [
+        dict(
+            testing_function=scalar_arguments,
+            description='Vectorized validator applied to a whole column',
+            rows=None,
+            columns={'number_1': numpy.array([1, -1, 2, 0]), 'number_2': [1, 1, -1, 1]},
+            expected_mask=[1, 0, 0, 0],
+            expected_errors=[(1, 'number_1'), (2, 'number_2'), (3, 'number_1')],
+        ),
+        dict(
+            testing_function=scalar_arguments,
+            description='Vectorized validator applied to the values of rows',
+            rows=[(1,), (-1,), (2, -1)],
+            columns=None,
+            expected_mask=[1, 0, 0],
+            expected_errors=[(1, 'number_1'), (2, 'number_2')],
+        ),
+    ]
+    def test_validate_many(
+        self,
+        description: str,
+        testing_function: Callable,
+        rows: list,
+        columns: dict,
+        expected_mask: list,
+        expected_errors: list,
+    ) -> None:
+        result = testing_function.validate_many(rows, columns=columns)
+
+        assert list(result.mask) == expected_mask
+        assert [(error.index, error.argument) for error in result.errors] == expected_errors
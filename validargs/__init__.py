@@ -1 +1,4 @@
 __version__ = '0.1.0'
+
+from validargs.exceptions import ValidationError
+from validargs.validargs import Validator, validated, warmup
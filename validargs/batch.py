@@ -0,0 +1,360 @@
+""" Batch validation of many argument sets against the same call plan. """
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import heapq
+from inspect import Parameter
+from typing import Any, Callable, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+from validargs.exceptions import ElementValidationError
+
+
+class BatchError(NamedTuple):
+    """ The failure of a single row of a batch.
+
+    Attributes:
+        index (int): The index of the row that failed
+        argument (str): The name of the argument that failed, or None if the
+                        arguments of the row cannot be bound to the signature
+        exception (Exception): The reason of the failure (see Validator.check)
+    """
+    index: int
+    argument: Optional[str]
+    exception: Exception
+
+
+@dataclass
+class BatchResult:
+    """ The result of a batch validation.
+
+    Attributes:
+        mask (bytearray): One byte per row, set to 1 if the row passed validation
+                            and to 0 if it failed
+        errors (list): A BatchError for the first failing argument of each failed
+                        row, sorted by the index of the row. If more rows failed
+                        than the maximum number of errors requested, only the
+                        errors of the first failed rows are kept.
+    """
+    mask: bytearray
+    errors: List[BatchError] = field(default_factory=list)
+
+    @property
+    def failed_count(self) -> int:
+        return self.mask.count(0)
+
+    @property
+    def passed(self) -> bool:
+        return 0 not in self.mask
+
+
+def missing_error(plan: Any, param: Any) -> TypeError:
+    """ Constructs the error of a required argument that is not provided, like bind_arguments does """
+    return TypeError(f"{plan.func_name}() missing 1 required positional argument: '{param.name}'")
+
+
+def rows_to_columns(
+    plan: Any,
+    rows: Sequence[Any],
+) -> Tuple[Mapping[str, List[Any]], Dict[int, Tuple[Optional[str], TypeError]]]:
+    """ Transposes rows of arguments to columns, one per parameter with a validator.
+
+    Each row is either a sequence of positional arguments or a mapping of
+    keyword arguments. Arguments that are not provided are left as
+    Parameter.empty and are later assigned the default value. The keyword
+    arguments that match no named parameter are collected in a dict for the
+    **kwargs parameter, like bind_arguments does.
+
+    Rows that cannot be bound to the signature, like bind_arguments would not
+    bind them, are not transposed. Instead, the failing argument, if any, and
+    the TypeError of the direct call are returned for them.
+
+    Returns:
+        (columns, binding_errors): The columns, keyed by the name of the parameter,
+                                    and the binding errors, keyed by the row index
+    """
+    columns = {
+        param.name: [Parameter.empty] * len(rows)
+        for param in plan.parameters
+        if param.validator
+    }
+    binding_errors = {}
+    keyword_names = {
+        param.name
+        for param in plan.parameters
+        if param.kind not in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD, Parameter.POSITIONAL_ONLY)
+    }
+    positional_only_names = {param.name for param in plan.parameters if param.kind == Parameter.POSITIONAL_ONLY}
+    required = [param for param in plan.parameters if param.default is Parameter.empty]
+    var_keyword = next(
+        (param.name for param in plan.parameters if param.kind == Parameter.VAR_KEYWORD and param.validator),
+        None,
+    )
+
+    for index, row in enumerate(rows):
+        if isinstance(row, Mapping):
+            unbound_names = [name for name in row if name not in keyword_names]
+            if unbound_names and not plan.var_keyword:
+                name = unbound_names[0]
+                if name in positional_only_names:
+                    message = f"got some positional-only arguments passed as keyword arguments: '{name}'"
+                else:
+                    message = f"got an unexpected keyword argument '{name}'"
+                binding_errors[index] = (None, TypeError(f"{plan.func_name}() {message}"))
+                continue
+
+            missing = next((param for param in required if param.name not in keyword_names or param.name not in row), None)
+            if missing is not None:
+                binding_errors[index] = (missing.name, missing_error(plan, missing))
+                continue
+
+            for name, value in row.items():
+                if name in keyword_names:
+                    if name in columns:
+                        columns[name][index] = value
+                elif var_keyword is not None:
+                    if columns[var_keyword][index] is Parameter.empty:
+                        columns[var_keyword][index] = {}
+                    columns[var_keyword][index][name] = value
+        else:
+            if len(row) > plan.positional_count and not plan.var_positional:
+                binding_errors[index] = (None, TypeError(
+                    f"{plan.func_name}() takes {plan.positional_count} positional "
+                    f"argument{'' if plan.positional_count == 1 else 's'} but {len(row)} were given"
+                ))
+                continue
+
+            missing = next((param for param in required if param.position is None or param.position >= len(row)), None)
+            if missing is not None:
+                binding_errors[index] = (missing.name, missing_error(plan, missing))
+                continue
+
+            for param in plan.parameters:
+                if param.validator and param.position is not None and param.position < len(row):
+                    if param.kind == Parameter.VAR_POSITIONAL:
+                        columns[param.name][index] = row[param.position:]
+                    else:
+                        columns[param.name][index] = row[param.position]
+
+    return columns, binding_errors
+
+
+def validate_many(
+    plan: Any,
+    rows: Optional[Sequence[Any]] = None,
+    *,
+    columns: Optional[Mapping[str, Sequence[Any]]] = None,
+    max_errors: int = 100,
+) -> BatchResult:
+    """ Validates many sets of arguments against the call plan of a decorated
+    function, without calling it and without raising for invalid rows.
+
+    The arguments are validated column by column, and the validation of a row
+    stops at its first failing argument. Vectorized validators are applied
+    to whole columns at once, when columns are provided.
+
+    Args:
+        plan (CallPlan): The call plan of the decorated function
+        rows (Sequence): A sequence of rows, each being either a sequence of
+                            positional arguments or a mapping of keyword arguments
+        columns (Mapping): A sequence of values for each argument, keyed by the
+                            name of the argument. Can be used instead of `rows`.
+        max_errors (int): The maximum number of errors to collect
+
+    Returns:
+        result (BatchResult): The pass/fail mask and the collected errors
+    """
+    if (rows is None) == (columns is None):
+        raise TypeError("validate_many() expects exactly one of 'rows' or 'columns'")
+
+    if plan.has_async_validators:
+        raise TypeError(f"validate_many() does not support the async validators of {plan.func_name}()")
+
+    if rows is not None:
+        row_count = len(rows)
+        columns, binding_errors = rows_to_columns(plan, rows)
+        is_complete = False
+    else:
+        # Columns provided by the caller contain no missing values
+        is_complete = True
+
+        unknown_names = set(columns) - {param.name for param in plan.parameters}
+        if unknown_names:
+            raise TypeError(f"validate_many() got columns for unknown arguments: {', '.join(sorted(unknown_names))}")
+
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("validate_many() expects columns of equal length")
+        row_count = lengths.pop() if lengths else 0
+
+        # The columns of required arguments are provided for either all or none of the rows
+        missing = next(
+            (param for param in plan.parameters if param.default is Parameter.empty and param.name not in columns),
+            None,
+        )
+        binding_errors = {
+            index: (missing.name, missing_error(plan, missing))
+            for index in range(row_count)
+        } if missing is not None else {}
+
+    mask = bytearray(b'\x01') * row_count
+    # The arguments are validated column by column, so the errors of the first
+    # failed rows are kept in a max-heap of their negated row indices
+    errors_heap: List[Tuple[int, BatchError]] = []
+
+    def fail(index: int, argument: str, exception: Exception) -> None:
+        mask[index] = 0
+        if len(errors_heap) < max_errors:
+            heapq.heappush(errors_heap, (-index, BatchError(index, argument, exception)))
+        elif errors_heap and index < -errors_heap[0][0]:
+            heapq.heapreplace(errors_heap, (-index, BatchError(index, argument, exception)))
+
+    for index, (argument, exception) in binding_errors.items():
+        fail(index, argument, exception)
+
+    for param in plan.parameters:
+        if not param.validator:
+            continue
+
+        check = param.validator.check
+        column = columns.get(param.name)
+
+        # Vectorized validators check whole columns in one pass
+        invalid_indices = getattr(param.validator, 'invalid_indices', None)
+        if invalid_indices is not None and column is not None and is_complete:
+            try:
+                indices = invalid_indices(column)
+            except Exception as exc:
+                indices = range(row_count)
+                column_exception = exc
+            else:
+                column_exception = None
+
+            for index in indices:
+                if mask[index]:
+                    fail(index, param.name, column_exception or ElementValidationError([index]))
+            continue
+
+        # The default value is validated once for all the rows that do not provide the argument
+        default_exception = None
+        # The default value of a transforming validator is already normalized
+        if param.default is not Parameter.empty and param.name not in plan.validated_defaults and not param.transform:
+            default_exception = check(param.default)
+
+        for index in range(row_count):
+            if not mask[index]:
+                continue
+
+            value = Parameter.empty if column is None else column[index]
+
+            if value is Parameter.empty:
+                if param.default is Parameter.empty:
+                    fail(index, param.name, missing_error(plan, param))
+                elif default_exception is not None:
+                    fail(index, param.name, default_exception)
+                continue
+
+            reason = check(value)
+            if reason is not None:
+                fail(index, param.name, reason)
+
+    errors = sorted((error for _, error in errors_heap), key=lambda error: error.index)
+
+    return BatchResult(mask=mask, errors=errors)
+
+
+# The decorated function validated by a worker process of validate_bulk
+_worker_function: Optional[Callable] = None
+
+
+def init_worker(func: Callable) -> None:
+    """ Initializes a worker process of validate_bulk. The decorated function
+    is unpickled, and its call plan is built, once per worker.
+    """
+    global _worker_function
+    _worker_function = func
+
+
+def validate_shard(
+    rows: Optional[Sequence[Any]],
+    columns: Optional[Mapping[str, Sequence[Any]]],
+    max_errors: int,
+) -> BatchResult:
+    """ Validates a shard of a bulk validation in a worker process """
+    return _worker_function.validate_many(rows, columns=columns, max_errors=max_errors)
+
+
+def shard(
+    rows: Optional[Sequence[Any]],
+    columns: Optional[Mapping[str, Sequence[Any]]],
+    chunksize: int,
+) -> Iterator[Tuple[int, Optional[Sequence[Any]], Optional[Mapping[str, Sequence[Any]]]]]:
+    """ Splits rows or columns in shards of up to `chunksize` rows.
+
+    Yields:
+        (offset, rows, columns): The index of the first row of the shard
+                                    and its rows or columns
+    """
+    if rows is not None:
+        for offset in range(0, len(rows), chunksize):
+            yield offset, rows[offset:offset + chunksize], None
+    else:
+        row_count = max((len(column) for column in columns.values()), default=0)
+        for offset in range(0, row_count, chunksize):
+            yield offset, None, {
+                name: column[offset:offset + chunksize]
+                for name, column in columns.items()
+            }
+
+
+def validate_bulk(
+    func: Callable,
+    rows: Optional[Sequence[Any]] = None,
+    *,
+    columns: Optional[Mapping[str, Sequence[Any]]] = None,
+    max_errors: int = 100,
+    processes: Optional[int] = None,
+    chunksize: int = 10_000,
+) -> BatchResult:
+    """ Validates many sets of arguments like validate_many, sharding them
+    across a pool of worker processes. Useful for CPU-bound validators.
+
+    The decorated function is passed to the workers by reference, so it must
+    be importable (e.g. defined at the top level of a module). Each shard
+    keeps the errors of its first failed rows, and the results of the shards
+    are merged in input order, so the mask and the errors are the same as the
+    ones of validate_many, even when the errors are capped by `max_errors`.
+
+    Args:
+        func (Callable): The decorated function
+        rows (Sequence): See validate_many
+        columns (Mapping): See validate_many
+        max_errors (int): The maximum number of errors to collect
+        processes (int): The number of worker processes. Defaults to the number of CPUs.
+        chunksize (int): The maximum number of rows sent to a worker at a time
+
+    Returns:
+        result (BatchResult): The pass/fail mask and the collected errors
+    """
+    if (rows is None) == (columns is None):
+        raise TypeError("validate_bulk() expects exactly one of 'rows' or 'columns'")
+
+    if columns is not None and len({len(column) for column in columns.values()}) > 1:
+        raise ValueError("validate_bulk() expects columns of equal length")
+
+    mask = bytearray()
+    errors = []
+
+    with ProcessPoolExecutor(max_workers=processes, initializer=init_worker, initargs=(func,)) as executor:
+        futures = [
+            (offset, executor.submit(validate_shard, shard_rows, shard_columns, max_errors))
+            for offset, shard_rows, shard_columns in shard(rows, columns, chunksize)
+        ]
+
+        for offset, future in futures:
+            result = future.result()
+            mask += result.mask
+            errors.extend(
+                error._replace(index=error.index + offset)
+                for error in result.errors[:max_errors - len(errors)]
+            )
+
+    return BatchResult(mask=mask, errors=errors)
@@ -0,0 +1,121 @@
+""" Memoization of validation outcomes for pure validators. """
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Callable, NamedTuple, Optional
+
+from validargs.exceptions import RejectedValueError
+
+
+class CacheInfo(NamedTuple):
+    """ Statistics of a ValidationCache, similar to functools.lru_cache's """
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+def typed_key(value: Any) -> Any:
+    """ Keys a value by its type as well as its value, recursively for tuples and frozensets """
+    if isinstance(value, tuple):
+        return (type(value), tuple(typed_key(item) for item in value))
+    if isinstance(value, frozenset):
+        return (type(value), frozenset(typed_key(item) for item in value))
+    return (type(value), value)
+
+
+def copy_exception(exc: Exception) -> Exception:
+    """ Copies an exception, along with its attributes, but without its
+    traceback and context. The constructor of the exception is not called,
+    since its arguments may differ from the ones it stores.
+    """
+    copied = type(exc).__new__(type(exc), *exc.args)
+    copied.__dict__.update(exc.__dict__)
+    return copied
+
+
+class ValidationCache:
+    """ A bounded LRU cache of validation outcomes, both passes and failures.
+
+    Only hashable arguments are cached. Arguments are keyed by their type as
+    well as their value, recursively for tuples and frozensets, so that e.g.
+    `1` and `True`, or `(1,)` and `(True,)`, are cached separately.
+
+    Args:
+        maxsize (int): The maximum number of cached outcomes
+        ttl (float): The number of seconds after which a cached outcome expires.
+                        Outcomes never expire if not set.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._outcomes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def validate(self, validator_func: Callable, arg: Any) -> None:
+        """ Validates an argument, unless the outcome of its validation is cached.
+
+        A cached failure raises a copy of the exception originally raised by
+        the validator, without its traceback.
+        """
+        try:
+            key = (validator_func, typed_key(arg))
+            hash(key)
+        except TypeError:
+            # Unhashable arguments are not cached
+            if validator_func(arg) is False:
+                raise RejectedValueError(arg)
+            return
+
+        now = time.monotonic() if self.ttl is not None else None
+
+        with self._lock:
+            outcome = self._outcomes.get(key)
+            if outcome is not None and (now is None or outcome[0] > now):
+                self._outcomes.move_to_end(key)
+                self.hits += 1
+                exception = outcome[1]
+            else:
+                self.misses += 1
+                outcome = None
+
+        if outcome is not None:
+            if exception is not None:
+                raise copy_exception(exception)
+            return
+
+        try:
+            exception = RejectedValueError(arg) if validator_func(arg) is False else None
+        except Exception as exc:
+            exception = exc
+
+        expires_at = now + self.ttl if now is not None else None
+
+        with self._lock:
+            # The cached copy does not keep the frames of the traceback alive
+            self._outcomes[key] = (expires_at, copy_exception(exception) if exception is not None else None)
+            self._outcomes.move_to_end(key)
+            while len(self._outcomes) > self.maxsize:
+                self._outcomes.popitem(last=False)
+                self.evictions += 1
+
+        if exception is not None:
+            raise exception
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._outcomes))
+
+    def cache_clear(self) -> None:
+        with self._lock:
+            self._outcomes.clear()
+            self.hits = self.misses = self.evictions = 0
@@ -0,0 +1,321 @@
+""" Declarative built-in checks for the most common validation rules.
+
+Each check is a regular validator function, so it works with every engine,
+but it can also emit a python expression that is true for invalid arguments,
+which the `codegen` engine evaluates inline instead of calling the check.
+"""
+import re
+from typing import Any, Dict, Iterable, Optional, Pattern, Tuple, Union
+
+
+class Check:
+    """ Base class of the built-in checks. Checks with the same parameters are equal. """
+
+    def __call__(self, arg: Any) -> None:
+        if self.is_invalid(arg):
+            self.fail(arg)
+
+    def is_invalid(self, arg: Any) -> bool:
+        raise NotImplementedError
+
+    def fail(self, arg: Any) -> None:
+        """ Raises the exception of an invalid argument """
+        raise self.error(arg)
+
+    def error(self, arg: Any) -> Exception:
+        """ Constructs the exception of an invalid argument """
+        return ValueError(self.message(arg))
+
+    def message(self, arg: Any) -> str:
+        raise NotImplementedError
+
+    def parameters(self) -> Tuple:
+        """ The parameters of the check, which it is compared by """
+        raise NotImplementedError
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.parameters() == other.parameters()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.parameters()))
+
+    def inline(self, name: str, prefix: str) -> Tuple[str, Dict[str, Any]]:
+        """ Constructs an expression that is true if the argument is invalid.
+        The expression accesses any names other than the argument, including
+        builtins, through the prefix, as the parameters may shadow them.
+
+        Args:
+            name (str): The name of the argument in the expression
+            prefix (str): The prefix of any other names the expression uses
+
+        Returns:
+            (expression, namespace): The expression and the values of the
+                                        other names it uses
+        """
+        raise NotImplementedError
+
+
+class Range(Check):
+    """ Checks that the argument is within the given (inclusive) bounds """
+
+    def __init__(self, min: Any = None, max: Any = None):
+        if min is None and max is None:
+            raise ValueError("Range expects at least one of min and max")
+        self.min = min
+        self.max = max
+
+    def is_invalid(self, arg: Any) -> bool:
+        return (self.min is not None and arg < self.min) or (self.max is not None and arg > self.max)
+
+    def message(self, arg: Any) -> str:
+        return f"{arg!r} is out of range [{self.min!r}, {self.max!r}]"
+
+    def inline(self, name: str, prefix: str) -> Tuple[str, Dict[str, Any]]:
+        conditions = []
+        namespace = {}
+        if self.min is not None:
+            conditions.append(f"{name} < {prefix}min")
+            namespace[f"{prefix}min"] = self.min
+        if self.max is not None:
+            conditions.append(f"{name} > {prefix}max")
+            namespace[f"{prefix}max"] = self.max
+        return ' or '.join(conditions), namespace
+
+    def parameters(self) -> Tuple:
+        return ((type(self.min), self.min), (type(self.max), self.max))
+
+    def __repr__(self) -> str:
+        return f"Range(min={self.min!r}, max={self.max!r})"
+
+
+class Length(Check):
+    """ Checks that the length of the argument is within the given (inclusive) bounds """
+
+    def __init__(self, min: Optional[int] = None, max: Optional[int] = None):
+        if min is None and max is None:
+            raise ValueError("Length expects at least one of min and max")
+        self.min = min
+        self.max = max
+
+    def is_invalid(self, arg: Any) -> bool:
+        length = len(arg)
+        return (self.min is not None and length < self.min) or (self.max is not None and length > self.max)
+
+    def message(self, arg: Any) -> str:
+        return f"Length {len(arg)} is out of range [{self.min!r}, {self.max!r}]"
+
+    def inline(self, name: str, prefix: str) -> Tuple[str, Dict[str, Any]]:
+        namespace = {f"{prefix}len": len, f"{prefix}min": self.min, f"{prefix}max": self.max}
+        if self.min is None:
+            return f"{prefix}len({name}) > {prefix}max", namespace
+        if self.max is None:
+            return f"{prefix}len({name}) < {prefix}min", namespace
+        return f"not {prefix}min <= {prefix}len({name}) <= {prefix}max", namespace
+
+    def parameters(self) -> Tuple:
+        return ((type(self.min), self.min), (type(self.max), self.max))
+
+    def __repr__(self) -> str:
+        return f"Length(min={self.min!r}, max={self.max!r})"
+
+
+class InstanceOf(Check):
+    """ Checks that the argument is an instance of any of the given types """
+
+    def __init__(self, *types: type):
+        if not types:
+            raise ValueError("InstanceOf expects at least one type")
+        self.types = types
+
+    def is_invalid(self, arg: Any) -> bool:
+        return not isinstance(arg, self.types)
+
+    def error(self, arg: Any) -> Exception:
+        return TypeError(self.message(arg))
+
+    def message(self, arg: Any) -> str:
+        return f"Expected an instance of {', '.join(t.__name__ for t in self.types)}, got {type(arg).__name__}"
+
+    def inline(self, name: str, prefix: str) -> Tuple[str, Dict[str, Any]]:
+        return f"not {prefix}isinstance({name}, {prefix}types)", {
+            f"{prefix}isinstance": isinstance,
+            f"{prefix}types": self.types,
+        }
+
+    def parameters(self) -> Tuple:
+        return self.types
+
+    def __repr__(self) -> str:
+        return f"InstanceOf({', '.join(t.__name__ for t in self.types)})"
+
+
+class Matches(Check):
+    """ Checks that a string argument matches a regular expression, which is
+    compiled once. By default the whole string must match.
+    """
+
+    def __init__(self, pattern: Union[str, Pattern], flags: int = 0, full: bool = True):
+        self.pattern = re.compile(pattern, flags)
+        self.full = full
+        self.match = self.pattern.fullmatch if full else self.pattern.search
+
+    def is_invalid(self, arg: Any) -> bool:
+        return self.match(arg) is None
+
+    def message(self, arg: Any) -> str:
+        return f"{arg!r} does not match {self.pattern.pattern!r}"
+
+    def inline(self, name: str, prefix: str) -> Tuple[str, Dict[str, Any]]:
+        return f"{prefix}match({name}) is None", {f"{prefix}match": self.match}
+
+    def parameters(self) -> Tuple:
+        return (self.pattern.pattern, self.pattern.flags, self.full)
+
+    def __repr__(self) -> str:
+        return f"Matches({self.pattern.pattern!r}, full={self.full!r})"
+
+
+class OneOf(Check):
+    """ Checks that the argument is one of the given values """
+
+    def __init__(self, values: Iterable[Any]):
+        values = tuple(values)
+        try:
+            self.values = frozenset(values)
+        except TypeError:
+            # Unhashable values are looked up linearly
+            self.values = values
+
+    def is_invalid(self, arg: Any) -> bool:
+        return arg not in self.values
+
+    def message(self, arg: Any) -> str:
+        return f"{arg!r} is not one of the allowed values"
+
+    def inline(self, name: str, prefix: str) -> Tuple[str, Dict[str, Any]]:
+        return f"{name} not in {prefix}values", {f"{prefix}values": self.values}
+
+    def parameters(self) -> Tuple:
+        # Equal values of different types (e.g. 1, 1.0 and True) make different checks
+        return (type(self.values), type(self.values)((type(value), value) for value in self.values))
+
+    def __repr__(self) -> str:
+        return f"OneOf({self.values!r})"
+
+
+class Buffer(Check):
+    """ Checks the layout of an argument that supports the buffer protocol
+    (e.g. bytes, bytearray, memoryview, array.array or a NumPy array).
+
+    The argument is inspected through a memoryview, which is released right
+    after the check, so the payload is never copied, however large it is.
+
+    Args:
+        min_nbytes (int): The minimum size of the buffer in bytes
+        max_nbytes (int): The maximum size of the buffer in bytes
+        itemsize (int): The size of each item in bytes
+        format (str): The struct format of the items (e.g. 'B', 'd'), or a tuple of them
+        shape (tuple): The shape of the buffer. A None dimension matches any size
+        contiguous (str): The contiguity of the buffer. One of:
+                            - 'C': C (row-major) contiguous
+                            - 'F': Fortran (column-major) contiguous
+                            - 'A': Either of them
+        magic (bytes): The bytes that the buffer must start with (e.g. a file signature)
+    """
+    parameter_names = ('min_nbytes', 'max_nbytes', 'itemsize', 'format', 'shape', 'contiguous', 'magic')
+
+    contiguity = {
+        'C': lambda view: view.c_contiguous,
+        'F': lambda view: view.f_contiguous,
+        'A': lambda view: view.contiguous,
+    }
+
+    def __init__(
+        self,
+        min_nbytes: Optional[int] = None,
+        max_nbytes: Optional[int] = None,
+        itemsize: Optional[int] = None,
+        format: Union[str, Iterable[str], None] = None,
+        shape: Optional[Iterable[Optional[int]]] = None,
+        contiguous: Optional[str] = None,
+        magic: Optional[bytes] = None,
+    ):
+        if contiguous is not None and contiguous not in self.contiguity:
+            raise ValueError(f"Unknown contiguity: {contiguous!r}. Expected one of: {', '.join(self.contiguity)}")
+
+        self.min_nbytes = min_nbytes
+        self.max_nbytes = max_nbytes
+        self.itemsize = itemsize
+        self.format = (format,) if isinstance(format, str) else None if format is None else tuple(format)
+        self.shape = None if shape is None else tuple(shape)
+        self.contiguous = contiguous
+        self.magic = None if magic is None else bytes(magic)
+
+    def problem(self, arg: Any) -> Optional[Exception]:
+        """ Constructs the exception of an invalid argument, or returns None if it is valid """
+        try:
+            view = memoryview(arg)
+        except TypeError:
+            return TypeError(f"Expected an object that supports the buffer protocol, got {type(arg).__name__}")
+
+        with view:
+            if self.min_nbytes is not None and view.nbytes < self.min_nbytes:
+                return ValueError(f"Buffer of {view.nbytes} bytes is smaller than {self.min_nbytes} bytes")
+            if self.max_nbytes is not None and view.nbytes > self.max_nbytes:
+                return ValueError(f"Buffer of {view.nbytes} bytes is larger than {self.max_nbytes} bytes")
+            if self.itemsize is not None and view.itemsize != self.itemsize:
+                return ValueError(f"Buffer items of {view.itemsize} bytes are not {self.itemsize} bytes")
+            if self.format is not None and view.format not in self.format:
+                return ValueError(f"Buffer format {view.format!r} is not one of {', '.join(map(repr, self.format))}")
+            if self.shape is not None and (
+                len(view.shape) != len(self.shape) or
+                any(expected is not None and size != expected for size, expected in zip(view.shape, self.shape))
+            ):
+                return ValueError(f"Buffer shape {view.shape} does not match {self.shape}")
+            if self.contiguous is not None and not self.contiguity[self.contiguous](view):
+                return ValueError(f"Buffer is not {self.contiguous} contiguous")
+            if self.magic is not None and not self.has_magic(view):
+                return ValueError(f"Buffer does not start with {self.magic!r}")
+
+        return None
+
+    def has_magic(self, view: memoryview) -> bool:
+        """ Checks that the buffer starts with the magic bytes, by comparing them
+        against a slice of a flat byte view, which is not copied.
+        """
+        if view.nbytes < len(self.magic):
+            return False
+        if not view.c_contiguous:
+            # Only C contiguous buffers can be viewed as flat bytes
+            return False
+
+        with view.cast('B') as flat, flat[:len(self.magic)] as header:
+            return header == self.magic
+
+    def is_invalid(self, arg: Any) -> bool:
+        return self.problem(arg) is not None
+
+    def error(self, arg: Any) -> Exception:
+        return self.problem(arg)
+
+    def message(self, arg: Any) -> str:
+        return str(self.problem(arg))
+
+    def inline(self, name: str, prefix: str) -> Tuple[str, Dict[str, Any]]:
+        return f"{prefix}problem({name}) is not None", {f"{prefix}problem": self.problem}
+
+    def parameters(self) -> Tuple:
+        return (
+            self.min_nbytes, self.max_nbytes, self.itemsize, self.format,
+            self.shape, self.contiguous, self.magic,
+        )
+
+    def __repr__(self) -> str:
+        parameters = ', '.join(
+            f"{name}={value!r}"
+            for name, value in zip(self.parameter_names, self.parameters())
+            if value is not None
+        )
+        return f"Buffer({parameters})"
@@ -0,0 +1,338 @@
+""" Code generation of wrappers specialized to a decorated function's signature.
+
+Similar to what `dataclasses` does for `__init__`, the wrapper is emitted as
+python source with the default fills, the validator calls and the final call
+to the decorated function unrolled in straight-line code, and then `exec`-ed.
+Plain validator functions are called directly, and the built-in checks (see
+checks.Check) are evaluated inline, without a call.
+"""
+import functools
+from inspect import Parameter
+from types import CodeType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from validargs import outputs
+from validargs.checks import Check
+from validargs.exceptions import RejectedValueError, ValidationError
+from validargs.results import PASSED, CheckResult
+
+
+# Prefix of every name the generated code uses internally.
+# It is used to avoid collisions with the names of the decorated function's parameters.
+PREFIX = '__validargs_'
+
+
+def is_supported(plan: Any) -> bool:
+    """ Checks whether a wrapper can be generated for the given call plan """
+    if plan.has_async_validators:
+        return False
+
+    for param in plan.parameters:
+        if param.name.startswith(PREFIX):
+            return False
+
+    return True
+
+
+def check_lines(index: int, name: str, inlined_check: Optional[str], direct: bool) -> List[str]:
+    """ Generates the lines of a checker that check a single argument and
+    return a CheckResult if it is invalid.
+    """
+    if direct:
+        return [
+            f"try:",
+            f"    if {PREFIX}validator_func_{index}({name}) is False:",
+            f"        return {PREFIX}CheckResult('{name}', {PREFIX}RejectedValueError({name}))",
+            f"except {PREFIX}Exception as {PREFIX}exc:",
+            f"    return {PREFIX}CheckResult('{name}', {PREFIX}exc)",
+        ]
+
+    if inlined_check is None:
+        return [
+            f"{PREFIX}reason = {PREFIX}validator_check_{index}({name})",
+            f"if {PREFIX}reason is not None:",
+            f"    return {PREFIX}CheckResult('{name}', {PREFIX}reason)",
+        ]
+
+    return [
+        f"try:",
+        f"    if {inlined_check}:",
+        f"        return {PREFIX}CheckResult('{name}', {PREFIX}check_{index}.error({name}))",
+        f"except {PREFIX}Exception as {PREFIX}exc:",
+        f"    return {PREFIX}CheckResult('{name}', {PREFIX}exc)",
+    ]
+
+
+def generate_source(
+    plan: Any,
+    namespace: Dict[str, Any],
+    inlined_checks: Optional[Dict[int, str]] = None,
+    checker: bool = False,
+) -> str:
+    """ Generates the source code of a wrapper specialized to the given call plan.
+
+    The generated `create` function receives the decorated function, the
+    validators and the defaults as arguments and returns the wrapper, so that
+    the wrapper accesses all of them as closure variables.
+
+    Args:
+        plan (CallPlan): The call plan of the decorated function
+        namespace (dict): The names that the generated code can access
+        inlined_checks (dict): The expressions of the built-in checks that are
+                                evaluated inline, keyed by parameter index
+        checker (bool): Whether to generate a checker instead of a wrapper, which
+                        returns a CheckResult instead of raising and does not
+                        call the decorated function (see validargs.check_arguments)
+
+    Returns:
+        source (str): The source code of the `create` function
+    """
+    inlined_checks = inlined_checks or {}
+    signature_parts = []
+    body = []
+    call_args = []
+    call_kwargs = []
+    positional_only = False
+    keyword_only = False
+
+    for index, param in enumerate(plan.parameters):
+        name = param.name
+
+        if param.kind == Parameter.POSITIONAL_ONLY:
+            positional_only = True
+        elif positional_only:
+            signature_parts.append('/')
+            positional_only = False
+
+        if param.kind == Parameter.KEYWORD_ONLY and not keyword_only:
+            signature_parts.append('*')
+            keyword_only = True
+
+        if param.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+            # Variadic parameters are always provided, even if empty, and are
+            # forwarded as they are packed by the call of the wrapper.
+            if param.kind == Parameter.VAR_POSITIONAL:
+                signature_parts.append(f"*{name}")
+                call_args.append(f"*{name}")
+                keyword_only = True
+            else:
+                signature_parts.append(f"**{name}")
+                call_kwargs.append(f"**{name}")
+
+            if param.validator:
+                direct = f"{PREFIX}validator_func_{index}" in namespace
+                if checker:
+                    body.extend(f"    {line}" for line in check_lines(index, name, inlined_checks.get(index), direct))
+                else:
+                    body.append(f"    try:")
+                    if direct:
+                        body.append(f"        if {PREFIX}validator_func_{index}({name}) is False:")
+                        body.append(f"            raise {PREFIX}RejectedValueError({name})")
+                    else:
+                        body.append(f"        {PREFIX}validator_{index}({name})")
+                    body.append(f"    except {PREFIX}Exception as {PREFIX}exc:")
+                    body.append(
+                        f"        raise {PREFIX}ValidationError(\"Validation failed for argument: '{name}'\") from {PREFIX}exc"
+                    )
+            continue
+
+        if param.validator:
+            # Plain validator functions are called directly, instead of through the Validator
+            direct = f"{PREFIX}validator_func_{index}" in namespace
+
+            # The validator's default value is filled in the body, so that
+            # a missing argument can be detected and validated.
+            signature_parts.append(f"{name}={PREFIX}empty")
+            body.append(f"    if {name} is {PREFIX}empty:")
+            # The name of the function is not part of the source, so that it can be shared
+            missing = f"{PREFIX}TypeError(f\"{{{PREFIX}plan.func_name}}() missing 1 required positional argument: '{name}'\")"
+            if param.default is Parameter.empty:
+                if checker:
+                    body.append(f"        return {PREFIX}CheckResult(None, {missing})")
+                else:
+                    body.append(f"        raise {missing}")
+                indent = '    '
+            else:
+                body.append(f"        {name} = {PREFIX}default_{index}")
+                if param.on_default is not None:
+                    body.append(f"        {PREFIX}on_default_{index}({name})")
+                # The default value of a transforming validator is already normalized
+                if not param.transform:
+                    body.append(f"        if '{name}' not in {PREFIX}validated_defaults:")
+                    if checker:
+                        body.append(f"            {PREFIX}reason = {PREFIX}validator_check_{index}({name})")
+                        body.append(f"            if {PREFIX}reason is not None:")
+                        body.append(f"                return {PREFIX}CheckResult('{name}', {PREFIX}reason)")
+                        if not param.validator.mutable_default:
+                            body.append(f"            {PREFIX}validated_defaults.add('{name}')")
+                    else:
+                        body.append(f"            {PREFIX}validate_default({PREFIX}plan, {PREFIX}param_{index})")
+                body.append(f"    else:")
+                indent = '        '
+            if checker:
+                body.extend(
+                    f"{indent}{line}"
+                    for line in check_lines(index, name, inlined_checks.get(index), direct)
+                )
+            else:
+                body.append(f"{indent}try:")
+                if index in inlined_checks:
+                    body.append(f"{indent}    if {inlined_checks[index]}:")
+                    body.append(f"{indent}        {PREFIX}check_{index}.fail({name})")
+                elif direct:
+                    body.append(f"{indent}    if {PREFIX}validator_func_{index}({name}) is False:")
+                    body.append(f"{indent}        raise {PREFIX}RejectedValueError({name})")
+                elif param.transform:
+                    # The decorated function receives the normalized value
+                    body.append(f"{indent}    {name} = {PREFIX}validator_{index}({name})")
+                else:
+                    body.append(f"{indent}    {PREFIX}validator_{index}({name})")
+                body.append(f"{indent}except {PREFIX}Exception as {PREFIX}exc:")
+                body.append(
+                    f"{indent}    raise {PREFIX}ValidationError(\"Validation failed for argument: '{name}'\") from {PREFIX}exc"
+                )
+            if param.wrap is not None and not checker:
+                body.append(f"    {name} = {PREFIX}wrap_{index}({name}, '{name}')")
+        elif param.default is not Parameter.empty:
+            signature_parts.append(f"{name}={PREFIX}default_{index}")
+        else:
+            signature_parts.append(name)
+
+        if param.kind == Parameter.KEYWORD_ONLY:
+            call_kwargs.append(f"{name}={name}")
+        else:
+            call_args.append(name)
+
+    if positional_only:
+        signature_parts.append('/')
+
+    if checker:
+        lines = [
+            f"def create({', '.join(namespace)}):",
+            f"    def wrapped({', '.join(signature_parts)}):",
+            *[f"    {line}" for line in body],
+            f"        return {PREFIX}PASSED",
+            f"    return wrapped",
+        ]
+    else:
+        await_ = 'await ' if plan.is_coroutine else ''
+        call = f"{await_}{PREFIX}func({', '.join(call_args + call_kwargs)})"
+        if f"{PREFIX}validate_output" in namespace:
+            # The output is validated in the same wrapper (see outputs.output_validator)
+            call = f"{await_}{PREFIX}validate_output({call})"
+        lines = [
+            f"def create({', '.join(namespace)}):",
+            f"    {'async def' if plan.is_coroutine else 'def'} wrapped({', '.join(signature_parts)}):",
+            *[f"    {line}" for line in body],
+            f"        return {call}",
+            f"    return wrapped",
+        ]
+
+    return '\n'.join(lines)
+
+
+def build_namespace(plan: Any) -> Tuple[Dict[str, Any], Dict[int, str]]:
+    """ Constructs the names that the generated code of a call plan can access,
+    along with the expressions of the built-in checks that are evaluated inline.
+    """
+    namespace: Dict[str, Any] = {
+        f"{PREFIX}empty": Parameter.empty,
+        f"{PREFIX}plan": plan,
+        f"{PREFIX}validated_defaults": plan.validated_defaults,
+        f"{PREFIX}RejectedValueError": RejectedValueError,
+        # The builtins are accessed through prefixed names, as the parameters may shadow them
+        f"{PREFIX}Exception": Exception,
+        f"{PREFIX}TypeError": TypeError,
+    }
+    inlined_checks: Dict[int, str] = {}
+    for index, param in enumerate(plan.parameters):
+        if param.validator:
+            namespace[f"{PREFIX}validator_{index}"] = param.validator.validate
+            namespace[f"{PREFIX}validator_check_{index}"] = param.validator.check
+            namespace[f"{PREFIX}param_{index}"] = param
+            plain_func = param.validator.plain_func
+            if isinstance(plain_func, Check):
+                expression, check_namespace = plain_func.inline(param.name, f"{PREFIX}check_{index}_")
+                inlined_checks[index] = expression
+                namespace[f"{PREFIX}check_{index}"] = plain_func
+                namespace.update(check_namespace)
+            elif plain_func is not None:
+                namespace[f"{PREFIX}validator_func_{index}"] = plain_func
+        if param.on_default is not None:
+            namespace[f"{PREFIX}on_default_{index}"] = param.on_default
+        if param.wrap is not None:
+            namespace[f"{PREFIX}wrap_{index}"] = param.wrap
+        if param.default is not Parameter.empty:
+            namespace[f"{PREFIX}default_{index}"] = param.default
+
+    return namespace, inlined_checks
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_source(source: str) -> CodeType:
+    """ Compiles the generated source. Functions with the same signature share
+    the same source, and so the same compiled code.
+    """
+    return compile(source, f"<{PREFIX}generated>", 'exec')
+
+
+def create(source: str, namespace: Dict[str, Any]) -> Callable:
+    """ Executes the generated source and creates the wrapper """
+    local_namespace: Dict[str, Any] = {}
+    exec(compile_source(source), {}, local_namespace)
+
+    return local_namespace['create'](**namespace)
+
+
+def generate_wrapper(func: Callable, plan: Any, validate_default: Callable) -> Optional[Callable]:
+    """ Generates a wrapper specialized to the signature of the decorated function.
+
+    Args:
+        func (Callable): The decorated function
+        plan (CallPlan): The call plan of the decorated function
+        validate_default (Callable): The function used to validate the default
+                                        value of a parameter's validator
+
+    Returns:
+        wrapped (Callable): The generated wrapper, or None if the signature
+                            of the decorated function is not supported
+    """
+    if not is_supported(plan):
+        return None
+
+    namespace, inlined_checks = build_namespace(plan)
+    namespace[f"{PREFIX}func"] = func
+    namespace[f"{PREFIX}ValidationError"] = ValidationError
+    namespace[f"{PREFIX}validate_default"] = validate_default
+    validate_output = outputs.output_validator(plan)
+    if validate_output is not None:
+        namespace[f"{PREFIX}validate_output"] = validate_output
+
+    return create(generate_source(plan, namespace, inlined_checks), namespace)
+
+
+def generate_checker(plan: Any) -> Optional[Callable]:
+    """ Generates a checker specialized to the signature of the decorated
+    function, which accepts the same arguments and returns a CheckResult.
+
+    Arguments that cannot be bound to the signature raise a TypeError.
+
+    Args:
+        plan (CallPlan): The call plan of the decorated function
+
+    Returns:
+        checker (Callable): The generated checker, or None if the signature
+                            of the decorated function is not supported
+    """
+    if not is_supported(plan):
+        return None
+
+    namespace, inlined_checks = build_namespace(plan)
+    namespace[f"{PREFIX}CheckResult"] = CheckResult
+    namespace[f"{PREFIX}PASSED"] = PASSED
+
+    checker = create(generate_source(plan, namespace, inlined_checks, checker=True), namespace)
+    # The arguments that cannot be bound raise a TypeError that names the decorated function
+    checker.__name__ = checker.__qualname__ = plan.func_name
+
+    return checker
@@ -0,0 +1,156 @@
+""" Composite validators made of a chain of checks, which short-circuit.
+
+The checks can be reordered adaptively, based on their cost and failure
+rate, which are profiled online on a sample of the calls.
+"""
+from inspect import iscoroutinefunction
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from validargs.exceptions import RejectedValueError
+
+
+class CheckStats:
+    """ The online profile of a single check of a composite validator """
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.duration = 0.0
+
+    @property
+    def failure_rate(self) -> float:
+        # Laplace smoothing, so that checks that have not run yet are not ruled out
+        return (self.failures + 1) / (self.calls + 2)
+
+    @property
+    def mean_duration(self) -> float:
+        return self.duration / self.calls if self.calls else 0.0
+
+
+class Composite:
+    """ Base class of the composite validators. Like any validator, a check
+    fails by raising an exception or by returning False.
+
+    Args:
+        checks (Iterable): The validator functions of the chain
+        adaptive (bool): Whether to reorder the checks based on their profile
+        profile_every (int): Profile 1 in every N calls
+        reorder_every (int): Reorder the checks after every N profiled calls
+    """
+
+    def __init__(
+        self,
+        checks: Iterable[Callable],
+        adaptive: bool = True,
+        profile_every: int = 16,
+        reorder_every: int = 64,
+    ):
+        self.checks: Tuple[Callable, ...] = tuple(checks)
+
+        if not self.checks:
+            raise ValueError(f"{type(self).__name__} expects at least one check")
+        if any(iscoroutinefunction(check) for check in self.checks):
+            raise TypeError(f"{type(self).__name__} does not support async checks")
+
+        self.adaptive = adaptive
+        self.profile_every = profile_every
+        self.reorder_every = reorder_every
+
+        self.stats: Dict[Callable, CheckStats] = {check: CheckStats() for check in self.checks}
+        self.ordered_checks = self.checks
+
+        self._calls = 0
+        self._profiled_calls = 0
+
+    def __call__(self, arg: Any) -> None:
+        if self.adaptive:
+            self._calls += 1
+            if self._calls % self.profile_every == 0:
+                return self.profiled_call(arg)
+
+        return self.run(self.ordered_checks, arg)
+
+    def run(self, checks: Tuple[Callable, ...], arg: Any) -> None:
+        raise NotImplementedError
+
+    def score(self, stats: CheckStats) -> float:
+        """ The key by which the checks are ordered, lowest first """
+        raise NotImplementedError
+
+    def profiled_call(self, arg: Any) -> None:
+        """ Runs the checks like `run`, recording the cost and outcome of each one """
+        def profiled(check: Callable) -> Callable:
+            def profiled_check(arg: Any) -> Any:
+                stats = self.stats[check]
+                start = time.perf_counter()
+                try:
+                    result = check(arg)
+                except Exception:
+                    stats.failures += 1
+                    raise
+                finally:
+                    stats.calls += 1
+                    stats.duration += time.perf_counter() - start
+                if result is False:
+                    stats.failures += 1
+                return result
+            return profiled_check
+
+        try:
+            return self.run(tuple(profiled(check) for check in self.ordered_checks), arg)
+        finally:
+            self._profiled_calls += 1
+            if self._profiled_calls % self.reorder_every == 0:
+                self.reorder()
+
+    def reorder(self) -> None:
+        self.ordered_checks = tuple(sorted(self.checks, key=lambda check: self.score(self.stats[check])))
+
+    def profile(self) -> List[Dict[str, Any]]:
+        """ Returns the profile of each check, in the current order """
+        return [
+            dict(
+                check=check,
+                calls=self.stats[check].calls,
+                failure_rate=self.stats[check].failure_rate,
+                mean_duration=self.stats[check].mean_duration,
+            )
+            for check in self.ordered_checks
+        ]
+
+
+class AllOf(Composite):
+    """ Passes if all of the checks pass. Stops at the first failing check and
+    raises its exception. Cheap checks that fail often are moved first.
+    """
+
+    def run(self, checks: Tuple[Callable, ...], arg: Any) -> None:
+        for check in checks:
+            if check(arg) is False:
+                raise RejectedValueError(arg)
+
+    def score(self, stats: CheckStats) -> float:
+        return stats.mean_duration / stats.failure_rate
+
+
+class AnyOf(Composite):
+    """ Passes if any of the checks passes. Stops at the first passing check.
+    Cheap checks that pass often are moved first.
+    """
+
+    def run(self, checks: Tuple[Callable, ...], arg: Any) -> None:
+        errors = []
+        for check in checks:
+            try:
+                if check(arg) is not False:
+                    return
+                errors.append(RejectedValueError(arg))
+            except Exception as exc:
+                errors.append(exc)
+
+        raise ValueError(f"None of the checks passed: {'; '.join(str(error) for error in errors)}") from errors[-1]
+
+    def score(self, stats: CheckStats) -> float:
+        pass_rate = 1 - stats.failure_rate
+        return stats.mean_duration / pass_rate
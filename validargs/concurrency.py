@@ -0,0 +1,34 @@
+""" Shared executors used to run validators concurrently. """
+from concurrent.futures import Executor, ThreadPoolExecutor
+import threading
+from typing import Optional
+
+
+_lock = threading.Lock()
+_thread_pool: Optional[Executor] = None
+
+
+def get_thread_pool() -> Executor:
+    """ Returns the thread pool shared by all the decorated functions,
+    creating it on first use.
+    """
+    global _thread_pool
+
+    if _thread_pool is None:
+        with _lock:
+            if _thread_pool is None:
+                _thread_pool = ThreadPoolExecutor(thread_name_prefix='validargs')
+
+    return _thread_pool
+
+
+def set_thread_pool(executor: Optional[Executor]) -> None:
+    """ Replaces the shared thread pool, e.g. to control its number of workers.
+
+    The previous thread pool is not shut down. Setting it to None creates a
+    default thread pool on next use.
+    """
+    global _thread_pool
+
+    with _lock:
+        _thread_pool = executor
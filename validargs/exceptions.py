@@ -1,2 +1,51 @@
+from typing import Any, Dict, Sequence
+
+
 class ValidationError(Exception):
     pass
+
+
+class ElementValidationError(ValidationError):
+    """ Raised when some of the elements of an argument fail validation.
+
+    Attributes:
+        indices (list): The indices of the elements that failed validation
+    """
+    # The maximum number of indices included in the message
+    max_reported_indices = 10
+
+    def __init__(self, indices: Sequence[Any]):
+        self.indices = indices
+
+        reported_indices = ', '.join(str(index) for index in indices[:self.max_reported_indices])
+        if len(indices) > self.max_reported_indices:
+            reported_indices += f", ... ({len(indices)} in total)"
+
+        super().__init__(f"Validation failed for elements at indices: {reported_indices}")
+
+
+class MultipleValidationError(ValidationError):
+    """ Raised when more than one argument fails validation in a single call.
+
+    Attributes:
+        errors (dict): The exception raised by the validator of each failed
+                        argument, keyed by the name of the argument
+    """
+
+    def __init__(self, errors: Dict[str, Exception]):
+        self.errors = errors
+
+        arguments = ', '.join(f"'{name}'" for name in errors)
+        super().__init__(f"Validation failed for arguments: {arguments}")
+
+
+class RejectedValueError(ValueError):
+    """ Raised in place of a validator that signals a failure by returning False.
+
+    Attributes:
+        value (Any): The rejected value
+    """
+
+    def __init__(self, value: Any):
+        self.value = value
+        super().__init__("Validator returned False")
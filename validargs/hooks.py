@@ -0,0 +1,109 @@
+""" Callbacks around the validation of arguments, e.g. for tracing or profiling.
+
+Hooks are applied to a function when it is decorated, and only functions
+with registered hooks are instrumented, so the rest of them do not pay
+for a check on every argument. As a result, only the callbacks registered
+at decoration time are fired, and global hooks only apply to the functions
+that are decorated after their registration.
+
+Every callback receives the qualified name of the decorated function, the
+name of the argument and its value. The `on_failure` callbacks also receive
+the exception raised by the validator.
+"""
+from dataclasses import replace
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from validargs.proxies import ValidatorProxy
+
+
+EVENTS = (
+    'before_validation',  # Before the validator of an argument runs
+    'after_validation',  # After the validator of an argument passes
+    'on_failure',  # After the validator of an argument fails
+    'on_default',  # When the default value of a Validator is assigned to an argument
+)
+
+
+class Hooks:
+    """ A set of callbacks for each validation event.
+
+    Args:
+        before_validation, after_validation, on_failure, on_default:
+            A callback, or an iterable of callbacks, for each event
+    """
+
+    def __init__(self, **callbacks: Union[Callable, Iterable[Callable]]):
+        self.callbacks: Dict[str, List[Callable]] = {event: [] for event in EVENTS}
+
+        for event, event_callbacks in callbacks.items():
+            if callable(event_callbacks):
+                event_callbacks = [event_callbacks]
+            for callback in event_callbacks:
+                self.register(event, callback)
+
+    def register(self, event: str, callback: Callable) -> Callable:
+        """ Registers a callback for an event """
+        if event not in EVENTS:
+            raise ValueError(f"Unknown event: '{event}'. Expected one of: {', '.join(EVENTS)}")
+
+        self.callbacks[event].append(callback)
+
+        return callback
+
+    def unregister(self, event: str, callback: Callable) -> None:
+        self.callbacks[event].remove(callback)
+
+    def __bool__(self) -> bool:
+        return any(self.callbacks.values())
+
+    def __add__(self, other: 'Hooks') -> 'Hooks':
+        return Hooks(**{
+            event: self.callbacks[event] + other.callbacks[event]
+            for event in EVENTS
+        })
+
+    def fire(self, event: str, *args: Any) -> None:
+        for callback in self.callbacks[event]:
+            callback(*args)
+
+
+class HookedValidator(ValidatorProxy):
+    """ Proxy of a Validator that fires the validation hooks around each validation """
+
+    def __init__(self, validator: Any, hooks: Hooks, function: str, argument: str):
+        super().__init__(validator, function, argument)
+        self.hooks = hooks
+
+    def started(self, arg: Any) -> None:
+        self.hooks.fire('before_validation', self.function, self.argument, arg)
+
+    def finished(self, state: None, arg: Any, reason: Optional[Exception]) -> None:
+        if reason is None:
+            self.hooks.fire('after_validation', self.function, self.argument, arg)
+        else:
+            self.hooks.fire('on_failure', self.function, self.argument, arg, reason)
+
+
+def apply_hooks(plan: Any, hooks: Hooks, function: str) -> Any:
+    """ Constructs a copy of a call plan that fires the given hooks """
+    def on_default(param: Any) -> Callable:
+        return lambda value: hooks.fire('on_default', function, param.name, value)
+
+    return replace(
+        plan,
+        parameters=tuple(
+            replace(
+                param,
+                validator=HookedValidator(param.validator, hooks, function, param.name),
+                on_default=on_default(param) if hooks.callbacks['on_default'] else None,
+            )
+            if param.validator else param
+            for param in plan.parameters
+        ),
+        # The base plan may be interned and shared with functions that are not instrumented
+        validated_defaults=set(),
+    )
+
+
+# Hooks applied to every function decorated after their registration
+global_hooks = Hooks()
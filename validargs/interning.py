@@ -0,0 +1,144 @@
+""" Compact, shared storage of validators and call plans.
+
+Applications with many decorated functions tend to repeat the same
+validators and signatures over and over. Immutable objects that are equal
+are interned in a shared table, so that they are stored only once, and
+their classes are slotted, so that they carry no per-instance `__dict__`.
+
+The table holds weak references, so that interned objects are released
+once no decorated function uses them.
+"""
+from dataclasses import fields, is_dataclass
+import threading
+from types import FunctionType
+from typing import Any, Callable, Tuple, TypeVar
+import weakref
+
+
+T = TypeVar('T')
+
+# Interned objects, keyed by their type and the values of their fields
+interned: 'weakref.WeakValueDictionary[Tuple, Any]' = weakref.WeakValueDictionary()
+lock = threading.Lock()
+
+
+def slotted(cls: type) -> type:
+    """ Recreates a dataclass with `__slots__` for its fields, like `dataclass(slots=True)`
+    does on python 3.10+. The slots include `__weakref__`, so that the instances
+    can be interned.
+
+    Frozen dataclasses are also made picklable, which their slotted versions
+    are not by default on python < 3.10.
+    """
+    base_slots = {
+        slot
+        for base in cls.__mro__[1:]
+        for slot in getattr(base, '__slots__', ())
+    }
+    field_names = tuple(field.name for field in fields(cls))
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict['__slots__'] = tuple(
+        name for name in field_names + ('__weakref__',)
+        if name not in base_slots
+    )
+    for name in field_names:
+        # Remove the default values, which would conflict with the slots
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+
+    if cls.__dataclass_params__.frozen:
+        def __getstate__(self) -> Tuple:
+            return tuple(getattr(self, name) for name in field_names)
+
+        def __setstate__(self, state: Tuple) -> None:
+            for name, value in zip(field_names, state):
+                object.__setattr__(self, name, value)
+
+        cls_dict['__getstate__'] = __getstate__
+        cls_dict['__setstate__'] = __setstate__
+
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+    slotted_cls.__qualname__ = cls.__qualname__
+
+    return slotted_cls
+
+
+def intern_key(obj: Any) -> Tuple:
+    """ Constructs the key of an object in the intern table, from the values of
+    the fields it is compared by. The type of each value is part of the key,
+    since values like 1 and True are equal but not interchangeable.
+
+    Fields that are dataclasses themselves are keyed by their identity, since
+    they are interned first. They are kept alive by the interned object, so
+    their identity is not reused while the key is in the table.
+
+    Raises:
+        TypeError: If any of the values is unhashable
+    """
+    key = (type(obj),) + field_key(tuple(
+        getattr(obj, field.name)
+        for field in fields(obj)
+        if field.compare
+    ))
+    hash(key)
+
+    return key
+
+
+def field_key(values: Tuple) -> Tuple:
+    """ Flattens values into (type, value) pairs, recursively for tuples """
+    key: Tuple = ()
+    for value in values:
+        if is_dataclass(value) and not isinstance(value, type):
+            key += (type(value), id(value))
+        elif type(value) is tuple:
+            key += (tuple, field_key(value))
+        else:
+            key += (type(value), value)
+    return key
+
+
+def intern(obj: T) -> T:
+    """ Returns the interned object that is equal to the given frozen dataclass,
+    interning the given one if there is none. Objects with unhashable values,
+    e.g. mutable default values, are returned as they are.
+    """
+    try:
+        key = intern_key(obj)
+    except TypeError:
+        return obj
+
+    with lock:
+        existing = interned.get(key)
+        if existing is not None:
+            return existing
+        interned[key] = obj
+
+    return obj
+
+
+def intern_defaults(func: Any, is_interned: Callable[[Any], bool]) -> None:
+    """ Replaces the default values of a function that `is_interned` selects
+    with their interned equivalents, so that the function does not keep
+    its own copies alive.
+    """
+    if not isinstance(func, FunctionType):
+        return
+
+    if func.__defaults__:
+        func.__defaults__ = tuple(
+            intern(default) if is_interned(default) else default
+            for default in func.__defaults__
+        )
+
+    if func.__kwdefaults__:
+        for name, default in func.__kwdefaults__.items():
+            if is_interned(default):
+                func.__kwdefaults__[name] = intern(default)
+
+
+def interned_count() -> int:
+    """ Returns the number of objects in the intern table """
+    return len(interned)
@@ -0,0 +1,89 @@
+""" Lazy element-wise validation of iterator arguments.
+
+Iterators, e.g. generators of records, cannot be validated up front without
+consuming them. Instead, the argument is passed in the decorated function
+wrapped in a proxy, which validates each element as the function consumes it,
+so that the memory use stays constant however long the iterator is.
+"""
+from typing import Any, Iterable, Iterator, Optional
+
+from validargs.exceptions import ElementValidationError, ValidationError
+
+
+class ValidatingIterator:
+    """ Proxy of an iterator argument, which validates each of its elements as
+    it is consumed.
+
+    An invalid element raises a ValidationError for the argument, caused by an
+    ElementValidationError with the index of the element, which is in turn
+    caused by the failure of the element's validator. The iterator can still be
+    consumed after an invalid element. The elements of transforming validators
+    are replaced by their normalized values.
+
+    Args:
+        iterable (Iterable): The argument
+        validator (Validator): The validator of each element
+        name (str): The name of the argument
+    """
+    __slots__ = ('iterable', 'iterator', 'validate', 'transform', 'name', 'index')
+
+    def __init__(self, iterable: Iterable[Any], validator: Any, name: str):
+        self.iterable = iterable
+        # The iterator is only constructed when the first element is consumed
+        self.iterator: Optional[Iterator[Any]] = None
+        self.validate = validator.validate
+        self.transform = validator.transform
+        self.name = name
+        self.index = 0
+
+    def __iter__(self) -> 'ValidatingIterator':
+        return self
+
+    def __next__(self) -> Any:
+        if self.iterator is None:
+            self.iterator = iter(self.iterable)
+
+        value = next(self.iterator)
+        index = self.index
+        self.index += 1
+
+        try:
+            result = self.validate(value)
+        except Exception as exc:
+            error = ElementValidationError([index])
+            error.__cause__ = exc
+            raise ValidationError(f"Validation failed for argument: '{self.name}'") from error
+
+        return result if self.transform else value
+
+    def __repr__(self) -> str:
+        return f"ValidatingIterator({self.iterable!r})"
+
+
+class Each:
+    """ Validator function of an iterator argument, which checks that the
+    argument is iterable, without consuming it. Its elements are validated
+    lazily, by the proxy that is passed in the decorated function (see `wrap`).
+
+    Args:
+        validator (Validator): The validator of each element
+    """
+
+    def __init__(self, validator: Any):
+        if validator.is_async:
+            raise TypeError("The elements of iterators cannot have async validators")
+
+        self.validator = validator
+
+    def __call__(self, arg: Any) -> None:
+        try:
+            iter(arg)
+        except TypeError:
+            raise TypeError(f"{type(arg).__name__!r} object is not iterable") from None
+
+    def wrap(self, arg: Iterable[Any], name: str) -> ValidatingIterator:
+        """ Wraps an argument in a proxy that validates its elements as they are consumed """
+        return ValidatingIterator(arg, self.validator, name)
+
+    def __repr__(self) -> str:
+        return f"Each({self.validator!r})"
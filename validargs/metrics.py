@@ -0,0 +1,212 @@
+""" Opt-in instrumentation of decorated functions: call counts, validation
+latencies and failure counts, keyed by function and argument.
+
+Functions are instrumented only when decorated with `validated(metrics=...)`,
+so the rest of them do not pay for it.
+"""
+from dataclasses import replace
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from validargs.proxies import ValidatorProxy
+
+
+# The upper bounds, in seconds, of the buckets of the validation latency histograms
+DEFAULT_BUCKETS = (
+    0.000001, 0.000005, 0.00001, 0.00005, 0.0001, 0.0005,
+    0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, float('inf'),
+)
+
+
+class ArgumentMetrics:
+    """ The validation metrics of a single argument of a decorated function """
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self.validations = 0
+        self.failures = 0
+        self.duration_sum = 0.0
+
+    def observe(self, duration: float, failed: bool) -> None:
+        self.validations += 1
+        self.duration_sum += duration
+        if failed:
+            self.failures += 1
+
+        for index, upper_bound in enumerate(self.buckets):
+            if duration <= upper_bound:
+                self.bucket_counts[index] += 1
+                break
+
+
+class MetricsRegistry:
+    """ Collects the metrics of the functions that are decorated with it.
+
+    Args:
+        buckets (tuple): The upper bounds, in seconds, of the buckets of the
+                            validation latency histograms. The last one must
+                            be infinity.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        if buckets[-1] != float('inf'):
+            raise ValueError("The last bucket must be infinity")
+
+        self.buckets = tuple(buckets)
+
+        self._calls: Dict[str, int] = {}
+        self._arguments: Dict[Tuple[str, str], ArgumentMetrics] = {}
+        self._lock = threading.Lock()
+
+    def record_call(self, function: str) -> None:
+        with self._lock:
+            self._calls[function] = self._calls.get(function, 0) + 1
+
+    def record_validation(self, function: str, argument: str, duration: float, failed: bool) -> None:
+        with self._lock:
+            key = (function, argument)
+            argument_metrics = self._arguments.get(key)
+            if argument_metrics is None:
+                argument_metrics = self._arguments[key] = ArgumentMetrics(self.buckets)
+            argument_metrics.observe(duration, failed)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._calls.clear()
+            self._arguments.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """ Exports the metrics as a dict, keyed by function and argument name.
+
+        Returns:
+            snapshot (dict): e.g.
+                {
+                    'my_module.my_function': {
+                        'calls': 10,
+                        'arguments': {
+                            'number': {
+                                'validations': 10,
+                                'failures': 1,
+                                'duration_sum': 0.00012,
+                                'duration_buckets': {0.000001: 0, 0.000005: 7, ...},
+                            },
+                        },
+                    },
+                }
+        """
+        with self._lock:
+            snapshot = {
+                function: {'calls': calls, 'arguments': {}}
+                for function, calls in self._calls.items()
+            }
+
+            for (function, argument), argument_metrics in self._arguments.items():
+                function_snapshot = snapshot.setdefault(function, {'calls': 0, 'arguments': {}})
+                function_snapshot['arguments'][argument] = {
+                    'validations': argument_metrics.validations,
+                    'failures': argument_metrics.failures,
+                    'duration_sum': argument_metrics.duration_sum,
+                    'duration_buckets': dict(zip(argument_metrics.buckets, argument_metrics.bucket_counts)),
+                }
+
+        return snapshot
+
+    def to_prometheus(self) -> str:
+        """ Exports the metrics in the Prometheus text exposition format """
+        lines = [
+            "# HELP validargs_calls_total Calls of validated functions.",
+            "# TYPE validargs_calls_total counter",
+        ]
+
+        snapshot = self.snapshot()
+
+        for function, function_snapshot in snapshot.items():
+            lines.append(f"validargs_calls_total{{function=\"{escape(function)}\"}} {function_snapshot['calls']}")
+
+        lines.extend([
+            "# HELP validargs_validation_failures_total Failed validations of arguments.",
+            "# TYPE validargs_validation_failures_total counter",
+        ])
+        for function, function_snapshot in snapshot.items():
+            for argument, argument_snapshot in function_snapshot['arguments'].items():
+                labels = f"function=\"{escape(function)}\",argument=\"{escape(argument)}\""
+                lines.append(f"validargs_validation_failures_total{{{labels}}} {argument_snapshot['failures']}")
+
+        lines.extend([
+            "# HELP validargs_validation_duration_seconds Duration of the validations of arguments.",
+            "# TYPE validargs_validation_duration_seconds histogram",
+        ])
+        for function, function_snapshot in snapshot.items():
+            for argument, argument_snapshot in function_snapshot['arguments'].items():
+                labels = f"function=\"{escape(function)}\",argument=\"{escape(argument)}\""
+                cumulative_count = 0
+                for upper_bound, count in argument_snapshot['duration_buckets'].items():
+                    cumulative_count += count
+                    le = '+Inf' if upper_bound == float('inf') else repr(upper_bound)
+                    lines.append(f"validargs_validation_duration_seconds_bucket{{{labels},le=\"{le}\"}} {cumulative_count}")
+                lines.append(f"validargs_validation_duration_seconds_sum{{{labels}}} {argument_snapshot['duration_sum']!r}")
+                lines.append(f"validargs_validation_duration_seconds_count{{{labels}}} {argument_snapshot['validations']}")
+
+        return '\n'.join(lines) + '\n'
+
+    def write_prometheus(self, path: str) -> None:
+        """ Writes the metrics in the Prometheus text exposition format to a
+        file, e.g. for the textfile collector of the node exporter.
+        """
+        with open(path, 'w') as file:
+            file.write(self.to_prometheus())
+
+
+def escape(label_value: str) -> str:
+    """ Escapes a label value for the Prometheus text exposition format """
+    return label_value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class InstrumentedValidator(ValidatorProxy):
+    """ Proxy of a Validator that records the duration and the outcome of
+    each validation in a metrics registry.
+    """
+
+    def __init__(self, validator: Any, registry: MetricsRegistry, function: str, argument: str):
+        super().__init__(validator, function, argument)
+        self.registry = registry
+
+    def started(self, arg: Any) -> float:
+        return time.perf_counter()
+
+    def finished(self, state: float, arg: Any, reason: Optional[Exception]) -> None:
+        self.registry.record_validation(self.function, self.argument, time.perf_counter() - state, reason is not None)
+
+
+def instrument_plan(plan: Any, registry: MetricsRegistry, function: str) -> Any:
+    """ Constructs a copy of a call plan whose validators record their metrics """
+    return replace(
+        plan,
+        parameters=tuple(
+            replace(param, validator=InstrumentedValidator(param.validator, registry, function, param.name))
+            if param.validator else param
+            for param in plan.parameters
+        ),
+        # The base plan may be interned and shared with functions that are not instrumented
+        validated_defaults=set(),
+    )
+
+
+def counting_wrapper(wrapped: Callable, plan: Any, registry: MetricsRegistry, function: str) -> Callable:
+    """ Constructs a wrapper that counts the calls of a decorated function """
+    if plan.is_coroutine:
+        async def counted(*args, **kwargs) -> Any:
+            registry.record_call(function)
+            return await wrapped(*args, **kwargs)
+    else:
+        def counted(*args, **kwargs) -> Any:
+            registry.record_call(function)
+            return wrapped(*args, **kwargs)
+
+    return counted
+
+
+# Registry used by the functions decorated with `validated(metrics=True)`
+default_registry = MetricsRegistry()
@@ -0,0 +1,163 @@
+""" Validation of the outputs of decorated functions.
+
+The return value of regular and coroutine functions is validated when the
+function returns. Generators and async generators are wrapped in a generator
+that validates each yielded value as it is consumed, forwarding the values
+sent and the exceptions thrown into it to the decorated generator.
+
+The outputs of transforming validators (see Validator.transform) are
+returned or yielded in place of the outputs of the decorated function.
+"""
+from typing import Any, AsyncGenerator, Callable, Generator, Optional
+
+from validargs.exceptions import ElementValidationError, ValidationError
+
+
+def element_error(index: int, exc: Exception) -> ElementValidationError:
+    """ Constructs the error of an invalid yielded value, caused by the failure of its validator """
+    error = ElementValidationError([index])
+    error.__cause__ = exc
+    return error
+
+
+def validate_yields(
+    generator: Generator,
+    yields: Optional[Any],
+    returns: Optional[Any],
+) -> Generator:
+    """ Wraps a generator, validating each value it yields and the value it returns.
+
+    Args:
+        generator (Generator): The generator of the decorated function
+        yields (Validator): The validator of each yielded value, if any
+        returns (Validator): The validator of the returned value, if any
+
+    Returns:
+        generator (Generator): The validating generator, which returns the
+                                value that the decorated generator returns
+    """
+    index = 0
+    resume, value = generator.send, None
+
+    while True:
+        try:
+            item = resume(value)
+        except StopIteration as stop:
+            if returns is not None:
+                try:
+                    result = returns.validate(stop.value)
+                except Exception as exc:
+                    raise ValidationError("Validation failed for return value") from exc
+                if returns.transform:
+                    return result
+            return stop.value
+
+        if yields is not None:
+            try:
+                result = yields.validate(item)
+            except Exception as exc:
+                generator.close()
+                raise ValidationError("Validation failed for yielded value") from element_error(index, exc)
+            if yields.transform:
+                item = result
+        index += 1
+
+        try:
+            value = yield item
+            resume = generator.send
+        except GeneratorExit:
+            generator.close()
+            raise
+        except BaseException as exc:
+            resume, value = generator.throw, exc
+
+
+async def validate_async_yields(generator: AsyncGenerator, yields: Any) -> AsyncGenerator:
+    """ Wraps an async generator, validating each value it yields.
+    Async validators are awaited.
+
+    Args:
+        generator (AsyncGenerator): The async generator of the decorated function
+        yields (Validator): The validator of each yielded value
+
+    Returns:
+        generator (AsyncGenerator): The validating async generator
+    """
+    index = 0
+    resume, value = generator.asend, None
+    is_async = yields.is_async
+    transform = yields.transform
+
+    while True:
+        try:
+            item = await resume(value)
+        except StopAsyncIteration:
+            return
+
+        try:
+            result = yields.validate(item)
+            if is_async:
+                await result
+        except Exception as exc:
+            await generator.aclose()
+            raise ValidationError("Validation failed for yielded value") from element_error(index, exc)
+        if transform:
+            item = result
+        index += 1
+
+        try:
+            value = yield item
+            resume = generator.asend
+        except GeneratorExit:
+            await generator.aclose()
+            raise
+        except BaseException as exc:
+            resume, value = generator.athrow, exc
+
+
+def output_validator(plan: Any) -> Optional[Callable[[Any], Any]]:
+    """ Constructs the function that validates the output of a call of the
+    decorated function, which the wrappers call with the result of the call.
+
+    Args:
+        plan (CallPlan): The call plan of the decorated function
+
+    Returns:
+        validate_output (Callable): Receives the result of the call and returns
+                                    the result, or its normalized value for a
+                                    transforming validator, or the validating
+                                    generator of a generator. An async function for coroutine
+                                    functions. None if the outputs are not validated.
+    """
+    returns = plan.returns
+    yields = plan.yields
+
+    if returns is None and yields is None:
+        return None
+
+    if plan.is_async_generator:
+        return lambda generator: validate_async_yields(generator, yields)
+
+    if plan.is_generator:
+        return lambda generator: validate_yields(generator, yields, returns)
+
+    transform = returns.transform
+
+    if plan.is_coroutine:
+        async def validate_output(result: Any) -> Any:
+            try:
+                validation = returns.validate(result)
+                if returns.is_async:
+                    await validation
+            except Exception as exc:
+                raise ValidationError("Validation failed for return value") from exc
+            return validation if transform else result
+    else:
+        def validate_output(result: Any) -> Any:
+            try:
+                validation = returns.validate(result)
+            except Exception as exc:
+                raise ValidationError("Validation failed for return value") from exc
+            return validation if transform else result
+
+    return validate_output
@@ -0,0 +1,70 @@
+""" Proxies of validators that observe each validation, e.g. for hooks and metrics. """
+from typing import Any, Optional
+
+
+class ValidatorProxy:
+    """ Proxy of a Validator that observes the start and the outcome of each
+    validation. Subclasses implement `started` and `finished`.
+
+    Args:
+        validator (Validator): The proxied validator
+        function (str): The qualified name of the decorated function
+        argument (str): The name of the validated argument
+    """
+
+    # The validation must go through the proxy, so the validator function cannot be called directly
+    plain_func = None
+
+    def __init__(self, validator: Any, function: str, argument: str):
+        self.validator = validator
+        self.function = function
+        self.argument = argument
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.validator, name)
+
+    def started(self, arg: Any) -> Any:
+        """ Called before the validation of an argument.
+
+        Returns:
+            state (Any): Passed to `finished` once the outcome is known
+        """
+        raise NotImplementedError
+
+    def finished(self, state: Any, arg: Any, reason: Optional[Exception]) -> None:
+        """ Called with the reason of the failure of a validation, or None if it passed """
+        raise NotImplementedError
+
+    def validate(self, arg: Any):
+        state = self.started(arg)
+
+        try:
+            result = self.validator.validate(arg)
+        except Exception as exc:
+            self.finished(state, arg, exc)
+            raise
+
+        if self.validator.is_async:
+            return self.validate_async(result, arg, state)
+
+        self.finished(state, arg, None)
+
+        return result
+
+    def check(self, arg: Any) -> Optional[Exception]:
+        state = self.started(arg)
+        reason = self.validator.check(arg)
+        self.finished(state, arg, reason)
+
+        return reason
+
+    async def validate_async(self, awaitable: Any, arg: Any, state: Any) -> Any:
+        try:
+            result = await awaitable
+        except Exception as exc:
+            self.finished(state, arg, exc)
+            raise
+
+        self.finished(state, arg, None)
+
+        return result
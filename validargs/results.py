@@ -0,0 +1,34 @@
+""" Results of checking the arguments of a call without raising. """
+from typing import Optional
+
+
+class CheckResult:
+    """ The outcome of checking the arguments of a call, without calling the
+    decorated function. It is truthy if the arguments are valid.
+
+    Attributes:
+        argument (str): The name of the first invalid argument, in signature order,
+                        or None if the arguments are valid or could not be bound
+        reason (Exception): The reason of the failure, or None if the arguments are valid
+    """
+    __slots__ = ('argument', 'reason')
+
+    def __init__(self, argument: Optional[str] = None, reason: Optional[Exception] = None):
+        self.argument = argument
+        self.reason = reason
+
+    @property
+    def passed(self) -> bool:
+        return self.reason is None
+
+    def __bool__(self) -> bool:
+        return self.reason is None
+
+    def __repr__(self) -> str:
+        if self.reason is None:
+            return 'CheckResult(passed=True)'
+        return f"CheckResult(passed=False, argument={self.argument!r}, reason={self.reason!r})"
+
+
+# All the calls that pass share the same result
+PASSED = CheckResult()
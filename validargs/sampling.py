@@ -0,0 +1,59 @@
+""" Sampling of the calls that are validated, for high-QPS code paths. """
+import itertools
+import random
+from typing import Optional
+
+
+class Sampler:
+    """ Decides which calls of a decorated function are validated, and counts
+    the calls that were sampled (validated) and skipped.
+
+    Args:
+        every (int): Validate 1 in every N calls, starting with the first one
+        rate (float): Validate a random fraction of the calls, between 0 and 1
+
+    If neither is set, every call is validated.
+    """
+
+    def __init__(self, every: Optional[int] = None, rate: Optional[float] = None):
+        self.sampled = 0
+        self.skipped = 0
+        self.configure(every=every, rate=rate)
+
+    def configure(self, every: Optional[int] = None, rate: Optional[float] = None) -> None:
+        """ Changes the sampling of the calls. Takes effect on the next call. """
+        if every is not None and rate is not None:
+            raise ValueError("Sampler expects at most one of 'every' or 'rate'")
+        if every is not None and every < 1:
+            raise ValueError("every must be a positive integer")
+        if rate is not None and not 0 <= rate <= 1:
+            raise ValueError("rate must be between 0 and 1")
+
+        self.every = every
+        self.rate = rate
+        self._calls = itertools.count()
+
+    def should_validate(self) -> bool:
+        if self.every is not None:
+            sample = next(self._calls) % self.every == 0
+        elif self.rate is not None:
+            sample = random.random() < self.rate
+        else:
+            sample = True
+
+        if sample:
+            self.sampled += 1
+        else:
+            self.skipped += 1
+
+        return sample
+
+    def reset(self) -> None:
+        """ Resets the counters of the sampled and skipped calls """
+        self.sampled = 0
+        self.skipped = 0
+
+
+# Sampler shared by all the functions decorated with `validated(sampler=global_sampler)`.
+# It validates every call, until it is configured otherwise.
+global_sampler = Sampler()
@@ -1,103 +1,1220 @@
-from dataclasses import dataclass
+import asyncio
+from dataclasses import dataclass, field
 import functools
-from inspect import Parameter, signature
-from typing import Any, Callable, Dict
+from inspect import Parameter, isasyncgenfunction, iscoroutinefunction, isfunction, isgeneratorfunction, signature
+import threading
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple, Union
 
-from validargs.exceptions import ValidationError
+from validargs import batch, codegen, concurrency, outputs
+from validargs.cache import ValidationCache
+from validargs.checks import Buffer, Check, InstanceOf, Length, Matches, OneOf, Range
+from validargs.composite import AllOf, AnyOf
+from validargs.exceptions import MultipleValidationError, RejectedValueError, ValidationError
+from validargs.hooks import Hooks, apply_hooks, global_hooks
+from validargs.interning import intern, intern_defaults, slotted
+from validargs.iterators import Each
+from validargs.metrics import MetricsRegistry, counting_wrapper, default_registry, instrument_plan
+from validargs.results import PASSED, CheckResult
+from validargs.sampling import Sampler
+from validargs.variadic import Elements
 
 
-@dataclass
+ENGINES = ('interpreted', 'codegen')
+
+# Serializes the compilation of lazily decorated functions. Compilation happens
+# once per function, so a single lock is enough and saves memory per function.
+compile_lock = threading.RLock()
+
+
+@slotted
+@dataclass(frozen=True)
 class Validator:
     """ Validator class used to differentiate between a regular default
     value and one that needs to be validated by a given validation rule.
+
+    Validators are immutable, and equal Validators are interned when a
+    function is decorated, so that they are stored only once (see interning).
+
+    The default value is validated only the first time it is used. Set
+    `mutable_default` for default values that can be mutated between calls,
+    so that they are validated every time they are used.
+
+    The `validator_func` can also be a coroutine function, in which case
+    `validate` returns an awaitable and the decorated function must be a
+    coroutine function as well.
+
+    The `validator_func` signals a failure by raising an exception, or by
+    returning False.
+
+    The outcomes of pure validators can be memoized by setting a `cache`
+    (see cache.ValidationCache).
+
+    Set `blocking` for validators that block or release the GIL (e.g. I/O,
+    hashing), so that they run on a thread pool in functions decorated with
+    `validated(threaded=True)`.
+
+    Use `Validator.all_of` and `Validator.any_of` to chain multiple validator
+    functions (see composite.AllOf and composite.AnyOf).
+
+    Use `Validator.range`, `.length`, `.instance_of`, `.matches`, `.one_of`
+    and `.buffer` for the built-in checks, which the `codegen` engine evaluates inline
+    (see checks.Check).
+
+    Use `Validator.each` for iterator arguments, whose elements are validated
+    lazily, as the decorated function consumes them (see iterators.Each).
+
+    Set `transform` for validators that parse or normalize the argument, so that
+    the value they return is passed in the decorated function instead of the
+    argument, and the parsing happens once per call. Transforming validators
+    signal a failure only by raising an exception. Their default value is
+    passed as it is, so it must already be normalized, and it is not validated.
     """
     validator_func: Callable
     default_value: Any = Parameter.empty
+    mutable_default: bool = False
+    cache: Optional[ValidationCache] = None
+    blocking: bool = False
+    transform: bool = False
+
+    def __post_init__(self):
+        if self.cache is not None and self.is_async:
+            raise TypeError("The outcomes of async validators cannot be cached")
+        if self.transform and (self.cache is not None or self.is_async):
+            raise TypeError("Transforming validators can be neither cached nor async")
+
+    @classmethod
+    def all_of(cls, *validator_funcs: Callable, adaptive: bool = True, **kwargs: Any) -> 'Validator':
+        """ Constructs a Validator that passes if all of the validator functions pass.
+
+        Args:
+            validator_funcs (Callable): The validator functions
+            adaptive (bool): Whether to reorder the validator functions online,
+                                so that cheap ones that fail often run first
+            kwargs (Any): Any other arguments of the Validator
+        """
+        return cls(AllOf(validator_funcs, adaptive=adaptive), **kwargs)
+
+    @classmethod
+    def any_of(cls, *validator_funcs: Callable, adaptive: bool = True, **kwargs: Any) -> 'Validator':
+        """ Constructs a Validator that passes if any of the validator functions passes.
+
+        Args:
+            validator_funcs (Callable): The validator functions
+            adaptive (bool): Whether to reorder the validator functions online,
+                                so that cheap ones that pass often run first
+            kwargs (Any): Any other arguments of the Validator
+        """
+        return cls(AnyOf(validator_funcs, adaptive=adaptive), **kwargs)
+
+    @classmethod
+    def range(cls, min: Any = None, max: Any = None, **kwargs: Any) -> 'Validator':
+        """ Constructs a Validator that checks that the argument is within the given (inclusive) bounds """
+        return cls(Range(min, max), **kwargs)
+
+    @classmethod
+    def length(cls, min: Optional[int] = None, max: Optional[int] = None, **kwargs: Any) -> 'Validator':
+        """ Constructs a Validator that checks that the length of the argument is within the given (inclusive) bounds """
+        return cls(Length(min, max), **kwargs)
+
+    @classmethod
+    def instance_of(cls, *types: type, **kwargs: Any) -> 'Validator':
+        """ Constructs a Validator that checks that the argument is an instance of any of the given types """
+        return cls(InstanceOf(*types), **kwargs)
+
+    @classmethod
+    def matches(cls, pattern: Any, flags: int = 0, full: bool = True, **kwargs: Any) -> 'Validator':
+        """ Constructs a Validator that checks that the argument matches a regular expression.
+
+        Args:
+            pattern (str): The regular expression, which is compiled once
+            flags (int): The flags of the regular expression (e.g. re.IGNORECASE)
+            full (bool): Whether the whole argument must match, or any part of it
+            kwargs (Any): Any other arguments of the Validator
+        """
+        return cls(Matches(pattern, flags, full), **kwargs)
+
+    @classmethod
+    def one_of(cls, values: Iterable[Any], **kwargs: Any) -> 'Validator':
+        """ Constructs a Validator that checks that the argument is one of the given values """
+        return cls(OneOf(values), **kwargs)
+
+    @classmethod
+    def buffer(
+        cls,
+        min_nbytes: Optional[int] = None,
+        max_nbytes: Optional[int] = None,
+        itemsize: Optional[int] = None,
+        format: Union[str, Iterable[str], None] = None,
+        shape: Optional[Iterable[Optional[int]]] = None,
+        contiguous: Optional[str] = None,
+        magic: Optional[bytes] = None,
+        **kwargs: Any,
+    ) -> 'Validator':
+        """ Constructs a Validator that checks the layout of a buffer (e.g. bytes,
+        bytearray, memoryview or a NumPy array) through a memoryview, without
+        copying it (see checks.Buffer for the arguments).
+        """
+        return cls(Buffer(min_nbytes, max_nbytes, itemsize, format, shape, contiguous, magic), **kwargs)
+
+    @classmethod
+    def each(cls, validator: Union['Validator', Callable], **kwargs: Any) -> 'Validator':
+        """ Constructs a Validator of an iterator argument, which is passed in the
+        decorated function wrapped in a proxy that validates each of its elements
+        as it is consumed. Only the fact that the argument is iterable is validated
+        up front, and by `check`.
+
+        Args:
+            validator (Validator): The validator of each element, or a validator function
+            kwargs (Any): Any other arguments of the Validator
+        """
+        if not isinstance(validator, Validator):
+            validator = cls(validator)
+        return cls(Each(validator), **kwargs)
+
+    @property
+    def is_async(self) -> bool:
+        return iscoroutinefunction(self.validator_func)
+
+    @property
+    def plain_func(self) -> Optional[Callable]:
+        """ The validator function, if validating an argument only takes calling it,
+        so that the `codegen` engine can call it directly, or evaluate it inline if
+        it is a built-in check. None for cached, async and customized validators.
+        """
+        if type(self).validate is not Validator.validate or self.cache is not None:
+            return None
+        if not self.validator_func or self.is_async or self.transform:
+            return None
+        return self.validator_func
 
     def validate(self, arg: Any):
-        if self.validator_func:
-            self.validator_func(arg)
+        if not self.validator_func:
+            return None
+        if self.cache is not None:
+            return self.cache.validate(self.validator_func, arg)
+
+        result = self.validator_func(arg)
+        if result is None or result is True or self.transform:
+            return result
+        if result is False:
+            raise RejectedValueError(arg)
+        if self.is_async:
+            return self.validate_async(result, arg)
+        return result
+
+    async def validate_async(self, awaitable: Any, arg: Any) -> Any:
+        result = await awaitable
+        if result is False:
+            raise RejectedValueError(arg)
+        return result
+
+    def check(self, arg: Any) -> Optional[Exception]:
+        """ Validates an argument of a synchronous validator without raising.
+
+        Failures that the validator signals by returning False, and those
+        of the built-in checks, do not raise an exception at all.
 
+        Returns:
+            reason (Exception): The reason of the failure, or None if the argument is valid
+        """
+        validator_func = self.validator_func
+        if not validator_func:
+            return None
 
-def get_args_dict(func: Callable, args: tuple, kwargs: dict) -> Dict[str, Any]:
-    """ Constructs a dict with names/values of all passed arguments.
+        if self.cache is not None or type(self).validate is not Validator.validate:
+            try:
+                self.validate(arg)
+            except Exception as exc:
+                return exc
+            return None
+
+        if isinstance(validator_func, Check):
+            try:
+                return validator_func.error(arg) if validator_func.is_invalid(arg) else None
+            except Exception as exc:
+                return exc
+
+        try:
+            result = validator_func(arg)
+        except Exception as exc:
+            return exc
+
+        return RejectedValueError(arg) if result is False and not self.transform else None
+
+
+@slotted
+@dataclass(frozen=True)
+class ParameterPlan:
+    """ Everything the wrapper needs to know about a single parameter of the
+    decorated function, resolved once at decoration time.
+
+    Attributes:
+        name (str): The name of the parameter
+        kind (_ParameterKind): The kind of the parameter (e.g. POSITIONAL_ONLY)
+        position (int): The index of the parameter in the positional arguments,
+                        or of the first of them for *args, or None if it
+                        cannot be passed positionally
+        validator (Validator): The validator of the parameter, if any
+        default (Any): The value used when the argument is not provided.
+                        An empty tuple for variadic parameters
+        on_default (Callable): Called with the default value of the validator
+                                when it is assigned (see hooks.apply_hooks)
+        wrap (Callable): Wraps the argument, along with the name of the parameter,
+                            before it is passed in the decorated function
+                            (see iterators.Each.wrap)
+        transform (bool): Whether the validator of the parameter is transforming,
+                            so that the value it returns is passed in the
+                            decorated function instead of the argument
+    """
+    name: str
+    kind: Any
+    position: Optional[int]
+    validator: Optional[Validator]
+    default: Any
+    on_default: Optional[Callable] = None
+    wrap: Optional[Callable] = None
+    transform: bool = False
+
+
+@slotted
+@dataclass(frozen=True)
+class CallPlan:
+    """ An immutable, pre-computed analysis of a decorated function's signature.
+
+    Equal call plans are interned, so that functions with the same name and
+    signature share a single call plan (see interning).
+
+    Attributes:
+        func_name (str): The name of the decorated function
+        parameters (tuple): A ParameterPlan for each parameter, in signature order
+        is_coroutine (bool): Whether the decorated function is a coroutine function
+        is_generator (bool): Whether the decorated function is a generator function
+        is_async_generator (bool): Whether the decorated function is an async generator function
+        positional_count (int): The number of parameters that can be passed
+                                positionally, other than *args
+        var_positional (bool): Whether the decorated function accepts *args
+        keyword_names (frozenset): The names of the parameters that can be
+                                    passed as keywords, other than **kwargs
+        var_keyword (bool): Whether the decorated function accepts **kwargs
+        returns (Validator): The validator of the return value, if any
+        yields (Validator): The validator of each yielded value, if any
+        validated_defaults (set): The names of the parameters whose validator's
+                                    default value has already been validated
+    """
+    func_name: str
+    parameters: Tuple[ParameterPlan, ...]
+    is_coroutine: bool = False
+    is_generator: bool = False
+    is_async_generator: bool = False
+    positional_count: int = 0
+    var_positional: bool = False
+    keyword_names: FrozenSet[str] = frozenset()
+    var_keyword: bool = False
+    returns: Optional[Validator] = None
+    yields: Optional[Validator] = None
+    validated_defaults: Set[str] = field(default_factory=set, compare=False, repr=False)
+
+    @property
+    def has_validators(self) -> bool:
+        return any(param.validator for param in self.parameters)
+
+    @property
+    def has_async_validators(self) -> bool:
+        return any(param.validator and param.validator.is_async for param in self.parameters)
+
+    @property
+    def has_output_validators(self) -> bool:
+        return self.returns is not None or self.yields is not None
+
+
+def build_plan(
+    func: Callable,
+    variadic: Optional[Dict[str, Validator]] = None,
+    returns: Optional[Validator] = None,
+    yields: Optional[Validator] = None,
+) -> CallPlan:
+    """ Analyses the signature of a function and constructs its call plan.
 
     NOTE: It requires that the Signature.parameters are ordered.
 
     Args:
         func (Callable): The decorated function
+        variadic (dict): The validators of the elements of the variadic
+                            parameters (*args, **kwargs), keyed by their name
+        returns (Validator): The validator of the return value
+        yields (Validator): The validator of each yielded value
+
+    Returns:
+        plan (CallPlan): The call plan of the decorated function
+    """
+    intern_defaults(func, lambda default: isinstance(default, Validator))
+
+    variadic = variadic or {}
+    parameters = []
+    position = 0
+
+    for param in signature(func).parameters.values():
+        if param.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD):
+            element_validator = variadic.get(param.name)
+            validator = intern(Validator(
+                Elements(element_validator, keyword=param.kind == Parameter.VAR_KEYWORD)
+            )) if element_validator else None
+            # The elements of *args start after the rest of the positional arguments
+            param_position = position if param.kind == Parameter.VAR_POSITIONAL else None
+            default = ()
+        else:
+            validator = intern(param.default) if isinstance(param.default, Validator) else None
+            default = validator.default_value if validator else param.default
+
+            if param.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+                param_position = position
+                position += 1
+            else:
+                param_position = None
+
+        parameters.append(
+            intern(ParameterPlan(
+                name=param.name,
+                kind=param.kind,
+                position=param_position,
+                validator=validator,
+                default=default,
+                wrap=validator.validator_func.wrap if validator and isinstance(validator.validator_func, Each) else None,
+                transform=bool(validator and validator.transform),
+            ))
+        )
+
+    unknown_names = set(variadic) - {
+        param.name for param in parameters
+        if param.kind in (Parameter.VAR_POSITIONAL, Parameter.VAR_KEYWORD)
+    }
+    if unknown_names:
+        raise ValueError(f"{func.__name__}() has no variadic parameters: {', '.join(sorted(unknown_names))}")
+
+    return intern(CallPlan(
+        func_name=func.__name__,
+        parameters=tuple(parameters),
+        is_coroutine=iscoroutinefunction(func),
+        is_generator=isgeneratorfunction(func),
+        is_async_generator=isasyncgenfunction(func),
+        positional_count=position,
+        var_positional=any(param.kind == Parameter.VAR_POSITIONAL for param in parameters),
+        keyword_names=frozenset(
+            param.name for param in parameters
+            if param.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY)
+        ),
+        var_keyword=any(param.kind == Parameter.VAR_KEYWORD for param in parameters),
+        returns=intern(returns) if returns is not None else None,
+        yields=intern(yields) if yields is not None else None,
+    ))
+
+
+def validate_argument(param: ParameterPlan, value: Any) -> Any:
+    """ Validates a single argument, translating any failure of the
+    validator into a ValidationError.
+
+    Returns:
+        result (Any): The result of the validator, i.e. the normalized
+                        value of the argument for transforming validators
+    """
+    try:
+        return param.validator.validate(value)
+    except Exception as exc:
+        raise ValidationError(f"Validation failed for argument: '{param.name}'") from exc
+
+
+def validate_default(plan: CallPlan, param: ParameterPlan) -> None:
+    """ Validates the default value of a parameter's validator, unless it
+    has already been validated.
+    """
+    if param.name in plan.validated_defaults:
+        return
+
+    validate_argument(param, param.default)
+
+    if not param.validator.mutable_default:
+        plan.validated_defaults.add(param.name)
+
+
+def bind_arguments(
+    plan: CallPlan,
+    args: tuple,
+    kwargs: dict,
+    wrap: bool = True,
+) -> Tuple[List[Any], tuple, Dict[str, Any], List[Tuple[ParameterPlan, Any, bool]]]:
+    """ Binds the arguments passed in the decorated function to its parameters
+    and assigns the default values of the arguments that were not provided.
+
+    The arguments of transforming validators are validated along with the rest
+    of the arguments, in signature order, and the wrappers replace them with
+    their normalized values (see transform_argument).
+
+    Arguments that cannot be bound raise a TypeError, like they do when the
+    decorated function is called directly.
+
+    Args:
+        plan (CallPlan): The call plan of the decorated function
         args (tuple): Positional arguments passed in the decorated function
         kwargs (dict): Keyword arguments passed in the decorated function
+        wrap (bool): Whether to wrap the arguments whose parameters have a
+                        `wrap` function (see iterators.Each.wrap). False for the
+                        calls whose arguments are not validated.
 
     Returns:
-        args_dict (dict): A name/value dictionary for all the arguments that
-                            were passed in the decorated function
-    """
-    arg_names = [
-        param.name
-        for param in signature(func).parameters.values()
-        if param.kind in (
-            Parameter.POSITIONAL_ONLY,
-            Parameter.POSITIONAL_OR_KEYWORD,
+        new_args (list): Positional arguments for the decorated function
+        var_args (tuple): The arguments of *args, which are passed after the
+                            positional arguments. A slice of the arguments
+                            of the call, whose elements are not copied.
+        new_kwargs (dict): Keyword arguments for the decorated function
+        validations (list): A (parameter, value, is_default) tuple for each
+                            argument that needs to be validated
+    """
+    args_count = len(args)
+
+    if args_count > plan.positional_count and not plan.var_positional:
+        raise TypeError(
+            f"{plan.func_name}() takes {plan.positional_count} positional "
+            f"argument{'' if plan.positional_count == 1 else 's'} but {args_count} were given"
         )
-    ]
 
-    args_dict = {}
-    for arg_name, arg_value in zip(arg_names, args):
-        args_dict[arg_name] = arg_value
+    if kwargs and not plan.var_keyword:
+        for name in kwargs:
+            if name in plan.keyword_names:
+                continue
+            if any(param.name == name and param.kind == Parameter.POSITIONAL_ONLY for param in plan.parameters):
+                raise TypeError(
+                    f"{plan.func_name}() got some positional-only arguments passed as keyword arguments: '{name}'"
+                )
+            raise TypeError(f"{plan.func_name}() got an unexpected keyword argument '{name}'")
+
+    new_args = []
+    var_args = ()
+    new_kwargs = {}
+    validations = []
+    keyword_count = 0
+
+    for param in plan.parameters:
+        if param.kind == Parameter.VAR_POSITIONAL:
+            # The remaining positional arguments. Slicing a tuple from
+            # its start returns the same tuple, without copying it.
+            if param.position < args_count:
+                var_args = args[param.position:]
+            if param.validator:
+                validations.append((param, var_args, False))
+            continue
+
+        if param.kind == Parameter.VAR_KEYWORD:
+            # The remaining keyword arguments. The dict is passed as is
+            # when none of the named parameters were provided as keywords.
+            if keyword_count == 0:
+                param_value = kwargs
+            else:
+                param_value = {name: value for name, value in kwargs.items() if name not in new_kwargs}
+            if param.validator:
+                validations.append((param, param_value, False))
+            new_kwargs.update(param_value)
+            continue
+
+        if param.name in kwargs and param.kind != Parameter.POSITIONAL_ONLY:
+            # Argument has been provided as a keyword
+            if param.position is not None and param.position < args_count:
+                raise TypeError(f"{plan.func_name}() got multiple values for argument '{param.name}'")
+            param_value = kwargs[param.name]
+            is_keyword = True
+            is_default = False
+            keyword_count += 1
+
+        elif param.position is not None and param.position < args_count:
+            # Argument has been provided as a positional
+            param_value = args[param.position]
+            is_keyword = False
+            is_default = False
+
+        else:
+            # Argument has not been provided. Try to assign defaults
+            param_value = param.default
+
+            if param_value is Parameter.empty:
+                raise TypeError(f"{plan.func_name}() missing 1 required positional argument: '{param.name}'")
+
+            is_keyword = param.kind != Parameter.POSITIONAL_ONLY
+            is_default = True
+
+            if param.on_default is not None:
+                param.on_default(param_value)
+
+        if param.transform:
+            # The default value of a transforming validator is already normalized
+            if not is_default:
+                validations.append((param, param_value, is_default))
+
+        elif param.validator:
+            validations.append((param, param_value, is_default))
+
+            if wrap and param.wrap is not None:
+                param_value = param.wrap(param_value, param.name)
+
+        if is_keyword:
+            new_kwargs[param.name] = param_value
+        else:
+            new_args.append(param_value)
+
+    return new_args, var_args, new_kwargs, validations
+
+
+def transform_argument(param: ParameterPlan, value: Any, new_args: List[Any], new_kwargs: Dict[str, Any]) -> None:
+    """ Replaces an argument bound by bind_arguments with its normalized value.
+    The arguments bound positionally are at the position of their parameter.
+    """
+    if param.position is not None and param.position < len(new_args):
+        new_args[param.position] = value
+    else:
+        new_kwargs[param.name] = value
+
+
+def transform_arguments(validations: list, new_args: List[Any], new_kwargs: Dict[str, Any]) -> None:
+    """ Transforms the arguments of the transforming validators only, in the
+    calls that are not validated otherwise (see sampled_wrapper).
+    """
+    for param, param_value, _ in validations:
+        if param.transform:
+            transform_argument(param, validate_argument(param, param_value), new_args, new_kwargs)
+
+
+async def validate_concurrently(plan: CallPlan, validations: list) -> None:
+    """ Awaits the async validators of a single call concurrently.
+
+    All validators run to completion and the failure of the first argument,
+    in signature order, is raised.
+    """
+    results = await asyncio.gather(
+        *[param.validator.validate(value) for param, value, _ in validations],
+        return_exceptions=True,
+    )
+
+    for (param, _, is_default), result in zip(validations, results):
+        if isinstance(result, Exception):
+            raise ValidationError(f"Validation failed for argument: '{param.name}'") from result
+        if isinstance(result, BaseException):
+            raise result
+        if is_default and not param.validator.mutable_default:
+            plan.validated_defaults.add(param.name)
+
+
+def check_arguments(plan: CallPlan, args: tuple, kwargs: dict) -> CheckResult:
+    """ Checks the arguments of a call against the call plan, without raising.
+
+    Args:
+        plan (CallPlan): The call plan of the decorated function
+        args (tuple): Positional arguments passed in the decorated function
+        kwargs (dict): Keyword arguments passed in the decorated function
+
+    Returns:
+        result (CheckResult): Whether the arguments are valid, or which one is not and why
+    """
+    try:
+        _, _, _, validations = bind_arguments(plan, args, kwargs, wrap=False)
+    except TypeError as exc:
+        return CheckResult(None, exc)
+
+    for param, param_value, is_default in validations:
+        if is_default and param.name in plan.validated_defaults:
+            continue
+
+        reason = param.validator.check(param_value)
+        if reason is not None:
+            return CheckResult(param.name, reason)
+
+        if is_default and not param.validator.mutable_default:
+            plan.validated_defaults.add(param.name)
+
+    return PASSED
+
+
+async def check_arguments_async(plan: CallPlan, args: tuple, kwargs: dict) -> CheckResult:
+    """ Checks the arguments of a call against a call plan with async
+    validators, without raising. The async validators are awaited concurrently.
+    """
+    try:
+        _, _, _, validations = bind_arguments(plan, args, kwargs, wrap=False)
+    except TypeError as exc:
+        return CheckResult(None, exc)
+
+    async def check_async(validator: Validator, value: Any) -> Optional[Exception]:
+        try:
+            await validator.validate(value)
+        except Exception as exc:
+            return exc
+        return None
+
+    reasons = {}
+    checked_validations = []
+    async_validations = []
+    for param, param_value, is_default in validations:
+        if is_default and param.name in plan.validated_defaults:
+            continue
+        checked_validations.append((param, is_default))
+        if param.validator.is_async:
+            async_validations.append((param, param_value))
+        else:
+            reasons[param.name] = param.validator.check(param_value)
+
+    async_reasons = await asyncio.gather(*[
+        check_async(param.validator, param_value) for param, param_value in async_validations
+    ])
+    for (param, _), reason in zip(async_validations, async_reasons):
+        reasons[param.name] = reason
+
+    result = PASSED
+    for param, is_default in checked_validations:
+        reason = reasons[param.name]
+        if reason is None:
+            if is_default and not param.validator.mutable_default:
+                plan.validated_defaults.add(param.name)
+        elif result is PASSED:
+            result = CheckResult(param.name, reason)
 
-    args_dict.update(kwargs)
+    return result
 
-    return args_dict
+
+def passthrough_wrapper(func: Callable, plan: CallPlan) -> Callable:
+    """ Constructs the thinnest possible wrapper, used for functions that
+    have no arguments to validate.
+    """
+    if plan.is_coroutine:
+        async def wrapped(*args, **kwargs) -> Any:
+            return await func(*args, **kwargs)
+    else:
+        def wrapped(*args, **kwargs) -> Any:
+            return func(*args, **kwargs)
+
+    return wrapped
 
 
-def validated(func: Callable) -> Callable:
-    @functools.wraps(func)
+def interpreted_wrapper(func: Callable, plan: CallPlan) -> Callable:
+    """ Constructs a wrapper that executes the call plan of the decorated
+    function, parameter by parameter.
+    """
+    validate_output = outputs.output_validator(plan)
+
     def wrapped(*args, **kwargs) -> Any:
-        args_dict = get_args_dict(func, args, kwargs)
+        new_args, var_args, new_kwargs, validations = bind_arguments(plan, args, kwargs)
+
+        for param, param_value, is_default in validations:
+            if is_default:
+                validate_default(plan, param)
+            elif param.transform:
+                transform_argument(param, validate_argument(param, param_value), new_args, new_kwargs)
+            else:
+                validate_argument(param, param_value)
+
+        result = func(*new_args, *var_args, **new_kwargs)
+        return result if validate_output is None else validate_output(result)
+
+    return wrapped
+
 
-        new_args = []
-        new_kwargs = {}
+def raise_failures(plan: CallPlan, failures: Dict[str, Exception]) -> None:
+    """ Raises a single ValidationError for the failures of one or more
+    arguments, in signature order.
+    """
+    failures = {
+        param.name: failures[param.name]
+        for param in plan.parameters
+        if param.name in failures
+    }
+
+    first_name, first_exception = next(iter(failures.items()))
+
+    if len(failures) == 1:
+        raise ValidationError(f"Validation failed for argument: '{first_name}'") from first_exception
+
+    raise MultipleValidationError(failures) from first_exception
 
-        for param in signature(func).parameters.values():
-            validator = param.default if isinstance(param.default, Validator) else None
 
-            if param.name in args_dict:
-                # Argument has been provided
-                param_value = args_dict.get(param.name)
+def threaded_wrapper(func: Callable, plan: CallPlan) -> Callable:
+    """ Constructs a wrapper that runs the blocking validators of each call
+    concurrently on the shared thread pool, and the rest of them inline.
+
+    All the validators of a call run to completion and their failures are
+    aggregated in a single ValidationError.
+    """
+    validate_output = outputs.output_validator(plan)
+
+    def wrapped(*args, **kwargs) -> Any:
+        new_args, var_args, new_kwargs, validations = bind_arguments(plan, args, kwargs)
 
-                if validator:
-                    try:
-                        validator.validate(param_value)
-                    except Exception as exc:
-                        raise ValidationError(f"Validation failed for argument: '{param.name}'") from exc
+        blocking_count = sum(
+            1 for param, _, is_default in validations
+            if param.validator.blocking and not is_default
+        )
 
-                if param.name in kwargs:
-                    new_kwargs[param.name] = param_value
+        if blocking_count < 2:
+            # Not worth the overhead of the thread pool
+            for param, param_value, is_default in validations:
+                if is_default:
+                    validate_default(plan, param)
+                elif param.transform:
+                    transform_argument(param, validate_argument(param, param_value), new_args, new_kwargs)
                 else:
-                    new_args.append(param_value)
+                    validate_argument(param, param_value)
+
+            result = func(*new_args, *var_args, **new_kwargs)
+            return result if validate_output is None else validate_output(result)
 
+        thread_pool = concurrency.get_thread_pool()
+
+        futures = []
+        inline_validations = []
+        for param, param_value, is_default in validations:
+            if param.validator.blocking and not is_default:
+                futures.append((param, thread_pool.submit(param.validator.validate, param_value)))
             else:
-                # Argument has not been provided. Try to assign defaults
-                if validator:
-                    default_value = validator.default_value
+                inline_validations.append((param, param_value, is_default))
+
+        failures = {}
+        for param, param_value, is_default in inline_validations:
+            try:
+                if is_default:
+                    validate_default(plan, param)
+                elif param.transform:
+                    transform_argument(param, validate_argument(param, param_value), new_args, new_kwargs)
                 else:
-                    default_value = param.default
+                    validate_argument(param, param_value)
+            except ValidationError as exc:
+                failures[param.name] = exc.__cause__
+
+        for param, future in futures:
+            exception = future.exception()
+            if exception is not None:
+                if not isinstance(exception, Exception):
+                    raise exception
+                failures[param.name] = exception
+            elif param.transform:
+                transform_argument(param, future.result(), new_args, new_kwargs)
+
+        if failures:
+            raise_failures(plan, failures)
+
+        result = func(*new_args, *var_args, **new_kwargs)
+        return result if validate_output is None else validate_output(result)
+
+    return wrapped
+
+
+def async_wrapper(func: Callable, plan: CallPlan) -> Callable:
+    """ Constructs a wrapper for coroutine functions. The synchronous
+    validators run one after another and the async ones concurrently.
+    """
+    validate_output = outputs.output_validator(plan)
+
+    async def wrapped(*args, **kwargs) -> Any:
+        new_args, var_args, new_kwargs, validations = bind_arguments(plan, args, kwargs)
+
+        async_validations = []
+        for param, param_value, is_default in validations:
+            if is_default and param.name in plan.validated_defaults:
+                continue
+            if param.validator.is_async:
+                async_validations.append((param, param_value, is_default))
+            elif is_default:
+                validate_default(plan, param)
+            elif param.transform:
+                transform_argument(param, validate_argument(param, param_value), new_args, new_kwargs)
+            else:
+                validate_argument(param, param_value)
+
+        if async_validations:
+            await validate_concurrently(plan, async_validations)
+
+        result = await func(*new_args, *var_args, **new_kwargs)
+        return result if validate_output is None else await validate_output(result)
+
+    return wrapped
+
+
+def sampled_wrapper(func: Callable, plan: CallPlan, sampler: Sampler, validating_wrapper: Callable) -> Callable:
+    """ Constructs a wrapper that validates only the calls chosen by the sampler.
+    The rest of the calls are still assigned the default values of the
+    arguments that were not provided, and their arguments of transforming
+    validators are still transformed.
+    """
+    if plan.is_coroutine:
+        async def wrapped(*args, **kwargs) -> Any:
+            if sampler.should_validate():
+                return await validating_wrapper(*args, **kwargs)
+
+            new_args, var_args, new_kwargs, validations = bind_arguments(plan, args, kwargs, wrap=False)
+            transform_arguments(validations, new_args, new_kwargs)
+            return await func(*new_args, *var_args, **new_kwargs)
+    else:
+        def wrapped(*args, **kwargs) -> Any:
+            if sampler.should_validate():
+                return validating_wrapper(*args, **kwargs)
+
+            new_args, var_args, new_kwargs, validations = bind_arguments(plan, args, kwargs, wrap=False)
+            transform_arguments(validations, new_args, new_kwargs)
+            return func(*new_args, *var_args, **new_kwargs)
+
+    return wrapped
+
+
+def check_output_validators(plan: CallPlan) -> None:
+    """ Checks that the output validators of a call plan match the kind of the decorated function """
+    if plan.yields is not None and not (plan.is_generator or plan.is_async_generator):
+        raise TypeError(f"{plan.func_name}() has a yields validator, but is not a generator function")
+
+    if plan.returns is not None and plan.is_async_generator:
+        raise TypeError(f"{plan.func_name}() has a returns validator, but async generators cannot return a value")
+
+    if plan.returns is not None and plan.returns.is_async and not plan.is_coroutine:
+        raise TypeError(f"{plan.func_name}() has an async returns validator, but is not a coroutine function")
+
+    if plan.yields is not None and plan.yields.is_async and not plan.is_async_generator:
+        raise TypeError(f"{plan.func_name}() has an async yields validator, but is not an async generator function")
+
+
+def compile_wrapper(
+    func: Callable,
+    engine: str,
+    threaded: bool,
+    sampler: Optional[Sampler],
+    metrics: Union[bool, MetricsRegistry],
+    hooks: Optional[Hooks],
+    variadic: Optional[Dict[str, Validator]] = None,
+    returns: Optional[Validator] = None,
+    yields: Optional[Validator] = None,
+) -> Tuple[Callable, CallPlan]:
+    """ Analyses the signature of a function and constructs the wrapper that
+    executes its call plan. See `validated` for the arguments.
+
+    Returns:
+        wrapped (Callable): The wrapper of the function
+        plan (CallPlan): The call plan of the function
+    """
+    plan = build_plan(func, variadic, returns, yields)
+    function_name = f"{func.__module__}.{func.__qualname__}"
+
+    hooks = global_hooks + (hooks or Hooks())
+    if hooks:
+        plan = apply_hooks(plan, hooks, function_name)
+
+    if metrics:
+        registry = default_registry if metrics is True else metrics
+        plan = instrument_plan(plan, registry, function_name)
+
+    if plan.has_async_validators and not plan.is_coroutine:
+        raise TypeError(f"{plan.func_name}() has async validators, but is not a coroutine function")
+
+    if threaded and plan.is_coroutine:
+        raise TypeError(f"{plan.func_name}() is a coroutine function and cannot be threaded")
+
+    check_output_validators(plan)
+
+    wrapped = None
+    if not plan.has_validators and not plan.has_output_validators:
+        wrapped = passthrough_wrapper(func, plan)
+    elif threaded:
+        wrapped = threaded_wrapper(func, plan)
+    elif engine == 'codegen':
+        wrapped = codegen.generate_wrapper(func, plan, validate_default)
+    if wrapped is None:
+        wrapped = async_wrapper(func, plan) if plan.is_coroutine else interpreted_wrapper(func, plan)
+
+    if sampler is not None and (plan.has_validators or plan.has_output_validators):
+        wrapped = sampled_wrapper(func, plan, sampler, wrapped)
+
+    if metrics:
+        wrapped = counting_wrapper(wrapped, plan, registry, function_name)
+
+    return wrapped, plan
+
+
+def compile_checker(plan: CallPlan, engine: str) -> Callable:
+    """ Constructs the `check` function of a decorated function, which checks
+    the arguments of a call without raising (see `check_arguments`).
+    """
+    generated_checker = codegen.generate_checker(plan) if engine == 'codegen' else None
 
-                if default_value == Parameter.empty:
-                    raise TypeError(f"{func.__name__}() missing 1 required positional argument: '{param.name}'")
+    if generated_checker is not None:
+        def check(*args, **kwargs) -> CheckResult:
+            try:
+                return generated_checker(*args, **kwargs)
+            except TypeError as exc:
+                # The arguments cannot be bound to the signature
+                return CheckResult(None, exc)
+    elif plan.has_async_validators:
+        def check(*args, **kwargs) -> Awaitable[CheckResult]:
+            return check_arguments_async(plan, args, kwargs)
+    else:
+        def check(*args, **kwargs) -> CheckResult:
+            return check_arguments(plan, args, kwargs)
 
-                if validator:
-                    try:
-                        validator.validate(default_value)
-                    except Exception as exc:
-                        raise ValidationError(f"Validation failed for argument: '{param.name}'") from exc
+    return check
 
-                if param.kind in (Parameter.KEYWORD_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
-                    new_kwargs[param.name] = default_value
-                elif param.kind == Parameter.POSITIONAL_ONLY:
-                    new_args.append(default_value)
 
-        return func(*new_args, **new_kwargs)
+def lazy_wrapper(func: Callable, compile: Callable[[], Tuple[Callable, CallPlan]]) -> Callable:
+    """ Constructs a wrapper that compiles the actual wrapper of the function
+    on its first call, or when it is warmed up (see `warmup`).
+    """
+    compiled = None
+
+    def compile_once() -> Callable:
+        nonlocal compiled
+
+        with compile_lock:
+            if compiled is None:
+                compiled_wrapper, plan = compile()
+                wrapped.__validargs_plan__ = plan
+                compiled = compiled_wrapper
+
+        return compiled
+
+    if iscoroutinefunction(func):
+        async def wrapped(*args, **kwargs) -> Any:
+            return await (compiled or compile_once())(*args, **kwargs)
+    else:
+        def wrapped(*args, **kwargs) -> Any:
+            return (compiled or compile_once())(*args, **kwargs)
+
+    wrapped.__validargs_compile__ = compile_once
+
+    return wrapped
+
+
+def validated(
+    func: Optional[Callable] = None,
+    *,
+    engine: str = 'interpreted',
+    threaded: bool = False,
+    sampler: Optional[Sampler] = None,
+    metrics: Union[bool, MetricsRegistry] = False,
+    hooks: Optional[Hooks] = None,
+    lazy: bool = False,
+    variadic: Optional[Dict[str, Validator]] = None,
+    returns: Optional[Validator] = None,
+    yields: Optional[Validator] = None,
+) -> Callable:
+    """ Decorates a function so that its arguments are validated by the
+    Validators assigned as default values in its signature.
+
+    Can be used both as `@validated` and `@validated(engine='codegen')`.
+
+    Methods can be decorated either directly, or by decorating their class
+    (see `validated_class`). Staticmethods and classmethods can be decorated
+    either above or below the `staticmethod`/`classmethod` decorator. The
+    decorated function is a regular function, so it is bound to instances
+    and classes natively, and its call plan is shared by all of them.
+
+    Coroutine functions are wrapped by a coroutine function, which awaits
+    the async validators of each call concurrently.
+
+    The decorated function also exposes `validate_many`, which validates many
+    sets of arguments at once without calling the function (see batch.validate_many),
+    and `validate_bulk`, which does the same on a pool of worker processes
+    (see batch.validate_bulk), and `check`, which validates the arguments of a
+    single call without raising and returns a CheckResult (see `check_arguments`).
+    If the function has async validators, `check` returns an awaitable.
+
+    Args:
+        func (Callable): The decorated function, method or class
+        engine (str): The engine that executes the call plan. One of:
+                        - 'interpreted': A generic wrapper that loops over the parameters
+                        - 'codegen': A wrapper generated specifically for the signature
+                                     of the decorated function. Falls back to 'interpreted'
+                                     for signatures that it does not support.
+                      Functions without any Validators are forwarded the arguments
+                      as they are, regardless of the engine.
+        threaded (bool): Whether to run the blocking validators of each call concurrently
+                            on a shared thread pool (see concurrency.get_thread_pool).
+                            The 'interpreted' engine is used for threaded functions.
+        sampler (Sampler): Validates only the calls chosen by the sampler (see sampling.Sampler).
+                            Use `sampling.global_sampler` to share a globally configured one.
+        metrics (MetricsRegistry): Records the calls of the function and the latency and failures
+                                    of the validation of each argument in the registry
+                                    (see metrics.MetricsRegistry). If True, the
+                                    `metrics.default_registry` is used.
+        hooks (Hooks): Callbacks fired around the validation of each argument, along with
+                        the `hooks.global_hooks`. Only the callbacks registered at decoration
+                        time are fired (see hooks.Hooks).
+        lazy (bool): Whether to defer the analysis of the signature to the first call of
+                        the function, or until it is warmed up (see `warmup`). This makes the
+                        decoration nearly free, at the cost of an extra call per call.
+                        Hooks are collected when the signature is analysed.
+        variadic (dict): The Validators of the elements of the variadic parameters, keyed
+                            by the name of the *args or **kwargs parameter. Each positional
+                            element, or the value of each keyword element, is validated.
+        returns (Validator): The Validator of the return value. For generator functions, it
+                                validates the value they return when they are exhausted.
+        yields (Validator): The Validator of each value yielded by a generator or an async
+                            generator function, as it is consumed.
+                            The outputs are validated by the same wrapper as the arguments,
+                            but not by `check`, `validate_many` and `validate_bulk`.
+
+    Returns:
+        wrapped (Callable): The decorated function
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: '{engine}'. Expected one of: {', '.join(ENGINES)}")
+
+    if func is None:
+        return functools.partial(
+            validated, engine=engine, threaded=threaded, sampler=sampler, metrics=metrics, hooks=hooks, lazy=lazy,
+            variadic=variadic, returns=returns, yields=yields,
+        )
+
+    if isinstance(func, type):
+        if variadic or returns is not None or yields is not None:
+            raise TypeError("The validators of variadic parameters and outputs cannot be assigned to a class")
+        return validated_class(
+            func, engine=engine, threaded=threaded, sampler=sampler, metrics=metrics, hooks=hooks, lazy=lazy,
+        )
+
+    if isinstance(func, (staticmethod, classmethod)):
+        # The underlying function is decorated, so that the method is bound by the
+        # staticmethod/classmethod, and then by the validated function natively
+        return type(func)(validated(
+            func.__func__, engine=engine, threaded=threaded, sampler=sampler, metrics=metrics, hooks=hooks, lazy=lazy,
+            variadic=variadic, returns=returns, yields=yields,
+        ))
+
+    compile = functools.partial(
+        compile_wrapper, func, engine, threaded, sampler, metrics, hooks, variadic, returns, yields,
+    )
+
+    if lazy:
+        wrapped = lazy_wrapper(func, compile)
+
+        def validate_many(*args, **kwargs) -> batch.BatchResult:
+            wrapped.__validargs_compile__()
+            return batch.validate_many(wrapped.__validargs_plan__, *args, **kwargs)
+
+        checker = None
+
+        def check(*args, **kwargs) -> Union[CheckResult, Awaitable[CheckResult]]:
+            nonlocal checker
+            if checker is None:
+                wrapped.__validargs_compile__()
+                checker = compile_checker(wrapped.__validargs_plan__, engine)
+            return checker(*args, **kwargs)
+
+        wrapped.validate_many = validate_many
+        wrapped.check = check
+    else:
+        wrapped, plan = compile()
+        wrapped.__validargs_plan__ = plan
+        wrapped.validate_many = functools.partial(batch.validate_many, plan)
+        wrapped.check = compile_checker(plan, engine)
+
+    functools.update_wrapper(wrapped, func)
+    wrapped.validate_bulk = functools.partial(batch.validate_bulk, wrapped)
 
     return wrapped
+
+
+def is_validated_method(value: Any) -> bool:
+    """ Checks whether a member of a class is a method with any Validators,
+    which is not decorated already.
+    """
+    if isinstance(value, (staticmethod, classmethod)):
+        value = value.__func__
+
+    if not isfunction(value) or hasattr(value, '__validargs_plan__') or hasattr(value, '__validargs_compile__'):
+        return False
+
+    defaults = (value.__defaults__ or ()) + tuple((value.__kwdefaults__ or {}).values())
+    return any(isinstance(default, Validator) for default in defaults)
+
+
+def validated_class(cls: type, **kwargs: Any) -> type:
+    """ Decorates all the public methods of a class that have any Validators,
+    in a single pass, when the class is created. Used by `validated` when it
+    decorates a class, e.g. `@validated(engine='codegen')`.
+
+    Instance methods, staticmethods and classmethods are decorated, while methods
+    that are already decorated, and the ones whose name starts with an underscore,
+    are left as they are.
+
+    Args:
+        cls (type): The decorated class
+        kwargs (Any): The arguments of `validated` for each method
+
+    Returns:
+        cls (type): The decorated class
+    """
+    for name, value in list(vars(cls).items()):
+        if not name.startswith('_') and is_validated_method(value):
+            setattr(cls, name, validated(value, **kwargs))
+
+    return cls
+
+
+def warmup(*targets: Any, background: bool = False) -> Union[List[Callable], threading.Thread]:
+    """ Analyses the signatures of lazily decorated functions ahead of their
+    first call, e.g. at a controlled point during the startup of an application.
+
+    Args:
+        targets (Any): Modules, classes, decorated functions or iterables of them.
+                        For modules and classes, all the lazily decorated functions
+                        and methods they contain are warmed up.
+        background (bool): Whether to warm up the functions in a background thread
+
+    Returns:
+        warmed_up (list): The functions that were warmed up, or the background
+                            thread that warms them up if `background` is set
+    """
+    functions = list(lazy_functions(targets))
+
+    def compile_all() -> List[Callable]:
+        for function in functions:
+            function.__validargs_compile__()
+        return functions
+
+    if background:
+        thread = threading.Thread(target=compile_all, name='validargs-warmup', daemon=True)
+        thread.start()
+        return thread
+
+    return compile_all()
+
+
+def lazy_functions(targets: Any) -> Iterator[Callable]:
+    """ Finds the lazily decorated functions in the given targets (see `warmup`).
+    Iterables are only expanded at the top level of the targets.
+    """
+    visited: Set[type] = set()
+
+    for target in targets:
+        if isinstance(target, (ModuleType, type)) or is_lazy_function(target):
+            yield from lazy_members(target, visited)
+        elif isinstance(target, Iterable) and not isinstance(target, (str, bytes)):
+            for member in target:
+                yield from lazy_members(member, visited)
+
+
+def is_lazy_function(value: Any) -> bool:
+    """ Checks whether a value is a lazily decorated function, or a staticmethod or classmethod of one """
+    if isinstance(value, (staticmethod, classmethod)):
+        value = value.__func__
+    return hasattr(value, '__validargs_compile__')
+
+
+def lazy_members(target: Any, visited: Set[type]) -> Iterator[Callable]:
+    """ Finds the lazily decorated functions in a module, a class or a function.
+    Only the classes defined in a module, and the classes nested in a class,
+    are searched, each of them once.
+    """
+    if is_lazy_function(target):
+        yield target.__func__ if isinstance(target, (staticmethod, classmethod)) else target
+    elif isinstance(target, ModuleType):
+        for value in list(vars(target).values()):
+            if is_lazy_function(value) or (isinstance(value, type) and value.__module__ == target.__name__):
+                yield from lazy_members(value, visited)
+    elif isinstance(target, type) and target not in visited:
+        visited.add(target)
+        for value in list(vars(target).values()):
+            if is_lazy_function(value) or (
+                isinstance(value, type) and value.__qualname__.startswith(f"{target.__qualname__}.")
+            ):
+                yield from lazy_members(value, visited)
@@ -0,0 +1,47 @@
+""" Element-wise validation of variadic parameters (*args and **kwargs).
+
+The elements are validated one by one, directly from the tuple of the
+positional arguments or the dict of the keyword arguments, without copying
+them, and the validation stops at the first invalid element.
+"""
+from typing import Any
+
+from validargs.exceptions import ElementValidationError
+
+
+class Elements:
+    """ Validator function of a variadic parameter, which validates each of its
+    elements with the same validator.
+
+    An invalid element raises an ElementValidationError with its index in the
+    positional arguments, or its name in the keyword arguments, caused by
+    the failure of the element's validator.
+
+    Args:
+        validator (Validator): The validator of each element
+        keyword (bool): Whether the elements are keyword arguments (**kwargs)
+    """
+
+    def __init__(self, validator: Any, keyword: bool = False):
+        if validator.is_async:
+            raise TypeError("The elements of variadic parameters cannot have async validators")
+        if validator.transform:
+            # The packed arguments are passed as they are, without copying them
+            raise TypeError("The elements of variadic parameters cannot have transforming validators")
+
+        self.validator = validator
+        self.keyword = keyword
+
+    def __call__(self, values: Any) -> None:
+        if not values:
+            return
+
+        validate = self.validator.validate
+        for index, value in values.items() if self.keyword else enumerate(values):
+            try:
+                validate(value)
+            except Exception as exc:
+                raise ElementValidationError([index]) from exc
+
+    def __repr__(self) -> str:
+        return f"Elements({self.validator!r})"
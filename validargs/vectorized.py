@@ -0,0 +1,61 @@
+""" Validators that check whole arrays in one pass using NumPy.
+
+NumPy is an optional dependency and is only imported when a vectorized
+validator is used.
+"""
+from dataclasses import dataclass
+from typing import Any, List
+
+from validargs.exceptions import ElementValidationError
+from validargs.interning import slotted
+from validargs.validargs import Validator
+
+
+def import_numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as exc:
+        raise ImportError(
+            "Vectorized validators require numpy. Install it with: pip install validargs[numpy]"
+        ) from exc
+
+    return numpy
+
+
+@slotted
+@dataclass(frozen=True)
+class VectorizedValidator(Validator):
+    """ Validator whose `validator_func` receives a NumPy array and returns a
+    boolean mask, set to True for the valid elements.
+
+    Any element that is not valid results in an ElementValidationError that
+    lists the indices of the invalid elements.
+
+    A single boolean returned by the `validator_func` applies to all the elements.
+    """
+
+    def invalid_indices(self, values: Any) -> List[Any]:
+        """ Finds the indices of the invalid elements of the given values.
+
+        Args:
+            values (Any): An array, or anything that can be converted to one
+
+        Returns:
+            indices (list): The flat indices of the invalid elements for
+                            one-dimensional arrays, or tuples of indices otherwise
+        """
+        numpy = import_numpy()
+
+        values = numpy.asarray(values)
+        mask = numpy.asarray(self.validator_func(values), dtype=bool)
+        invalid = ~numpy.broadcast_to(mask, values.shape)
+
+        if invalid.ndim <= 1:
+            return numpy.flatnonzero(invalid).tolist()
+
+        return [tuple(index) for index in numpy.argwhere(invalid).tolist()]
+
+    def validate(self, arg: Any):
+        indices = self.invalid_indices(arg)
+        if indices:
+            raise ElementValidationError(indices)